@@ -0,0 +1,4 @@
+# api/__init__.py
+"""
+Headless HTTP API package for Forza PI Calculator
+"""
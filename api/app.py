@@ -0,0 +1,281 @@
+# api/app.py
+"""
+HTTP API routes for Forza PI Calculator
+PI, class, similar-car, real-world and VIN endpoints over the shared utils caches
+"""
+
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+import numpy as np
+from config.settings import API_CONFIG, SIMILAR_CARS_CONFIG
+from api.http import HTTPError, Request, Response, Router, StreamingResponse, dump_json
+from utils.data_manager import get_car_catalog, get_similar_cars, get_similar_cars_by_specs
+from utils.pi_calculator import (
+    PI_INPUTS, PIBatchBuffers, breakdown_batch, classify_pi_batch, determine_forza_class,
+    evaluate_pi, get_class_pi_range, validate_input_ranges
+)
+from utils.real_world_data import (
+    RealWorldVehicle, calculate_enhanced_pi, find_real_world_vehicle, find_real_world_vehicles_by_pi,
+    get_real_world_manager
+)
+from utils.similarity import FEATURES
+from utils.vin_decoder import AsyncVINDecoder, VINDecoder
+
+def _number(values: Dict[str, Any], name: str, default: Optional[float] = None) -> float:
+    value = values.get(name, default)
+    if value is None:
+        raise HTTPError(400, f"Missing '{name}'")
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise HTTPError(400, f"'{name}' must be a number")
+    if not math.isfinite(number):
+        raise HTTPError(400, f"'{name}' must be a finite number")
+    return number
+
+def _count(values: Dict[str, Any], default: int) -> int:
+    count = int(_number(values, "count", default))
+    if count < 1:
+        raise HTTPError(400, "'count' must be at least 1")
+    return min(count, API_CONFIG["max_results"])
+
+def _names(values: Dict[str, Any], name: str, allow_list: bool = True) -> Optional[Union[str, List[str]]]:
+    """Optional class/type filter: a string, or a list of strings where allowed"""
+    value = values.get(name)
+    if value is None or isinstance(value, str):
+        return value
+    if allow_list and isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return value
+    raise HTTPError(400, f"'{name}' must be a string" + (" or a list of strings" if allow_list else ""))
+
+def _evaluation(values: Dict[str, Any]) -> Dict[str, Any]:
+    inputs = [_number(values, name) for name in PI_INPUTS]
+    evaluation = evaluate_pi(*inputs)
+    return {
+        "pi": evaluation.pi,
+        "class": evaluation.forza_class,
+        "breakdown": dict(evaluation.breakdown),
+        "warnings": validate_input_ranges(*inputs),
+    }
+
+def _batch_columns(data: Any) -> Dict[str, np.ndarray]:
+    """Columns from {"specs": [{...}, ...]} or {"columns": {"hp": [...], ...}}"""
+    if not isinstance(data, dict) or ("specs" in data) == ("columns" in data):
+        raise HTTPError(400, 'Send either "specs" (list of objects) or "columns" (object of lists)')
+    try:
+        if "specs" in data:
+            specs = data["specs"]
+            columns = {name: np.array([spec[name] for spec in specs], dtype=np.float64) for name in PI_INPUTS}
+        else:
+            columns = {name: np.asarray(data["columns"][name], dtype=np.float64) for name in PI_INPUTS}
+    except (KeyError, TypeError, ValueError) as e:
+        raise HTTPError(400, f"Every row needs numeric {', '.join(PI_INPUTS)}: {e}")
+
+    if any(column.ndim != 1 for column in columns.values()):
+        raise HTTPError(400, f"Every row needs a single number for each of {', '.join(PI_INPUTS)}")
+    if not all(np.isfinite(column).all() for column in columns.values()):
+        raise HTTPError(400, "Every value must be a finite number")
+
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) != 1:
+        raise HTTPError(400, "Columns must have equal length")
+    if lengths.pop() > API_CONFIG["max_batch_size"]:
+        raise HTTPError(413, f"Batches are limited to {API_CONFIG['max_batch_size']} rows")
+    return columns
+
+def _vehicle_payload(vehicle: Optional[RealWorldVehicle]) -> Optional[Dict[str, Any]]:
+    return vehicle.to_dict() if vehicle is not None else None
+
+class ForzaAPI:
+    """Route handlers plus the shared clients they use
+
+    Cheap work (memoized PI, table classification, index lookups) runs on
+    the event loop. VIN decodes go through AsyncVINDecoder and real-world
+    matching through a small thread pool, so slow upstreams never block
+    other requests.
+    """
+
+    def __init__(self):
+        self.router = Router()
+        self.executor = ThreadPoolExecutor(max_workers=API_CONFIG["blocking_workers"],
+                                           thread_name_prefix="api-blocking")
+        self._vin_decoder: Optional[AsyncVINDecoder] = None
+
+        route = self.router.route
+        route("GET", "/health")(self.health)
+        route("GET", "/pi")(self.pi)
+        route("POST", "/pi")(self.pi)
+        route("POST", "/pi/batch")(self.pi_batch)
+        route("GET", "/class")(self.forza_class)
+        route("POST", "/class/batch")(self.class_batch)
+        route("GET", "/similar")(self.similar)
+        route("POST", "/similar")(self.similar)
+        route("GET", "/real-world")(self.real_world)
+        route("GET", "/vin/{vin}")(self.vin)
+        route("POST", "/vin/batch")(self.vin_batch)
+
+    @property
+    def vin_decoder(self) -> AsyncVINDecoder:
+        # Created on first use so its asyncio primitives belong to the serving loop
+        if self._vin_decoder is None:
+            self._vin_decoder = AsyncVINDecoder()
+        return self._vin_decoder
+
+    def warm_up(self):
+        """Load every shared cache before the first request arrives"""
+        catalog = get_car_catalog()
+        catalog.nearest(500, "A", 1)
+        catalog.similar_by_specs(500, 300, 3000, 1)
+        manager = get_real_world_manager()
+        manager.find_vehicles_by_pi(500, limit=1)
+        VINDecoder.get_cache()
+        VINDecoder.get_session()
+        print(f"API caches warm: {len(catalog.cars)} Forza cars, "
+              f"{len(manager.vehicles_database)} real-world vehicles")
+
+    def close(self):
+        if self._vin_decoder is not None:
+            self._vin_decoder.close()
+        self.executor.shutdown(wait=False)
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def health(self, request: Request) -> Response:
+        return Response.json({"status": "ok"})
+
+    async def pi(self, request: Request) -> Response:
+        """PI, class and breakdown for one set of specs (query string or JSON body)"""
+        return Response.json(_evaluation(request.values()))
+
+    async def pi_batch(self, request: Request) -> StreamingResponse:
+        """Score many specs, streaming one NDJSON line per row in input order"""
+        columns = _batch_columns(request.json())
+        return StreamingResponse(self._stream_batch(columns))
+
+    async def _stream_batch(self, columns: Dict[str, np.ndarray]) -> AsyncIterator[bytes]:
+        rows = len(columns["hp"])
+        chunk_size = API_CONFIG["batch_chunk_size"]
+        buffers = PIBatchBuffers(min(rows, chunk_size))
+        for start in range(0, rows, chunk_size):
+            chunk = {name: column[start:start + chunk_size] for name, column in columns.items()}
+            result = breakdown_batch(chunk, out=buffers)
+            pis, classes = result["pi"].tolist(), result["class"].tolist()
+            components = {name: result[name].tolist() for name in result if name not in ("pi", "class")}
+            lines = [
+                dump_json({"index": start + i, "pi": pis[i], "class": classes[i],
+                           "breakdown": {name: values[i] for name, values in components.items()}})
+                for i in range(len(pis))
+            ]
+            yield b"\n".join(lines) + b"\n"
+
+    async def forza_class(self, request: Request) -> Response:
+        pi = _number(request.query, "pi")
+        forza_class = determine_forza_class(pi)
+        return Response.json({"pi": int(pi) if pi.is_integer() else pi, "class": forza_class,
+                              "range": list(get_class_pi_range(forza_class))})
+
+    async def class_batch(self, request: Request) -> Response:
+        data = request.json()
+        pis = data.get("pi") if isinstance(data, dict) else None
+        if not isinstance(pis, list):
+            raise HTTPError(400, 'Send {"pi": [...]}')
+        if len(pis) > API_CONFIG["max_batch_size"]:
+            raise HTTPError(413, f"Batches are limited to {API_CONFIG['max_batch_size']} rows")
+        try:
+            values = np.asarray(pis, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise HTTPError(400, "Every PI must be a number")
+        if values.ndim != 1 or not np.isfinite(values).all():
+            raise HTTPError(400, "Every PI must be a finite number")
+        return Response.json({"classes": classify_pi_batch(values).tolist()})
+
+    async def similar(self, request: Request) -> Response:
+        """
+        Similar Forza cars
+
+        With only pi (and optionally class) cars are ranked by PI distance;
+        adding hp and weight ranks by specs, with optional w_<feature>
+        weights and class/type filters.
+        """
+        values = request.values()
+        pi = _number(values, "pi")
+
+        if "hp" in values or "weight" in values:
+            weights = {name: _number(values, f"w_{name}") for name in FEATURES if f"w_{name}" in values}
+            try:
+                cars = get_similar_cars_by_specs(pi, _number(values, "hp"), _number(values, "weight"),
+                                                 _count(values, SIMILAR_CARS_CONFIG["default_count"]),
+                                                 weights, _names(values, "class"), _names(values, "type"))
+            except ValueError as e:
+                raise HTTPError(400, str(e))
+        else:
+            forza_class = _names(values, "class", allow_list=False)
+            cars = get_similar_cars(int(round(pi)), forza_class or determine_forza_class(pi),
+                                    _count(values, SIMILAR_CARS_CONFIG["default_count"]))
+        return Response.json({"cars": cars})
+
+    async def real_world(self, request: Request) -> Response:
+        """Real-world vehicles near a Forza PI or within a class"""
+        values = request.query
+        target = _number(values, "pi") if "pi" in values else None
+        filters = {name: values[name] for name in ("drivetrain", "body_style") if name in values}
+        for name in ("min_year", "max_year"):
+            if name in values:
+                filters[name] = int(_number(values, name))
+        try:
+            vehicles = await self._run(lambda: find_real_world_vehicles_by_pi(
+                target, values.get("class"), limit=_count(values, 10), **filters))
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        return Response.json({"vehicles": [_vehicle_payload(vehicle) for vehicle in vehicles]})
+
+    async def _lookup_vin(self, vin: str) -> Dict[str, Any]:
+        vehicle_info = await self.vin_decoder.decode_vin(vin)
+        payload = {"vin": vehicle_info.vin, "vehicle": vehicle_info.to_dict(include_raw=False),
+                   "real_world": None, "enhanced_pi": None, "confidence": None}
+
+        if vehicle_info.is_valid and vehicle_info.year and vehicle_info.make and vehicle_info.model:
+            try:
+                year = int(vehicle_info.year)
+            except ValueError:
+                return payload
+            vehicle = await self._run(find_real_world_vehicle, year, vehicle_info.make,
+                                      vehicle_info.model, vehicle_info.trim)
+            if vehicle is not None:
+                payload["real_world"] = _vehicle_payload(vehicle)
+                payload["enhanced_pi"], payload["confidence"] = await self._run(calculate_enhanced_pi, vehicle)
+        return payload
+
+    async def vin(self, request: Request) -> Response:
+        """Decode a VIN, match real-world data and calculate enhanced PI"""
+        vin = request.params["vin"]
+        is_valid, error = VINDecoder.validate_vin(vin)
+        if not is_valid:
+            raise HTTPError(400, error)
+        return Response.json(await self._lookup_vin(vin))
+
+    async def vin_batch(self, request: Request) -> StreamingResponse:
+        """Look up many VINs concurrently, streaming NDJSON lines as each completes"""
+        data = request.json()
+        vins = data.get("vins") if isinstance(data, dict) else None
+        if not isinstance(vins, list) or not all(isinstance(vin, str) for vin in vins):
+            raise HTTPError(400, 'Send {"vins": ["...", ...]}')
+        if len(vins) > API_CONFIG["max_vin_batch_size"]:
+            raise HTTPError(413, f"VIN batches are limited to {API_CONFIG['max_vin_batch_size']}")
+        return StreamingResponse(self._stream_vins(vins))
+
+    async def _stream_vins(self, vins: List[str]) -> AsyncIterator[bytes]:
+        async def indexed(index: int, vin: str) -> Tuple[int, Dict[str, Any]]:
+            return index, await self._lookup_vin(vin)
+
+        tasks = [asyncio.ensure_future(indexed(index, vin)) for index, vin in enumerate(vins)]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                index, payload = await finished
+                yield dump_json({"index": index, **payload}) + b"\n"
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,254 @@
+# api/http.py
+"""
+Minimal asyncio HTTP/1.1 server for the Forza PI API
+Keep-alive connections, routing, JSON responses and chunked streaming, standard library only
+"""
+
+import asyncio
+import json
+import traceback
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple, Union
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+class HTTPError(Exception):
+    """Raised by handlers to return an error status with a JSON message"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+@dataclass(slots=True)
+class Request:
+    """One parsed HTTP request"""
+    method: str
+    path: str
+    query: Dict[str, str]
+    headers: Dict[str, str]
+    body: bytes = b""
+    # Values captured by {name} segments of the matched route
+    params: Dict[str, str] = field(default_factory=dict)
+
+    def json(self) -> Any:
+        """Decoded JSON body, {} when empty"""
+        if not self.body:
+            return {}
+        try:
+            return json.loads(self.body)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise HTTPError(400, f"Invalid JSON body: {e}")
+
+    def values(self) -> Dict[str, Any]:
+        """Query parameters overlaid with a JSON object body"""
+        data = self.json()
+        if not isinstance(data, dict):
+            raise HTTPError(400, "JSON body must be an object")
+        return {**self.query, **data}
+
+@dataclass(slots=True)
+class Response:
+    """A complete response body"""
+    body: bytes = b""
+    status: int = 200
+    content_type: str = "application/json"
+
+    @classmethod
+    def json(cls, data: Any, status: int = 200) -> "Response":
+        return cls(dump_json(data), status)
+
+@dataclass(slots=True)
+class StreamingResponse:
+    """A response sent with chunked transfer encoding as chunks are produced"""
+    chunks: AsyncIterator[bytes]
+    status: int = 200
+    content_type: str = "application/x-ndjson"
+
+Handler = Callable[[Request], Awaitable[Union[Response, StreamingResponse]]]
+
+def dump_json(data: Any) -> bytes:
+    # NaN/Infinity are not JSON; fail loudly rather than send a body clients cannot parse
+    return json.dumps(data, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+class Router:
+    """Method + path routing; a {name} segment matches any one path segment"""
+
+    def __init__(self):
+        self._exact: Dict[str, Dict[str, Handler]] = {}
+        self._patterns: List[Tuple[List[str], Dict[str, Handler]]] = []
+
+    def route(self, method: str, pattern: str) -> Callable[[Handler], Handler]:
+        def register(handler: Handler) -> Handler:
+            if "{" in pattern:
+                segments = pattern.strip("/").split("/")
+                for existing, methods in self._patterns:
+                    if existing == segments:
+                        methods[method] = handler
+                        break
+                else:
+                    self._patterns.append((segments, {method: handler}))
+            else:
+                self._exact.setdefault(pattern, {})[method] = handler
+            return handler
+        return register
+
+    def resolve(self, method: str, path: str) -> Tuple[Handler, Dict[str, str]]:
+        """Find the handler for a request, raising 404 or 405"""
+        methods, params = self._exact.get(path), {}
+        if methods is None:
+            segments = path.strip("/").split("/")
+            for pattern, candidate in self._patterns:
+                if len(pattern) == len(segments) and all(
+                        p.startswith("{") or p == s for p, s in zip(pattern, segments)):
+                    methods = candidate
+                    params = {p[1:-1]: unquote(s) for p, s in zip(pattern, segments) if p.startswith("{")}
+                    break
+        if methods is None:
+            raise HTTPError(404, f"No route for {path}")
+        handler = methods.get(method) or (methods.get("GET") if method == "HEAD" else None)
+        if handler is None:
+            raise HTTPError(405, f"{method} not allowed on {path}")
+        return handler, params
+
+class HTTPServer:
+    """
+    Serve a Router over asyncio streams
+
+    Connections are kept alive (HTTP/1.1 default) and requests on one
+    connection are handled in order, so pipelined clients work. Handlers
+    run on the event loop; anything blocking must be awaited off-loop.
+    """
+
+    def __init__(self, router: Router, keepalive_timeout: float = 15, max_header_bytes: int = 16384,
+                 max_body_bytes: int = 8 * 1024 * 1024):
+        self.router = router
+        self.keepalive_timeout = keepalive_timeout
+        self.max_header_bytes = max_header_bytes
+        self.max_body_bytes = max_body_bytes
+
+    async def start(self, host: str, port: int, reuse_port: bool = False) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_connection, host, port, reuse_port=reuse_port or None,
+                                          limit=self.max_header_bytes, backlog=1024)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keepalive_timeout)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send(writer, self._error(431, "Request headers too large"), keep_alive=False)
+                    break
+
+                try:
+                    request, version, keep_alive = self._parse_head(head)
+                    length = int(request.headers.get("content-length", "0") or 0)
+                    if length < 0 or length > self.max_body_bytes:
+                        raise HTTPError(413, f"Request body over {self.max_body_bytes} bytes")
+                    if "chunked" in request.headers.get("transfer-encoding", "").lower():
+                        raise HTTPError(411, "Send a Content-Length body; chunked request bodies are not supported")
+                except (HTTPError, ValueError) as e:
+                    error = e if isinstance(e, HTTPError) else HTTPError(400, f"Malformed request: {e}")
+                    await self._send(writer, self._error(error.status, error.message), keep_alive=False)
+                    break
+
+                if length:
+                    try:
+                        request.body = await reader.readexactly(length)
+                    except (asyncio.IncompleteReadError, ConnectionError):
+                        break
+
+                response = await self._dispatch(request)
+                if not await self._send(writer, response, keep_alive, version, head_only=request.method == "HEAD"):
+                    break
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    @staticmethod
+    def _parse_head(head: bytes) -> Tuple[Request, str, bool]:
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, version = lines[0].split(" ")
+        if not version.startswith("HTTP/1."):
+            raise HTTPError(505, f"Unsupported protocol {version}")
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        url = urlsplit(target)
+        request = Request(method.upper(), unquote(url.path) or "/", dict(parse_qsl(url.query)), headers)
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        return request, version, keep_alive
+
+    async def _dispatch(self, request: Request) -> Union[Response, StreamingResponse]:
+        try:
+            handler, request.params = self.router.resolve(request.method, request.path)
+            return await handler(request)
+        except HTTPError as e:
+            return self._error(e.status, e.message)
+        except Exception as e:
+            traceback.print_exc()
+            return self._error(500, f"Internal error: {e}")
+
+    @staticmethod
+    def _error(status: int, message: str) -> Response:
+        return Response.json({"error": message, "status": status}, status)
+
+    @staticmethod
+    def _status_line(status: int) -> str:
+        try:
+            reason = HTTPStatus(status).phrase
+        except ValueError:
+            reason = ""
+        return f"HTTP/1.1 {status} {reason}\r\n"
+
+    async def _send(self, writer: asyncio.StreamWriter, response: Union[Response, StreamingResponse],
+                    keep_alive: bool, version: str = "HTTP/1.1", head_only: bool = False) -> bool:
+        """Write a response, returns False if the connection must be closed"""
+        connection = "keep-alive" if keep_alive else "close"
+        try:
+            if isinstance(response, Response):
+                writer.write(f"{self._status_line(response.status)}Content-Type: {response.content_type}\r\n"
+                             f"Content-Length: {len(response.body)}\r\nConnection: {connection}\r\n\r\n"
+                             .encode("latin-1") + (b"" if head_only else response.body))
+                await writer.drain()
+                return True
+
+            # HTTP/1.0 has no chunked encoding: stream raw and close to end the body
+            chunked = version == "HTTP/1.1"
+            framing = "Transfer-Encoding: chunked" if chunked else "Connection: close"
+            head = f"{self._status_line(response.status)}Content-Type: {response.content_type}\r\n{framing}\r\n"
+            if chunked:
+                head += f"Connection: {connection}\r\n"
+            writer.write((head + "\r\n").encode("latin-1"))
+            if head_only:
+                await response.chunks.aclose()
+                if chunked:
+                    writer.write(b"0\r\n\r\n")
+                await writer.drain()
+                return chunked
+            try:
+                async for chunk in response.chunks:
+                    if chunk:
+                        writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk) if chunked else chunk)
+                        await writer.drain()
+            except Exception:
+                # Headers are gone already; drop the connection so the client sees a truncated body
+                traceback.print_exc()
+                return False
+            if chunked:
+                writer.write(b"0\r\n\r\n")
+                await writer.drain()
+            return chunked
+        except (ConnectionError, OSError):
+            return False
@@ -0,0 +1,73 @@
+# api/server.py
+"""
+Process management for the Forza PI API server
+Runs one event loop per worker process, all sharing the listening port
+"""
+
+import asyncio
+import multiprocessing
+import signal
+import socket
+from typing import Optional
+from config.settings import API_CONFIG
+from api.app import ForzaAPI
+from api.http import HTTPServer
+
+async def serve(host: str, port: int, reuse_port: bool = False):
+    """Warm the caches and serve until cancelled"""
+    api = ForzaAPI()
+    api.warm_up()
+    server = HTTPServer(api.router, keepalive_timeout=API_CONFIG["keepalive_timeout"],
+                        max_header_bytes=API_CONFIG["max_header_bytes"],
+                        max_body_bytes=API_CONFIG["max_body_bytes"])
+    listener = await server.start(host, port, reuse_port=reuse_port)
+    print(f"Forza PI API listening on http://{host}:{port}")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        api.close()
+
+def _worker(host: str, port: int):
+    # The parent handles Ctrl+C and terminates the workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        asyncio.run(serve(host, port, reuse_port=True))
+    except asyncio.CancelledError:
+        pass
+
+def run(host: Optional[str] = None, port: Optional[int] = None, workers: Optional[int] = None):
+    """
+    Run the API server in the foreground
+
+    With workers > 1, each worker process runs its own event loop and warm
+    caches on a SO_REUSEPORT socket, so the kernel spreads connections
+    across CPU cores.
+    """
+    host = host or API_CONFIG["host"]
+    port = port or API_CONFIG["port"]
+    workers = workers or API_CONFIG["workers"]
+
+    if workers <= 1:
+        try:
+            asyncio.run(serve(host, port))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    if not hasattr(socket, "SO_REUSEPORT"):
+        print("Warning: SO_REUSEPORT is not available on this platform, running a single worker.")
+        return run(host, port, 1)
+
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=_worker, args=(host, port), daemon=True) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
@@ -0,0 +1,35 @@
+# api_server.py
+"""
+Headless HTTP API for Forza PI Calculator
+
+Endpoints (JSON; batch endpoints stream NDJSON):
+    GET  /health
+    GET  /pi?hp=&weight=&top_speed=&acceleration=&handling=&braking=   (or POST a JSON object)
+    POST /pi/batch          {"specs": [{...}, ...]} or {"columns": {"hp": [...], ...}}
+    GET  /class?pi=
+    POST /class/batch       {"pi": [...]}
+    GET  /similar?pi=[&class=&count=]            PI-ranked similar cars
+    GET  /similar?pi=&hp=&weight=[&type=&w_pi=]  spec-ranked similar cars
+    GET  /real-world?pi=|class=[&drivetrain=&body_style=&min_year=&max_year=&count=]
+    GET  /vin/<vin>
+    POST /vin/batch         {"vins": [...]}
+
+Run from the project root:
+    python api_server.py [--host 127.0.0.1 --port 8080 --workers 4]
+"""
+
+import argparse
+from config.settings import API_CONFIG
+from api.server import run
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=API_CONFIG["host"])
+    parser.add_argument("--port", type=int, default=API_CONFIG["port"])
+    parser.add_argument("--workers", type=int, default=API_CONFIG["workers"],
+                        help="Worker processes sharing the port")
+    args = parser.parse_args()
+    run(args.host, args.port, args.workers)
+
+if __name__ == "__main__":
+    main()
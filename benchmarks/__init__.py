@@ -0,0 +1,4 @@
+# benchmarks/__init__.py
+"""
+Standalone performance benchmarks for Forza PI Calculator
+"""
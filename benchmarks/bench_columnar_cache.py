@@ -0,0 +1,104 @@
+# benchmarks/bench_columnar_cache.py
+"""
+Benchmark for the real-world vehicle cache formats
+Compares JSON and columnar cache load time, first lookup and resident memory
+
+Each measurement runs in a fresh interpreter so RSS reflects only that load.
+Run from the project root:
+    python -m benchmarks.bench_columnar_cache [--rows 10000 100000]
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_fuzzy_match import make_synthetic_vehicles
+from utils.columnar_cache import ColumnarFile, ColumnarRows
+from utils.real_world_data import RealWorldDataManager, RealWorldVehicle, VehicleIndex
+
+def _rss_mb() -> float:
+    """Current resident set size in MB (peak RSS where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def write_caches(directory: str, rows: int):
+    rng = random.Random(3)
+    vehicles = [
+        RealWorldVehicle(
+            year=vehicle.year, make=vehicle.make, model=vehicle.model, trim=rng.choice(["Base", "Sport", None]),
+            horsepower=float(rng.randint(100, 900)), torque_lbft=float(rng.randint(100, 700)),
+            weight_lbs=float(rng.randint(2200, 5500)), top_speed_mph=float(rng.randint(110, 220)),
+            acceleration_0_60=round(rng.uniform(2.5, 9.5), 1), drivetrain=rng.choice(["FWD", "RWD", "AWD"]),
+            body_style=rng.choice(["Coupe", "Sedan", "SUV", "Hatchback"]),
+            data_source="google_sheets", last_updated="2026-01-01T00:00:00"
+        )
+        for vehicle in make_synthetic_vehicles(rows)
+    ]
+    manager = RealWorldDataManager(directory)
+    manager._save_cached_data(vehicles)
+    manager.vehicles_database = vehicles
+    manager.export_json()
+    return vehicles[rows // 2]
+
+def measure(directory: str, fmt: str, year: int, make: str, model: str):
+    """Child process: load one format and report timings and RSS"""
+    baseline = _rss_mb()
+    start = time.perf_counter()
+    if fmt == "json":
+        vehicles, _ = RealWorldDataManager._read_json(os.path.join(directory, "real_world_data.json"))
+    else:
+        vehicles = ColumnarRows(ColumnarFile(os.path.join(directory, "real_world_data.bin")), RealWorldVehicle)
+    # Same indexing the manager does: eager for lists, on first lookup for columnar rows
+    index = VehicleIndex(vehicles, lazy=fmt != "json")
+    load_ms = (time.perf_counter() - start) * 1000
+    load_rss = _rss_mb() - baseline
+
+    start = time.perf_counter()
+    positions = index.positions(VehicleIndex.key(make, model), year, year)
+    found = vehicles[positions[0]] if positions else None
+    first_lookup_ms = (time.perf_counter() - start) * 1000
+    print(json.dumps({"load_ms": load_ms, "first_lookup_ms": first_lookup_ms, "load_rss_mb": load_rss,
+                      "rss_mb": _rss_mb() - baseline, "found": found is not None}))
+
+def run(rows: int):
+    with tempfile.TemporaryDirectory() as directory:
+        probe = write_caches(directory, rows)
+        size_json = os.path.getsize(os.path.join(directory, "real_world_data.json")) / 1e6
+        size_bin = os.path.getsize(os.path.join(directory, "real_world_data.bin")) / 1e6
+        for fmt, size in (("json", size_json), ("columnar", size_bin)):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_columnar_cache", "--child", fmt, directory,
+                 str(probe.year), probe.make, probe.model],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"rows={rows} format={fmt:<8} file={size:.1f} MB load={result['load_ms']:.1f} ms "
+                  f"first_lookup={result['first_lookup_ms']:.1f} ms rss_after_load=+{result['load_rss_mb']:.1f} MB "
+                  f"rss_after_lookup=+{result['rss_mb']:.1f} MB "
+                  f"found={result['found']}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--child", nargs=5, metavar=("FORMAT", "DIR", "YEAR", "MAKE", "MODEL"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        fmt, directory, year, make, model = args.child
+        measure(directory, fmt, int(year), make, model)
+        return
+    for rows in args.rows:
+        run(rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_fuzzy_match.py
+"""
+Benchmark for fuzzy real-world vehicle matching
+Measures FuzzyVehicleMatcher build time and per-query latency on synthetic data,
+after checking known queries match (or do not match) the expected vehicles
+
+Run from the project root:
+    python -m benchmarks.bench_fuzzy_match [--rows 50000]
+"""
+
+import argparse
+import random
+import string
+import time
+from typing import List, Optional, Tuple
+
+from config.settings import FUZZY_MATCH_CONFIG
+from utils.real_world_data import FuzzyVehicleMatcher, RealWorldVehicle
+
+MAKES = ["Mercedes-AMG", "BMW", "Audi", "Porsche", "Chevrolet", "Ford", "Honda", "Toyota",
+         "Nissan", "Volkswagen", "Subaru", "Mazda", "Hyundai", "Kia", "Lexus", "Cadillac"]
+QUERY_MAKES = ["MERCEDES-BENZ", "BMW", "AUDI", "PORSCHE", "CHEVROLET", "FORD", "HONDA", "TOYOTA",
+               "NISSAN", "VW", "SUBARU", "MAZDA", "HYUNDAI", "KIA", "LEXUS", "CADILLAC"]
+
+def _random_model(rng: random.Random) -> str:
+    letters = "".join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(1, 3)))
+    return f"{letters}{rng.randint(1, 999)} {rng.choice(['', 'S', 'GT', 'Sport', 'Type R', 'Competition'])}".strip()
+
+def make_synthetic_vehicles(rows: int, seed: int = 42) -> List[RealWorldVehicle]:
+    rng = random.Random(seed)
+    models = {make: [_random_model(rng) for _ in range(rows // (len(MAKES) * 8) + 1)] for make in MAKES}
+    return [
+        RealWorldVehicle(year=rng.randint(1990, 2025), make=make, model=rng.choice(models[make]))
+        for make in (rng.choice(MAKES) for _ in range(rows))
+    ]
+
+REFERENCE_VEHICLES = [
+    RealWorldVehicle(year=2023, make="BMW", model="X3 M"),
+    RealWorldVehicle(year=2023, make="BMW", model="M5"),
+    RealWorldVehicle(year=2022, make="Audi", model="A8"),
+    RealWorldVehicle(year=2023, make="Mercedes-AMG", model="E63 S"),
+    RealWorldVehicle(year=2022, make="Chevrolet", model="Corvette Stingray"),
+]
+
+# (year, make, model) -> expected model, or None when nothing should match
+EXPECTED_MATCHES: List[Tuple[Tuple[int, str, str], Optional[str]]] = [
+    ((2023, "BMW", "X5"), None),
+    ((2023, "BMW", "M340i"), None),
+    ((2022, "AUDI", "A4"), None),
+    ((2023, "MERCEDES-BENZ", "E-Class"), "E63 S"),
+    ((2021, "CHEVY", "Corvette"), "Corvette Stingray"),
+    ((2023, "BMW", "X3"), "X3 M"),
+]
+
+def check_matches():
+    """Known queries must resolve like find_best_match would, or the run stops"""
+    matcher = FuzzyVehicleMatcher(REFERENCE_VEHICLES)
+    for (year, make, model), expected in EXPECTED_MATCHES:
+        candidates = matcher.match(make, model, year, top_k=1)
+        best = None
+        if candidates and candidates[0][1] >= FUZZY_MATCH_CONFIG["min_score"]:
+            best = REFERENCE_VEHICLES[candidates[0][0]].model
+        assert best == expected, f"{year} {make} {model}: expected {expected}, matched {best}"
+    print(f"{len(EXPECTED_MATCHES)} reference queries matched as expected")
+
+def run(rows: int, queries: int):
+    check_matches()
+    vehicles = make_synthetic_vehicles(rows)
+    start = time.perf_counter()
+    matcher = FuzzyVehicleMatcher(vehicles)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    rng = random.Random(7)
+    workload = []
+    for _ in range(queries):
+        vehicle = rng.choice(vehicles)
+        query_make = QUERY_MAKES[MAKES.index(vehicle.make)]
+        query_model = vehicle.model.upper().replace(" ", "-")[:rng.randint(2, len(vehicle.model))]
+        workload.append((query_make, query_model, vehicle.year + rng.randint(-2, 2)))
+
+    start = time.perf_counter()
+    for make, model, year in workload:
+        matcher.match(make, model, year)
+    per_query_us = (time.perf_counter() - start) / queries * 1e6
+
+    print(f"rows={rows} build={build_ms:.0f} ms query={per_query_us:.0f} us/query")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    args = parser.parse_args()
+    run(args.rows, args.queries)
+
+if __name__ == "__main__":
+    main()
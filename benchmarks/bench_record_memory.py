@@ -0,0 +1,106 @@
+# benchmarks/bench_record_memory.py
+"""
+Memory benchmark for RealWorldVehicle and VehicleInfo records
+Bytes per object for the previous __dict__ dataclasses versus the slotted ones
+
+VehicleInfo is measured with a synthetic NHTSA decodevin response of
+140 result dicts, kept in full (previous behaviour), compressed, or dropped
+(the default).
+
+Run from the project root:
+    python -m benchmarks.bench_record_memory [--count 20000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+from typing import Callable, List
+
+from config.settings import VIN_DECODE_CONFIG
+from utils.real_world_data import FrozenRealWorldVehicle, RealWorldVehicle
+from utils.vin_decoder import VINDecoder, VehicleInfo
+
+def _dict_dataclass(cls: type) -> type:
+    """The same fields as cls, laid out the way they were before slots"""
+    spec = [(f.name, f.type, field(default=f.default) if f.default is not MISSING else field())
+            for f in fields(cls)]
+    return make_dataclass(f"Dict{cls.__name__}", spec)
+
+def _nhtsa_response(index: int) -> dict:
+    return {
+        "Count": 140,
+        "Message": "Results returned successfully",
+        "SearchCriteria": f"VIN:1HGCM82633A{index:06d}",
+        "Results": [
+            {"Value": "HONDA" if variable == 26 else (str(index % 97) if variable % 3 else None),
+             "ValueId": str(variable * 7) if variable % 2 else "",
+             "Variable": "Make" if variable == 26 else f"Variable {variable}",
+             "VariableId": variable}
+            for variable in range(1, 141)
+        ],
+    }
+
+def bytes_per_object(build: Callable[[object], object], inputs: List[object]) -> float:
+    """Memory still held after building one object per input, divided by the count"""
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(value) for value in inputs]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / len(inputs)
+
+def _vehicle_kwargs(index: int) -> dict:
+    return dict(year=1990 + index % 35, make="Chevrolet", model=f"Model {index % 500}", trim="LT",
+                horsepower=300.0 + index % 400, torque_lbft=280.0, weight_lbs=3300.0 + index % 900,
+                top_speed_mph=170.0, acceleration_0_60=4.2, drivetrain="RWD", body_style="Coupe",
+                data_source="google_sheets", last_updated="2026-01-01T00:00:00")
+
+def run(count: int):
+    DictVehicle = _dict_dataclass(RealWorldVehicle)
+    DictVehicleInfo = _dict_dataclass(VehicleInfo)
+    # Field values are built up front so only the records themselves are measured;
+    # responses stay JSON text so each decode parses, and possibly keeps, its own copy
+    vehicle_inputs = [_vehicle_kwargs(index) for index in range(count)]
+    response_inputs = [json.dumps(_nhtsa_response(index)) for index in range(count)]
+    saved = dict(VIN_DECODE_CONFIG)
+
+    def decode(keep: bool, compress: bool) -> Callable[[str], VehicleInfo]:
+        def build(body: str) -> VehicleInfo:
+            VIN_DECODE_CONFIG["keep_raw_data"], VIN_DECODE_CONFIG["compress_raw_data"] = keep, compress
+            return VINDecoder.parse_decode_response(json.loads(body))
+        return build
+
+    def legacy_decode(body: str):
+        # Previous behaviour: __dict__ instance holding the full parsed response
+        data = json.loads(body)
+        VIN_DECODE_CONFIG["keep_raw_data"] = False
+        vehicle_info = VINDecoder.parse_decode_response(data)
+        values = {f.name: getattr(vehicle_info, f.name) for f in fields(VehicleInfo)}
+        values["raw_data"] = data
+        return DictVehicleInfo(**values)
+
+    cases = [
+        ("RealWorldVehicle  __dict__ (before)", lambda kwargs: DictVehicle(**kwargs), vehicle_inputs),
+        ("RealWorldVehicle  slots", lambda kwargs: RealWorldVehicle(**kwargs), vehicle_inputs),
+        ("RealWorldVehicle  frozen slots", lambda kwargs: FrozenRealWorldVehicle(**kwargs), vehicle_inputs),
+        ("VehicleInfo       __dict__ + raw_data (before)", legacy_decode, response_inputs),
+        ("VehicleInfo       slots + compressed raw_data", decode(True, True), response_inputs),
+        ("VehicleInfo       slots, raw_data dropped", decode(False, False), response_inputs),
+    ]
+    try:
+        for label, build, inputs in cases:
+            print(f"{label:<48} {bytes_per_object(build, inputs):>9,.0f} bytes/object")
+    finally:
+        VIN_DECODE_CONFIG.update(saved)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+    run(args.count)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# benchmarks/bench_similar_cars.py
+"""
+Benchmark for similar-car search
+Compares the original scan-and-sort lookup with the NearestPIIndex engine
+
+Run from the project root:
+    python -m benchmarks.bench_similar_cars [--sizes 100 10000 1000000]
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from config.settings import SIMILAR_CARS_CONFIG
+from utils.pi_calculator import determine_forza_class
+from utils.pi_search import NearestPIIndex, merge_indexes
+
+CLASSES = ["D", "C", "B", "A", "S1", "S2", "X"]
+
+def make_synthetic_cars(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate cars with a roughly FH5-shaped PI distribution"""
+    rng = random.Random(seed)
+    cars = []
+    for i in range(count):
+        pi = max(100, min(999, int(rng.gauss(600, 180))))
+        cars.append({"id": f"car_{i}", "pi": pi, "class": determine_forza_class(pi)})
+    return cars
+
+def legacy_similar_cars(cars: List[Dict[str, Any]], calculated_pi: int, user_class: str,
+                        num_cars: int) -> List[Dict[str, Any]]:
+    """The pre-index implementation: filter, optionally widen, then full sort"""
+    class_cars = [car for car in cars if car["class"] == user_class]
+    if len(class_cars) < num_cars:
+        nearby_classes = SIMILAR_CARS_CONFIG["nearby_classes"]
+        class_cars = [car for car in cars
+                      if car["class"] in nearby_classes.get(user_class, [user_class])]
+    class_cars.sort(key=lambda x: abs(x["pi"] - calculated_pi))
+    return class_cars[:num_cars]
+
+class IndexedSimilarCars:
+    """Same lookup backed by per-class NearestPIIndex columns"""
+
+    def __init__(self, cars: List[Dict[str, Any]]):
+        rows_by_class: Dict[str, list] = {}
+        for position, car in enumerate(cars):
+            rows_by_class.setdefault(car["class"], []).append((car["pi"], position, car))
+        self.by_class = {car_class: NearestPIIndex(rows) for car_class, rows in rows_by_class.items()}
+        self.by_nearby = {
+            car_class: merge_indexes(self.by_class.get(c) for c in nearby)
+            for car_class, nearby in SIMILAR_CARS_CONFIG["nearby_classes"].items()
+        }
+
+    def similar(self, calculated_pi: int, user_class: str, num_cars: int) -> List[Dict[str, Any]]:
+        index = self.by_class.get(user_class)
+        if (index is None or len(index) < num_cars) and user_class in self.by_nearby:
+            index = self.by_nearby[user_class]
+        return index.nearest(calculated_pi, num_cars) if index is not None else []
+
+def _time_queries(func, queries, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for pi, car_class in queries:
+            func(pi, car_class, SIMILAR_CARS_CONFIG["default_count"])
+    return (time.perf_counter() - start) / (repeat * len(queries))
+
+def run(sizes: List[int], queries_per_size: int = 50):
+    rng = random.Random(7)
+    print(f"{'cars':>10} {'build ms':>10} {'legacy us/q':>12} {'index us/q':>12} {'speedup':>9}")
+    for size in sizes:
+        cars = make_synthetic_cars(size)
+        queries = []
+        for _ in range(queries_per_size):
+            pi = rng.randint(100, 999)
+            queries.append((pi, determine_forza_class(pi)))
+
+        start = time.perf_counter()
+        engine = IndexedSimilarCars(cars)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        # Both implementations must agree before timing means anything
+        for pi, car_class in queries:
+            expected = legacy_similar_cars(cars, pi, car_class, SIMILAR_CARS_CONFIG["default_count"])
+            assert engine.similar(pi, car_class, SIMILAR_CARS_CONFIG["default_count"]) == expected
+
+        legacy_queries = queries if size <= 10_000 else queries[:5]
+        legacy_us = _time_queries(lambda p, c, n: legacy_similar_cars(cars, p, c, n),
+                                  legacy_queries, 1) * 1e6
+        index_us = _time_queries(engine.similar, queries, 20) * 1e6
+        print(f"{size:>10} {build_ms:>10.1f} {legacy_us:>12.1f} {index_us:>12.2f} {legacy_us / index_us:>8.0f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+    run(args.sizes, args.queries)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_spec_similarity.py
+"""
+Benchmark for spec-based similar-car search
+Compares a full weighted-distance scan with the SpecKDTree engine
+
+Run from the project root:
+    python -m benchmarks.bench_spec_similarity [--sizes 1000 100000 1000000]
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from config.settings import SPEC_SIMILARITY_CONFIG
+from utils.pi_calculator import determine_forza_class
+from utils.similarity import FEATURES, build_spec_tree, feature_weights, spec_vector
+
+def make_synthetic_cars(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate cars with loosely correlated PI, HP and weight"""
+    rng = random.Random(seed)
+    cars = []
+    for i in range(count):
+        pi = max(100, min(999, int(rng.gauss(600, 180))))
+        hp = max(50, int(pi * rng.uniform(0.4, 1.2)))
+        weight = max(1200, int(rng.gauss(3400, 600)))
+        cars.append({"id": f"car_{i}", "pi": pi, "hp": hp, "weight": weight, "class": determine_forza_class(pi)})
+    return cars
+
+def scan_similar(cars, points: np.ndarray, target: np.ndarray, weights: np.ndarray, count: int,
+                 mask: Optional[np.ndarray]) -> List[Dict[str, Any]]:
+    """Reference: weighted distance to every car, then a full stable sort"""
+    distances = ((points - target) ** 2 * weights).sum(axis=1)
+    if mask is not None:
+        distances = np.where(mask, distances, np.inf)
+    order = np.argsort(distances, kind="stable")[:count]
+    return [cars[i] for i in order if np.isfinite(distances[i])]
+
+def run(sizes: List[int], queries_per_size: int = 50):
+    rng = random.Random(7)
+    count = SPEC_SIMILARITY_CONFIG["default_count"]
+    print(f"{'cars':>10} {'build ms':>10} {'scan us/q':>11} {'tree us/q':>11} {'speedup':>9}")
+    for size in sizes:
+        cars = make_synthetic_cars(size)
+        queries = []
+        for _ in range(queries_per_size):
+            pi = rng.randint(100, 999)
+            weights = {name: rng.choice([0.5, 1.0, 2.0]) for name in FEATURES}
+            car_class = determine_forza_class(pi) if rng.random() < 0.3 else None
+            queries.append((spec_vector(pi, rng.randint(80, 1200), rng.randint(1500, 5000)),
+                            feature_weights(weights, SPEC_SIMILARITY_CONFIG["weights"]), car_class))
+
+        start = time.perf_counter()
+        tree = build_spec_tree(cars, SPEC_SIMILARITY_CONFIG["leaf_size"])
+        build_ms = (time.perf_counter() - start) * 1000
+
+        points = tree.normalize(np.array([spec_vector(c["pi"], c["hp"], c["weight"]) for c in cars]))
+        classes = np.array([car["class"] for car in cars])
+        masks = {car_class: classes == car_class for _, _, car_class in queries if car_class}
+        prepared = [(vector, weights, masks.get(car_class)) for vector, weights, car_class in queries]
+
+        # Both implementations must agree before timing means anything
+        for vector, weights, mask in prepared:
+            expected = scan_similar(cars, points, tree.normalize(vector), weights, count, mask)
+            assert [car for car, _ in tree.query(vector, count, weights, mask)] == expected
+
+        start = time.perf_counter()
+        for vector, weights, mask in prepared:
+            scan_similar(cars, points, tree.normalize(vector), weights, count, mask)
+        scan_us = (time.perf_counter() - start) / len(prepared) * 1e6
+
+        start = time.perf_counter()
+        for vector, weights, mask in prepared:
+            tree.query(vector, count, weights, mask)
+        tree_us = (time.perf_counter() - start) / len(prepared) * 1e6
+        print(f"{size:>10} {build_ms:>10.1f} {scan_us:>11.1f} {tree_us:>11.1f} {scan_us / tree_us:>8.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+    run(args.sizes, args.queries)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+# benchmarks/load_test_api.py
+"""
+Load test for the headless HTTP API (api_server.py)
+Keep-alive connections hammer a mix of endpoints; reports throughput and latency
+
+Without --url a server is started on a free local port with --server-workers
+processes and stopped afterwards. Each client process runs its own event
+loop with --connections keep-alive connections, sending one request at a
+time per connection. VIN endpoints are left out since they hit NHTSA.
+
+Run from the project root:
+    python -m benchmarks.load_test_api [--seconds 10 --server-workers 4 --client-processes 4]
+    python -m benchmarks.load_test_api --url http://127.0.0.1:8080 --mix pi=1
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _pi_query(rng: random.Random) -> str:
+    return (f"/pi?hp={rng.randrange(100, 1200, 10)}&weight={rng.randrange(1800, 5000, 50)}"
+            f"&top_speed={rng.randrange(100, 260, 5)}&acceleration={rng.randrange(25, 90) / 10}"
+            f"&handling={rng.randrange(80, 130) / 100}&braking={rng.randrange(90, 150, 5)}")
+
+def _batch_body(rng: random.Random, rows: int) -> bytes:
+    return json.dumps({"columns": {
+        "hp": [rng.randrange(100, 1200) for _ in range(rows)],
+        "weight": [rng.randrange(1800, 5000) for _ in range(rows)],
+        "top_speed": [rng.randrange(100, 260) for _ in range(rows)],
+        "acceleration": [rng.randrange(25, 90) / 10 for _ in range(rows)],
+        "handling": [rng.randrange(80, 130) / 100 for _ in range(rows)],
+        "braking": [rng.randrange(90, 150) for _ in range(rows)],
+    }}).encode()
+
+def build_requests(host: str, seed: int, count: int = 512) -> Dict[str, List[bytes]]:
+    """Pre-encoded requests per endpoint, so the client spends its time on I/O"""
+    rng = random.Random(seed)
+
+    def get(path: str) -> bytes:
+        return f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+
+    def post(path: str, body: bytes) -> bytes:
+        return (f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n").encode() + body
+
+    return {
+        "health": [get("/health")],
+        # A small pool of repeated inputs, like real users, exercises the PI memo
+        "pi": [get(_pi_query(rng)) for _ in range(count)],
+        "class": [get(f"/class?pi={rng.randint(100, 999)}") for _ in range(count)],
+        "similar": [get(f"/similar?pi={rng.randint(100, 999)}&count=6") for _ in range(count)],
+        "similar-specs": [get(f"/similar?pi={rng.randint(100, 999)}&hp={rng.randrange(100, 1200)}"
+                              f"&weight={rng.randrange(1800, 5000)}&count=6") for _ in range(count)],
+        "pi-batch": [post("/pi/batch", _batch_body(rng, 100)) for _ in range(16)],
+    }
+
+async def _read_response(reader: asyncio.StreamReader) -> int:
+    """Read one response, returning its status code"""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    headers = {name.lower(): value.strip() for name, _, value in
+               (line.partition(":") for line in lines[1:] if line)}
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    elif headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readuntil(b"\r\n"))[:-2], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    return status
+
+async def _connection(host: str, port: int, plan: List[Tuple[str, bytes]], deadline: float,
+                      latencies: Dict[str, List[float]], errors: Dict[str, int]):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        index = 0
+        while time.perf_counter() < deadline:
+            name, request = plan[index % len(plan)]
+            index += 1
+            start = time.perf_counter()
+            writer.write(request)
+            try:
+                status = await _read_response(reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                errors[name] = errors.get(name, 0) + 1
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            latencies.setdefault(name, []).append(time.perf_counter() - start)
+            if status != 200:
+                errors[name] = errors.get(name, 0) + 1
+    finally:
+        writer.close()
+
+async def _client(host: str, port: int, connections: int, seconds: float, mix: Dict[str, int], seed: int):
+    requests = build_requests(host, seed)
+    rng = random.Random(seed)
+    weighted = [name for name, weight in mix.items() for _ in range(weight)]
+    latencies: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    deadline = time.perf_counter() + seconds
+    plans = []
+    for _ in range(connections):
+        names = [rng.choice(weighted) for _ in range(256)]
+        plans.append([(name, rng.choice(requests[name])) for name in names])
+    await asyncio.gather(*(_connection(host, port, plan, deadline, latencies, errors) for plan in plans))
+    return latencies, errors
+
+def _client_process(args):
+    return asyncio.run(_client(*args))
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _wait_for_server(host: str, port: int, timeout: float = 60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"API server did not start on {host}:{port}")
+
+def _percentile(values: List[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+def run(url: str, seconds: float, connections: int, client_processes: int, mix: Dict[str, int]):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+
+    jobs = [(host, port, connections, seconds, mix, seed) for seed in range(client_processes)]
+    with multiprocessing.get_context("spawn").Pool(client_processes) as pool:
+        results = pool.map(_client_process, jobs)
+    # Each client runs for exactly `seconds` once connected; process start-up is not counted
+    elapsed = seconds
+
+    latencies: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    for process_latencies, process_errors in results:
+        for name, values in process_latencies.items():
+            latencies.setdefault(name, []).extend(values)
+        for name, count in process_errors.items():
+            errors[name] = errors.get(name, 0) + count
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"{client_processes} client processes x {connections} connections for {seconds:.0f}s against {url}")
+    print(f"{'endpoint':<15} {'requests':>10} {'req/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for name in sorted(latencies):
+        values = sorted(latencies[name])
+        print(f"{name:<15} {len(values):>10} {len(values) / elapsed:>10.0f} {_percentile(values, 0.5) * 1000:>8.2f} "
+              f"{_percentile(values, 0.95) * 1000:>8.2f} {_percentile(values, 0.99) * 1000:>8.2f} "
+              f"{errors.get(name, 0):>7}")
+    print(f"{'total':<15} {total:>10} {total / elapsed:>10.0f}")
+    return sum(errors.values()) == 0
+
+def _parse_mix(text: str) -> Dict[str, int]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = int(weight or 1)
+    return mix
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Existing server to test; by default one is started")
+    parser.add_argument("--server-workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--client-processes", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--connections", type=int, default=32, help="Connections per client process")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--mix", default="pi=5,class=2,similar=2,similar-specs=1,health=1,pi-batch=1",
+                        help="Comma separated endpoint=weight pairs")
+    args = parser.parse_args()
+    mix = _parse_mix(args.mix)
+
+    server = None
+    url = args.url
+    if url is None:
+        port = _free_port()
+        url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen([sys.executable, "api_server.py", "--port", str(port),
+                                   "--workers", str(args.server_workers)],
+                                  cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        if server is not None:
+            _wait_for_server("127.0.0.1", port)
+            time.sleep(1.0 + 0.5 * args.server_workers)  # every worker warms its caches before accepting
+        ok = run(url, args.seconds, args.connections, args.client_processes, mix)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
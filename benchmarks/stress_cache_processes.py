@@ -0,0 +1,119 @@
+# benchmarks/stress_cache_processes.py
+"""
+Multi-process stress test for the shared real-world data cache
+Writer processes keep replacing the cache while reader processes reload it
+
+Every snapshot a writer saves is homogeneous: all rows carry the same
+"w<writer>-<iteration>" model and the row count is derived from it. Readers
+poll reload_if_changed() and fail if they ever see a mixed or short
+snapshot, sample data, or a generation going backwards. Export/import of
+the JSON file is exercised the same way.
+
+Run from the project root:
+    python -m benchmarks.stress_cache_processes [--writers 3 --readers 6 --seconds 10]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+from utils.real_world_data import RealWorldDataManager, RealWorldVehicle
+
+def _snapshot_rows(writer: int, iteration: int) -> int:
+    return 200 + (writer * 7919 + iteration * 104729) % 3000
+
+def _make_snapshot(writer: int, iteration: int) -> List[RealWorldVehicle]:
+    tag = f"w{writer}-{iteration}"
+    return [RealWorldVehicle(year=2000 + row % 25, make="Stress", model=tag, horsepower=float(row))
+            for row in range(_snapshot_rows(writer, iteration))]
+
+def _check_snapshot(vehicles) -> str:
+    """Empty string if the snapshot is one complete writer snapshot, else a description"""
+    if not vehicles or vehicles[0].make != "Stress":
+        return "served sample data"
+    tag = vehicles[0].model
+    writer, iteration = (int(part) for part in tag[1:].split("-"))
+    expected = _snapshot_rows(writer, iteration)
+    if len(vehicles) != expected:
+        return f"{tag}: {len(vehicles)} rows, expected {expected}"
+    if any(vehicle.model != tag for vehicle in vehicles):
+        return f"{tag}: rows from several snapshots"
+    return ""
+
+def writer(directory: str, index: int, deadline: float, results):
+    manager = RealWorldDataManager(directory)
+    iteration = 0
+    while time.time() < deadline:
+        iteration += 1
+        vehicles = _make_snapshot(index, iteration)
+        if iteration % 5 == 0:
+            # JSON round trip: export is atomic, import re-saves the columnar cache
+            path = os.path.join(directory, "stress_export.json")
+            manager.vehicles_database = vehicles
+            manager.export_json(path)
+            manager.import_json(path)
+        else:
+            manager._save_cached_data(vehicles)
+    results.put(("writer", index, f"{iteration} snapshots written", []))
+
+def reader(directory: str, index: int, deadline: float, results):
+    manager = RealWorldDataManager(directory)
+    errors, reloads, checks = [], 0, 0
+    last_generation = manager._generation
+    while time.time() < deadline and len(errors) < 10:
+        if manager.reload_if_changed():
+            reloads += 1
+        if manager._generation < last_generation:
+            errors.append(f"generation went back from {last_generation} to {manager._generation}")
+        last_generation = manager._generation
+        problem = _check_snapshot(manager.vehicles_database)
+        if problem:
+            errors.append(problem)
+        checks += 1
+    results.put(("reader", index, f"{reloads} reloads over {checks} checks", errors))
+
+def run(writers: int, readers: int, seconds: float) -> bool:
+    with tempfile.TemporaryDirectory() as directory:
+        # Seed the cache so readers never start from sample data
+        RealWorldDataManager(directory)._save_cached_data(_make_snapshot(0, 0))
+
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        deadline = time.time() + seconds
+        processes = [context.Process(target=writer, args=(directory, i + 1, deadline, results))
+                     for i in range(writers)]
+        processes += [context.Process(target=reader, args=(directory, i + 1, deadline, results))
+                      for i in range(readers)]
+        for process in processes:
+            process.start()
+        reports = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+        ok = True
+        for role, index, summary, failures in sorted(reports):
+            ok = ok and not failures
+            print(f"{role} {index}: {summary}")
+            for failure in failures:
+                print(f"    FAIL {failure}")
+        leftovers = [name for name in os.listdir(directory) if name.endswith(".tmp")]
+        if leftovers:
+            ok = False
+            print(f"FAIL leftover temp files: {leftovers}")
+        print("PASS" if ok else "FAIL")
+        return ok
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=3)
+    parser.add_argument("--readers", type=int, default=6)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+    sys.exit(0 if run(args.writers, args.readers, args.seconds) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# components/session_store.py
+"""
+Per-session result store for Forza PI Calculator
+Keeps VIN lookups in st.session_state so reruns render them without decoding again
+"""
+
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Tuple
+import streamlit as st
+from config.settings import VIN_SESSION_CONFIG
+from utils.real_world_data import RealWorldVehicle
+from utils.vin_decoder import VINDecoder, VehicleInfo
+
+_STORE_KEY = "vin_lookup_results"
+_PENDING_KEY = "vin_lookup_pending"
+
+@dataclass(slots=True)
+class VinLookupResult:
+    """Everything the VIN section shows for one decoded VIN"""
+    vehicle_info: VehicleInfo
+    real_world_vehicle: Optional[RealWorldVehicle] = None
+    enhanced_pi: Optional[int] = None
+    confidence: Optional[float] = None
+
+def _results() -> Dict[str, VinLookupResult]:
+    """This session's results by normalized VIN, oldest first"""
+    return st.session_state.setdefault(_STORE_KEY, {})
+
+def get_vin_result(vin: str) -> Optional[VinLookupResult]:
+    """Stored result for a VIN in this session, if it was looked up"""
+    if not vin:
+        return None
+    return _results().get(VINDecoder.normalize_vin(vin))
+
+def store_vin_result(vin: str, result: VinLookupResult):
+    """Remember a lookup for this session, evicting the oldest beyond VIN_SESSION_CONFIG["max_results"]"""
+    results = _results()
+    key = VINDecoder.normalize_vin(vin)
+    results.pop(key, None)
+    results[key] = result
+    while len(results) > VIN_SESSION_CONFIG["max_results"]:
+        del results[next(iter(results))]
+
+def _pending() -> Dict[str, Tuple[VehicleInfo, Future]]:
+    """This session's lookups still running, as (local pre-decode, future) by normalized VIN"""
+    return st.session_state.setdefault(_PENDING_KEY, {})
+
+def set_pending_lookup(vin: str, local_info: VehicleInfo, future: Future):
+    """Track a background lookup for this session until it is collected"""
+    _pending()[VINDecoder.normalize_vin(vin)] = (local_info, future)
+
+def get_pending_lookup(vin: str) -> Optional[Tuple[VehicleInfo, Future]]:
+    """(local pre-decode, future) for a VIN being looked up in this session"""
+    if not vin:
+        return None
+    return _pending().get(VINDecoder.normalize_vin(vin))
+
+def collect_pending_lookup(vin: str) -> Optional[VinLookupResult]:
+    """Move a finished background lookup into the result store and return it
+
+    Returns None while the lookup is still running (or if there is none).
+    A lookup that raised is stored as a failed decode on the local fields.
+    """
+    key = VINDecoder.normalize_vin(vin) if vin else ""
+    pending = _pending().get(key)
+    if pending is None or not pending[1].done():
+        return None
+
+    local_info, future = _pending().pop(key)
+    try:
+        result = future.result()
+    except Exception as e:
+        result = VinLookupResult(replace(local_info, error_message=f"Lookup failed: {e}"))
+    store_vin_result(key, result)
+    return result
@@ -0,0 +1,150 @@
+# components/templates.py
+"""
+HTML templates for Forza PI Calculator UI components
+Static fragments are compacted once at import; rendered car cards are cached
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable
+from config.settings import CLASS_COLORS, UI_TEXT
+
+def compact(html: str) -> str:
+    """Strip per-line indentation and blank lines from an HTML fragment
+
+    Keeps the markup Markdown-safe (no indented lines that could become
+    code blocks) and shrinks what is sent to the browser on every rerun.
+    """
+    return "".join(line.strip() for line in html.splitlines() if line.strip())
+
+HEADER_HTML = compact(f"""
+    <div class="main-header">
+        <h1 class="main-title">{UI_TEXT["app_title"]}</h1>
+        <h2 class="main-subtitle">{UI_TEXT["app_subtitle"]}</h2>
+        <p class="main-subtitle">{UI_TEXT["app_description"]}</p>
+    </div>
+""")
+
+METRICS_TITLE_HTML = compact("""
+    <div class="input-section">
+        <h3 class="section-title">📊 Performance Metrics</h3>
+    </div>
+""")
+
+RESULTS_TEMPLATE = compact("""
+    <div class="results-container">
+        <p style="font-family: 'Rajdhani', sans-serif; font-size: 1.2rem; margin-bottom: 1rem; color: #ffffff;">Performance Index</p>
+        <h1 class="pi-score">{pi}</h1>
+        <p style="font-family: 'Rajdhani', sans-serif; font-size: 1.1rem; margin: 1rem 0; color: #ffffff;">Class Rating</p>
+        <h2 class="forza-class {class_css}">{forza_class}</h2>
+    </div>
+""")
+
+BREAKDOWN_TEMPLATE = compact("""
+    <div class="input-section">
+        <h4 style="color: #ff6b35; text-align: center; margin-bottom: 1rem;">Performance Breakdown</h4>
+    </div>
+    <div class="metric-container">
+        <div class="metric-item">
+            <div class="metric-label">Power</div>
+            <div class="metric-value">{power}</div>
+        </div>
+        <div class="metric-item">
+            <div class="metric-label">Weight</div>
+            <div class="metric-value">{weight}</div>
+        </div>
+        <div class="metric-item">
+            <div class="metric-label">Speed</div>
+            <div class="metric-value">{speed}</div>
+        </div>
+    </div>
+    <div class="metric-container">
+        <div class="metric-item">
+            <div class="metric-label">Acceleration</div>
+            <div class="metric-value">{acceleration}</div>
+        </div>
+        <div class="metric-item">
+            <div class="metric-label">Handling</div>
+            <div class="metric-value">{handling}</div>
+        </div>
+        <div class="metric-item">
+            <div class="metric-label">Braking</div>
+            <div class="metric-value">{braking}</div>
+        </div>
+    </div>
+""")
+
+SIMILAR_CARS_TITLE_HTML = compact("""
+    <div class="similar-cars-section">
+        <h3 class="section-title" style="color: #32CD32;">🚗 Similar Cars in Forza Horizon 5</h3>
+        <p style="text-align: center; color: #ffffff; opacity: 0.9; margin-bottom: 1.5rem;">
+            Cars in your PI class that you can drive in Forza Horizon 5
+        </p>
+    </div>
+""")
+
+CAR_CARD_TEMPLATE = compact("""
+    <div class="car-card">
+        <div class="car-name">{year} {make} {model}</div>
+        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
+            <div class="car-pi {class_css}">PI: {pi}</div>
+            <div style="color: #32CD32; font-family: 'Orbitron', monospace; font-weight: 600;">
+                Class {car_class}
+            </div>
+        </div>
+        <div class="car-details">
+            {hp} HP • {weight:,} lbs • {car_type}<br>
+            <small style="color: #ffaa00;">±{pi_diff} PI from your car</small>
+        </div>
+    </div>
+""")
+
+SIDEBAR_TITLE_HTML = compact("""
+    <div style="text-align: center; padding: 1rem;">
+        <h2 style="color: #ff6b35; font-family: 'Orbitron', monospace;">🏎️ About PI</h2>
+    </div>
+""")
+
+SIDEBAR_REAL_WORLD_HTML = compact("""
+    <div style="background: linear-gradient(45deg, rgba(50, 205, 50, 0.1) 0%, rgba(34, 139, 34, 0.1) 100%);
+                border: 2px solid #32CD32; border-radius: 12px; padding: 1rem; margin-bottom: 1rem;">
+        <h4 style="color: #32CD32; text-align: center; margin-bottom: 0.5rem;">🎯 Your Vehicle (Real-World Data)</h4>
+    </div>
+""")
+
+SIDEBAR_VIN_HTML = compact("""
+    <div style="background: linear-gradient(45deg, rgba(0, 191, 255, 0.1) 0%, rgba(30, 144, 255, 0.1) 100%);
+                border: 2px solid #00bfff; border-radius: 12px; padding: 1rem; margin-bottom: 1rem;">
+        <h4 style="color: #00bfff; text-align: center; margin-bottom: 0.5rem;">🔍 Your Vehicle (VIN)</h4>
+    </div>
+""")
+
+SIDEBAR_FOOTER_TEMPLATE = compact("""
+    <div style="text-align: center;">
+        <p style="color: #32CD32; font-weight: bold;">🎉 Similar Cars: {similar_cars_count} found in {forza_class} class!</p>
+        <p style="color: #ff6b35; font-weight: bold;">Ready for Forza Horizon 6! 🚀</p>
+    </div>
+""")
+
+def class_css(forza_class: str) -> str:
+    """CSS class for a Forza class badge"""
+    return CLASS_COLORS.get(forza_class, {"css": "", "color": "#ffffff"})["css"]
+
+@lru_cache(maxsize=4096)
+def _car_card(car_id: Any, pi_diff: int, year: Any, make: str, model: str, pi: int,
+              car_class: str, hp: Any, weight: Any, car_type: str) -> str:
+    return CAR_CARD_TEMPLATE.format(year=year, make=make, model=model, pi=pi, car_class=car_class,
+                                    class_css=class_css(car_class), hp=hp, weight=weight,
+                                    car_type=car_type, pi_diff=pi_diff)
+
+def render_car_card(car: Dict[str, Any], pi_diff: int) -> str:
+    """HTML for one similar-car card, cached by car id and PI difference
+
+    The displayed fields are part of the key too, so a catalog reload that
+    changes a car never serves its old card.
+    """
+    return _car_card(car.get("id"), pi_diff, car["year"], car["make"], car["model"], car["pi"],
+                     car["class"], car["hp"], car["weight"], car["type"])
+
+def render_car_grid(cards: Iterable[str]) -> str:
+    """Wrap rendered cards in the two-column grid, for a single st.markdown call"""
+    return f'<div class="car-grid">{"".join(cards)}</div>'
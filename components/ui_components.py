@@ -6,20 +6,19 @@ Modular Streamlit UI components for the application
 
 import streamlit as st
 from typing import Dict, List, Any, Tuple, Optional
-from config.settings import CLASS_COLORS, UI_TEXT
+from config.settings import VIN_LOOKUP_CONFIG
 from utils.pi_calculator import get_class_info
 from utils.vin_decoder import VINDecoder, VehicleInfo
-from utils.real_world_data import RealWorldDataManager, find_real_world_vehicle, calculate_enhanced_pi
+from components import templates
+from components.session_store import (
+    VinLookupResult, get_vin_result, store_vin_result,
+    get_pending_lookup, set_pending_lookup, collect_pending_lookup
+)
+from components.vin_lookup import submit_vin_lookup
 
 def render_header():
     """Render the main application header"""
-    st.markdown(f"""
-    <div class="main-header">
-        <h1 class="main-title">{UI_TEXT["app_title"]}</h1>
-        <h2 class="main-subtitle">{UI_TEXT["app_subtitle"]}</h2>
-        <p class="main-subtitle">{UI_TEXT["app_description"]}</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(templates.HEADER_HTML, unsafe_allow_html=True)
 
 def render_vin_section() -> Tuple[str, Optional[VehicleInfo], Optional[Any]]:
     """Render VIN lookup section and return VIN input, decoded info, and real-world data"""
@@ -33,123 +32,146 @@ def render_vin_section() -> Tuple[str, Optional[VehicleInfo], Optional[Any]]:
     """, unsafe_allow_html=True)
     
     vin_input = st.text_input("Vehicle Identification Number (VIN)", 
-                             placeholder="1HGCM82633A123456", 
+                             placeholder="1HGCM82633A004352", 
                              help="17-character VIN from your vehicle")
     
-    vehicle_info = None
-    real_world_vehicle = None
+    # Results persist per session by VIN, so reruns (e.g. a changed number
+    # input) keep showing them without another NHTSA round-trip
+    result = get_vin_result(vin_input) or collect_pending_lookup(vin_input)
     
     if st.button("🚀 Decode VIN & Find Real-World Data", help="Get complete vehicle information and enhanced PI calculation"):
         if vin_input:
-            with st.spinner("Decoding VIN..."):
-                vehicle_info = VINDecoder.decode_vin(vin_input)
+            # Failed decodes are retried on click, successful ones come from memory
+            if (result is None or not result.vehicle_info.is_valid) and get_pending_lookup(vin_input) is None:
+                local_info = VINDecoder.predecode_vin(vin_input)
+                if local_info.error_message:
+                    # Malformed VINs fail offline, nothing to wait for
+                    result = VinLookupResult(local_info)
+                    store_vin_result(vin_input, result)
+                else:
+                    # NHTSA and real-world matching run in the background so PI
+                    # and similar cars keep rendering while the lookup is slow
+                    result = None
+                    set_pending_lookup(vin_input, local_info, submit_vin_lookup(vin_input))
+        else:
+            st.warning("⚠️ Please enter a VIN to decode.")
+    
+    pending = get_pending_lookup(vin_input) if result is None else None
+    if pending is not None:
+        local_info = pending[0]
+        render_vin_pending(local_info)
+        _poll_vin_lookup(vin_input)
+        return vin_input, local_info, None
+    
+    if result is None:
+        return vin_input, None, None
+    
+    render_vin_results(result)
+    return vin_input, result.vehicle_info, result.real_world_vehicle
+
+def render_vin_pending(local_info: VehicleInfo):
+    """Render the offline pre-decode while NHTSA and real-world data are fetched"""
+    decoded = " ".join(str(part) for part in (local_info.year, local_info.make) if part)
+    st.info(f"⏳ **Decoding VIN{': ' + decoded if decoded else ''}** - fetching NHTSA and real-world details...")
+
+@st.fragment(run_every=VIN_LOOKUP_CONFIG["poll_interval"])
+def _poll_vin_lookup(vin: str):
+    """Check the pending lookup without rerunning the page, then rerun it once results arrive"""
+    if collect_pending_lookup(vin) is not None:
+        st.rerun()
+
+def render_vin_results(result: VinLookupResult):
+    """Render the decode, real-world match and enhanced PI for a VIN lookup"""
+    vehicle_info, real_world_vehicle = result.vehicle_info, result.real_world_vehicle
+    
+    if vehicle_info.is_valid:
+        # Success - show vehicle info
+        summary = VINDecoder.get_vehicle_summary(vehicle_info)
+        st.success(f"✅ **Vehicle Found:** {summary}")
+        
+        # Show VIN decode results
+        with st.expander("📋 VIN Decode Results"):
+            col1, col2 = st.columns(2)
             
-            if vehicle_info.is_valid:
-                # Success - show vehicle info
-                summary = VINDecoder.get_vehicle_summary(vehicle_info)
-                st.success(f"✅ **Vehicle Found:** {summary}")
-                
-                # Try to find real-world data match
-                with st.spinner("Searching real-world database..."):
-                    if vehicle_info.year and vehicle_info.make and vehicle_info.model:
-                        try:
-                            year = int(vehicle_info.year)
-                            real_world_vehicle = find_real_world_vehicle(
-                                year, vehicle_info.make, vehicle_info.model, vehicle_info.trim
-                            )
-                        except ValueError:
-                            pass
+            with col1:
+                if vehicle_info.year:
+                    st.write(f"**Year:** {vehicle_info.year}")
+                if vehicle_info.make:
+                    st.write(f"**Make:** {vehicle_info.make}")
+                if vehicle_info.model:
+                    st.write(f"**Model:** {vehicle_info.model}")
+                if vehicle_info.trim:
+                    st.write(f"**Trim:** {vehicle_info.trim}")
+                if vehicle_info.body_class:
+                    st.write(f"**Body:** {vehicle_info.body_class}")
+            
+            with col2:
+                if vehicle_info.engine_displacement_cc:
+                    cc = vehicle_info.engine_displacement_cc
+                    try:
+                        liters = float(cc) / 1000
+                        st.write(f"**Engine:** {liters:.1f}L ({cc}cc)")
+                    except:
+                        st.write(f"**Engine:** {cc}cc")
+                if vehicle_info.engine_cylinders:
+                    st.write(f"**Cylinders:** {vehicle_info.engine_cylinders}")
+                if vehicle_info.fuel_type:
+                    st.write(f"**Fuel:** {vehicle_info.fuel_type}")
+                if vehicle_info.drive_type:
+                    st.write(f"**Drive:** {vehicle_info.drive_type}")
+                if vehicle_info.transmission_style:
+                    st.write(f"**Transmission:** {vehicle_info.transmission_style}")
+        
+        # Show real-world data if found
+        if real_world_vehicle:
+            st.success("🎯 **Real-World Performance Data Found!**")
+            
+            with st.expander("🏁 Real-World Performance Specifications"):
+                col1, col2 = st.columns(2)
                 
-                # Show VIN decode results
-                with st.expander("📋 VIN Decode Results"):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        if vehicle_info.year:
-                            st.write(f"**Year:** {vehicle_info.year}")
-                        if vehicle_info.make:
-                            st.write(f"**Make:** {vehicle_info.make}")
-                        if vehicle_info.model:
-                            st.write(f"**Model:** {vehicle_info.model}")
-                        if vehicle_info.trim:
-                            st.write(f"**Trim:** {vehicle_info.trim}")
-                        if vehicle_info.body_class:
-                            st.write(f"**Body:** {vehicle_info.body_class}")
-                    
-                    with col2:
-                        if vehicle_info.engine_displacement_cc:
-                            cc = vehicle_info.engine_displacement_cc
-                            try:
-                                liters = float(cc) / 1000
-                                st.write(f"**Engine:** {liters:.1f}L ({cc}cc)")
-                            except:
-                                st.write(f"**Engine:** {cc}cc")
-                        if vehicle_info.engine_cylinders:
-                            st.write(f"**Cylinders:** {vehicle_info.engine_cylinders}")
-                        if vehicle_info.fuel_type:
-                            st.write(f"**Fuel:** {vehicle_info.fuel_type}")
-                        if vehicle_info.drive_type:
-                            st.write(f"**Drive:** {vehicle_info.drive_type}")
-                        if vehicle_info.transmission_style:
-                            st.write(f"**Transmission:** {vehicle_info.transmission_style}")
+                with col1:
+                    st.write(f"**Horsepower:** {real_world_vehicle.horsepower} HP")
+                    st.write(f"**Torque:** {real_world_vehicle.torque_lbft} lb-ft")
+                    st.write(f"**Weight:** {real_world_vehicle.weight_lbs:,.0f} lbs")
+                    st.write(f"**0-60 mph:** {real_world_vehicle.acceleration_0_60} sec")
                 
-                # Show real-world data if found
-                if real_world_vehicle:
-                    st.success("🎯 **Real-World Performance Data Found!**")
-                    
-                    with st.expander("🏁 Real-World Performance Specifications"):
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.write(f"**Horsepower:** {real_world_vehicle.horsepower} HP")
-                            st.write(f"**Torque:** {real_world_vehicle.torque_lbft} lb-ft")
-                            st.write(f"**Weight:** {real_world_vehicle.weight_lbs:,.0f} lbs")
-                            st.write(f"**0-60 mph:** {real_world_vehicle.acceleration_0_60} sec")
-                        
-                        with col2:
-                            st.write(f"**Top Speed:** {real_world_vehicle.top_speed_mph} mph")
-                            if real_world_vehicle.handling_g_force:
-                                st.write(f"**Handling:** {real_world_vehicle.handling_g_force} G")
-                            if real_world_vehicle.braking_60_0_ft:
-                                st.write(f"**Braking 60-0:** {real_world_vehicle.braking_60_0_ft} ft")
-                            st.write(f"**Drivetrain:** {real_world_vehicle.drivetrain}")
-                    
-                    # Calculate enhanced PI
-                    enhanced_pi, confidence = calculate_enhanced_pi(real_world_vehicle)
-                    
-                    st.markdown(f"""
-                    <div style="background: linear-gradient(45deg, rgba(50, 205, 50, 0.1) 0%, rgba(34, 139, 34, 0.1) 100%); 
-                                border: 2px solid #32CD32; border-radius: 12px; padding: 1rem; margin: 1rem 0;">
-                        <h4 style="color: #32CD32; text-align: center; margin-bottom: 0.5rem;">
-                            🎯 Enhanced PI Calculation
-                        </h4>
-                        <div style="text-align: center;">
-                            <div style="font-size: 2rem; color: #ffaa00; font-weight: bold;">
-                                {enhanced_pi} PI
-                            </div>
-                            <div style="color: #ffffff; opacity: 0.9;">
-                                Confidence: {confidence:.1%} • Real-world data enhanced
-                            </div>
-                        </div>
+                with col2:
+                    st.write(f"**Top Speed:** {real_world_vehicle.top_speed_mph} mph")
+                    if real_world_vehicle.handling_g_force:
+                        st.write(f"**Handling:** {real_world_vehicle.handling_g_force} G")
+                    if real_world_vehicle.braking_60_0_ft:
+                        st.write(f"**Braking 60-0:** {real_world_vehicle.braking_60_0_ft} ft")
+                    st.write(f"**Drivetrain:** {real_world_vehicle.drivetrain}")
+            
+            st.markdown(f"""
+            <div style="background: linear-gradient(45deg, rgba(50, 205, 50, 0.1) 0%, rgba(34, 139, 34, 0.1) 100%); 
+                        border: 2px solid #32CD32; border-radius: 12px; padding: 1rem; margin: 1rem 0;">
+                <h4 style="color: #32CD32; text-align: center; margin-bottom: 0.5rem;">
+                    🎯 Enhanced PI Calculation
+                </h4>
+                <div style="text-align: center;">
+                    <div style="font-size: 2rem; color: #ffaa00; font-weight: bold;">
+                        {result.enhanced_pi} PI
                     </div>
-                    """, unsafe_allow_html=True)
-                    
-                else:
-                    st.info("💡 **Real-world data not found** for this specific vehicle. Using VIN-based estimates for manual input.")
-                
-                # Show performance hints
-                hints = VINDecoder.extract_performance_hints(vehicle_info)
-                if hints and not real_world_vehicle:
-                    st.info("💡 **Performance Hints Available:** Use the manual input section below with VIN-based estimates!")
-                    
-            else:
-                # Error - show error message
-                st.error(f"❌ **VIN Decode Failed:** {vehicle_info.error_message}")
-                st.info("💡 Please use the manual input section below to enter your vehicle specifications.")
+                    <div style="color: #ffffff; opacity: 0.9;">
+                        Confidence: {result.confidence:.1%} • Real-world data enhanced
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
         else:
-            st.warning("⚠️ Please enter a VIN to decode.")
-    
-    return vin_input, vehicle_info, real_world_vehicle
+            st.info("💡 **Real-world data not found** for this specific vehicle. Using VIN-based estimates for manual input.")
+        
+        # Show performance hints
+        hints = VINDecoder.extract_performance_hints(vehicle_info)
+        if hints and not real_world_vehicle:
+            st.info("💡 **Performance Hints Available:** Use the manual input section below with VIN-based estimates!")
+            
+    else:
+        # Error - show error message
+        st.error(f"❌ **VIN Decode Failed:** {vehicle_info.error_message}")
+        st.info("💡 Please use the manual input section below to enter your vehicle specifications.")
 
 def render_manual_input_section(vehicle_info: Optional[VehicleInfo] = None, 
                                real_world_vehicle: Optional[Any] = None) -> Tuple[float, float, float, float, float, float, float]:
@@ -352,103 +374,25 @@ def render_manual_input_section(vehicle_info: Optional[VehicleInfo] = None,
 
 def render_results_section(pi: int, forza_class: str):
     """Render the PI results section"""
-    st.markdown("""
-    <div class="input-section">
-        <h3 class="section-title">📊 Performance Metrics</h3>
-    </div>
-    """, unsafe_allow_html=True)
-    
     class_css, class_color = get_class_info(forza_class)
     
-    # Display results
-    st.markdown(f"""
-    <div class="results-container">
-        <p style="font-family: 'Rajdhani', sans-serif; font-size: 1.2rem; margin-bottom: 1rem; color: #ffffff;">Performance Index</p>
-        <h1 class="pi-score">{pi}</h1>
-        <p style="font-family: 'Rajdhani', sans-serif; font-size: 1.1rem; margin: 1rem 0; color: #ffffff;">Class Rating</p>
-        <h2 class="forza-class {class_css}">{forza_class}</h2>
-    </div>
-    """, unsafe_allow_html=True)
+    # Section title and results in one message
+    st.markdown(templates.METRICS_TITLE_HTML +
+                templates.RESULTS_TEMPLATE.format(pi=pi, class_css=class_css, forza_class=forza_class),
+                unsafe_allow_html=True)
 
 def render_performance_breakdown(breakdown: Dict[str, int]):
     """Render performance breakdown metrics"""
-    st.markdown("""
-    <div class="input-section">
-        <h4 style="color: #ff6b35; text-align: center; margin-bottom: 1rem;">Performance Breakdown</h4>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Display metrics in a grid
-    st.markdown(f"""
-    <div class="metric-container">
-        <div class="metric-item">
-            <div class="metric-label">Power</div>
-            <div class="metric-value">{breakdown['power']}</div>
-        </div>
-        <div class="metric-item">
-            <div class="metric-label">Weight</div>
-            <div class="metric-value">{breakdown['weight']}</div>
-        </div>
-        <div class="metric-item">
-            <div class="metric-label">Speed</div>
-            <div class="metric-value">{breakdown['speed']}</div>
-        </div>
-    </div>
-    <div class="metric-container">
-        <div class="metric-item">
-            <div class="metric-label">Acceleration</div>
-            <div class="metric-value">{breakdown['acceleration']}</div>
-        </div>
-        <div class="metric-item">
-            <div class="metric-label">Handling</div>
-            <div class="metric-value">{breakdown['handling']}</div>
-        </div>
-        <div class="metric-item">
-            <div class="metric-label">Braking</div>
-            <div class="metric-value">{breakdown['braking']}</div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(templates.BREAKDOWN_TEMPLATE.format(**breakdown), unsafe_allow_html=True)
 
 def render_similar_cars_section(similar_cars: List[Dict[str, Any]], pi: int, forza_class: str):
     """Render similar cars section"""
-    st.markdown("""
-    <div class="similar-cars-section">
-        <h3 class="section-title" style="color: #32CD32;">🚗 Similar Cars in Forza Horizon 5</h3>
-        <p style="text-align: center; color: #ffffff; opacity: 0.9; margin-bottom: 1.5rem;">
-            Cars in your PI class that you can drive in Forza Horizon 5
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(templates.SIMILAR_CARS_TITLE_HTML, unsafe_allow_html=True)
     
-    # Display similar cars in a grid
+    # Display similar cars in a two-column grid, sent as one message
     if similar_cars:
-        # Create two columns for car cards
-        car_col1, car_col2 = st.columns(2)
-        
-        for i, car in enumerate(similar_cars):
-            col = car_col1 if i % 2 == 0 else car_col2
-            
-            with col:
-                # Determine PI difference and class color
-                pi_diff = abs(car["pi"] - pi)
-                car_class_css = CLASS_COLORS.get(car["class"], {"css": "", "color": "#ffffff"})["css"]
-                
-                st.markdown(f"""
-                <div class="car-card">
-                    <div class="car-name">{car['year']} {car['make']} {car['model']}</div>
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
-                        <div class="car-pi {car_class_css}">PI: {car['pi']}</div>
-                        <div style="color: #32CD32; font-family: 'Orbitron', monospace; font-weight: 600;">
-                            Class {car['class']}
-                        </div>
-                    </div>
-                    <div class="car-details">
-                        {car['hp']} HP • {car['weight']:,} lbs • {car['type']}<br>
-                        <small style="color: #ffaa00;">±{pi_diff} PI from your car</small>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+        cards = (templates.render_car_card(car, abs(car["pi"] - pi)) for car in similar_cars)
+        st.markdown(templates.render_car_grid(cards), unsafe_allow_html=True)
     else:
         st.info("No similar cars found in the database. Try adjusting your vehicle specifications.")
 
@@ -475,20 +419,11 @@ def render_sidebar(similar_cars_count: int, forza_class: str,
                   real_world_vehicle: Optional[Any] = None):
     """Render sidebar with application information"""
     with st.sidebar:
-        st.markdown("""
-        <div style="text-align: center; padding: 1rem;">
-            <h2 style="color: #ff6b35; font-family: 'Orbitron', monospace;">🏎️ About PI</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(templates.SIDEBAR_TITLE_HTML, unsafe_allow_html=True)
         
         # Show real-world vehicle info if available (highest priority)
         if real_world_vehicle:
-            st.markdown("""
-            <div style="background: linear-gradient(45deg, rgba(50, 205, 50, 0.1) 0%, rgba(34, 139, 34, 0.1) 100%); 
-                        border: 2px solid #32CD32; border-radius: 12px; padding: 1rem; margin-bottom: 1rem;">
-                <h4 style="color: #32CD32; text-align: center; margin-bottom: 0.5rem;">🎯 Your Vehicle (Real-World Data)</h4>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(templates.SIDEBAR_REAL_WORLD_HTML, unsafe_allow_html=True)
             
             vehicle_name = f"{real_world_vehicle.year} {real_world_vehicle.make} {real_world_vehicle.model}"
             if real_world_vehicle.trim:
@@ -510,12 +445,7 @@ def render_sidebar(similar_cars_count: int, forza_class: str,
         
         # Show VIN vehicle info if available (and no real-world data)
         elif vehicle_info and vehicle_info.is_valid:
-            st.markdown("""
-            <div style="background: linear-gradient(45deg, rgba(0, 191, 255, 0.1) 0%, rgba(30, 144, 255, 0.1) 100%); 
-                        border: 2px solid #00bfff; border-radius: 12px; padding: 1rem; margin-bottom: 1rem;">
-                <h4 style="color: #00bfff; text-align: center; margin-bottom: 0.5rem;">🔍 Your Vehicle (VIN)</h4>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(templates.SIDEBAR_VIN_HTML, unsafe_allow_html=True)
             
             summary = VINDecoder.get_vehicle_summary(vehicle_info)
             st.write(f"**{summary}**")
@@ -554,9 +484,6 @@ def render_sidebar(similar_cars_count: int, forza_class: str,
         """)
         
         st.markdown("---")
-        st.markdown(f"""
-        <div style="text-align: center;">
-            <p style="color: #32CD32; font-weight: bold;">🎉 Similar Cars: {similar_cars_count} found in {forza_class} class!</p>
-            <p style="color: #ff6b35; font-weight: bold;">Ready for Forza Horizon 6! 🚀</p>
-        </div>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+        st.markdown(templates.SIDEBAR_FOOTER_TEMPLATE.format(similar_cars_count=similar_cars_count,
+                                                             forza_class=forza_class),
+                    unsafe_allow_html=True)
\ No newline at end of file
@@ -0,0 +1,65 @@
+# components/vin_lookup.py
+"""
+Background VIN lookups for Forza PI Calculator
+Runs NHTSA decodes and real-world matching on a shared executor, off the script thread
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+from config.settings import VIN_LOOKUP_CONFIG
+from components.session_store import VinLookupResult
+from utils.real_world_data import find_real_world_vehicle, calculate_enhanced_pi
+from utils.vin_decoder import VINDecoder
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+# Running lookups by normalized VIN; sessions asking for the same VIN share one future
+_in_flight: Dict[str, Future] = {}
+
+def lookup_vin(vin: str) -> VinLookupResult:
+    """Decode a VIN, match it to real-world data and calculate its enhanced PI
+
+    Blocking, and free of Streamlit calls so it can run on a worker thread.
+    """
+    vehicle_info = VINDecoder.decode_vin(vin)
+    result = VinLookupResult(vehicle_info)
+
+    if vehicle_info.is_valid and vehicle_info.year and vehicle_info.make and vehicle_info.model:
+        try:
+            year = int(vehicle_info.year)
+            result.real_world_vehicle = find_real_world_vehicle(
+                year, vehicle_info.make, vehicle_info.model, vehicle_info.trim
+            )
+        except ValueError:
+            pass
+
+    if result.real_world_vehicle:
+        result.enhanced_pi, result.confidence = calculate_enhanced_pi(result.real_world_vehicle)
+
+    return result
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=VIN_LOOKUP_CONFIG["max_workers"],
+                                       thread_name_prefix="vin-lookup")
+    return _executor
+
+def submit_vin_lookup(vin: str) -> Future:
+    """Start (or join) a background lookup for a VIN and return its future"""
+    key = VINDecoder.normalize_vin(vin)
+    with _lock:
+        future = _in_flight.get(key)
+        if future is not None:
+            return future
+        future = _get_executor().submit(lookup_vin, key)
+        _in_flight[key] = future
+    # Outside the lock: the callback runs inline if the lookup already finished
+    future.add_done_callback(lambda done: _finish(key, done))
+    return future
+
+def _finish(key: str, future: Future):
+    with _lock:
+        if _in_flight.get(key) is future:
+            del _in_flight[key]
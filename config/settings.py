@@ -29,6 +29,14 @@ PI_CALCULATION = {
     "pi_max": 999
 }
 
+# PI Evaluation Cache Configuration
+PI_CACHE_CONFIG = {
+    "maxsize": 4096,
+    # Inputs with at most this many decimal places are memoized (the resolution
+    # the manual input widgets produce); finer inputs are calculated uncached
+    "input_decimals": {"hp": 0, "weight": 0, "top_speed": 0, "acceleration": 2, "handling": 2, "braking": 0}
+}
+
 # Class Color Mapping
 CLASS_COLORS = {
     "D": {"css": "class-d", "color": "#8B4513", "name": "D Class"},
@@ -54,6 +62,101 @@ SIMILAR_CARS_CONFIG = {
     }
 }
 
+# Spec-Based Similar Cars Configuration
+SPEC_SIMILARITY_CONFIG = {
+    "default_count": 6,
+    # Per-dimension weights on z-score normalized features
+    "weights": {"pi": 1.0, "hp": 1.0, "weight": 1.0, "power_to_weight": 1.0},
+    "leaf_size": 16          # Points per KD-tree leaf
+}
+
+# VIN Decode Cache Configuration
+VIN_CACHE_CONFIG = {
+    "enabled": True,
+    "memory_entries": 1024,                  # In-process LRU size
+    "ttl_seconds": 30 * 24 * 3600,           # Successful decodes
+    "negative_ttl_seconds": 6 * 3600,        # "No data" / incomplete decodes
+    "db_filename": "vin_cache.sqlite3"       # Stored in the shared cache directory
+}
+
+# VIN Decode Result Configuration
+VIN_DECODE_CONFIG = {
+    "keep_raw_data": False,      # Keep the full NHTSA response on VehicleInfo.raw_data
+    "compress_raw_data": True    # Store it zlib-compressed when kept
+}
+
+# Per-Session VIN Result Configuration
+VIN_SESSION_CONFIG = {
+    "max_results": 10        # Lookups kept per browser session, oldest dropped first
+}
+
+# Background VIN Lookup Configuration
+VIN_LOOKUP_CONFIG = {
+    "max_workers": 4,        # Shared lookup threads for all sessions
+    "poll_interval": 0.5     # Seconds between UI checks on a pending lookup
+}
+
+# Batch VIN Decoding Configuration
+VIN_BATCH_CONFIG = {
+    "chunk_size": 50,      # NHTSA DecodeVINValuesBatch limit per request
+    "max_workers": 4,      # Concurrent batch requests
+    "timeout": 30          # Seconds per batch request
+}
+
+# Async VIN Client Configuration
+VIN_ASYNC_CONFIG = {
+    "max_concurrency": 8,      # In-flight NHTSA requests (HTTP pool fits this or batch max_workers)
+    "rate_per_second": 5.0,    # Request starts per second per host
+    "burst": 5,                # Requests allowed back-to-back before throttling
+    "max_retries": 3,          # Retries for 429/5xx, timeouts and connection errors
+    "backoff_base": 0.5,       # Seconds, doubled per attempt before jitter
+    "backoff_max": 8.0,        # Cap on a single backoff delay
+    "timeout": 10              # Seconds per request
+}
+
+# Real-World Data Refresh Configuration
+REAL_WORLD_DATA_CONFIG = {
+    "cache_hours": 24,                    # Data older than this is revalidated
+    "background_refresh": True,           # Revalidate stale data off the request path
+    "retry_after_failure_minutes": 30,    # Back-off after a failed refresh
+    "request_timeout": 10                 # Seconds for the Google Sheets download
+}
+
+# Fuzzy Real-World Matching Configuration
+FUZZY_MATCH_CONFIG = {
+    "min_score": 0.6,        # Best candidate must reach this to count as a match
+    "min_model_score": 0.5,  # Model similarity required on its own; make and year cannot make up for it
+    "max_year_gap": 2,       # Candidates further than this from the VIN year are ignored
+    "make_weight": 0.4,
+    "model_weight": 0.45,
+    "year_weight": 0.15,
+    "family_score": 0.5,     # Model similarity credited when a model line and its variant agree (E-Class / E63)
+    "top_k": 5
+}
+
+# HTTP API Server Configuration
+API_CONFIG = {
+    "host": "127.0.0.1",
+    "port": 8080,
+    "workers": 1,                  # Processes sharing the port (SO_REUSEPORT)
+    "keepalive_timeout": 15,       # Seconds an idle connection is kept open
+    "max_header_bytes": 16384,
+    "max_body_bytes": 8388608,     # 8 MB request bodies
+    "max_batch_size": 100000,      # Rows per /pi/batch or /class/batch request
+    "max_vin_batch_size": 1000,    # VINs per /vin/batch request
+    "batch_chunk_size": 2048,      # Rows scored and streamed per chunk
+    "max_results": 50,             # Cap on similar-car and real-world result counts
+    "blocking_workers": 8          # Threads per worker for real-world matching and enhanced PI
+}
+
+# Bulk Fleet Scoring Configuration
+FLEET_SCORING_CONFIG = {
+    "chunk_size": 5000,          # Rows per worker task
+    "similar_count": 3,          # Similar Forza cars attached per row
+    "max_in_flight": 2,          # Chunks queued per worker; bounds memory
+    "progress_interval": 1.0     # Seconds between progress lines
+}
+
 # File Paths
 DATA_PATHS = {
     "forza_cars": "data/forza_cars.json",
@@ -0,0 +1,135 @@
+# score_fleet.py
+"""
+Score a fleet export in bulk: PI, Forza class and similar Forza cars per row
+
+Reads CSV (header row) or JSONL with hp, weight, top_speed, acceleration
+(0-60 s), handling (G) and braking (60-0 ft) columns; use --column to map
+differently named columns. Output keeps the input columns, adds pi, class,
+similar_cars and error, and is written in input order while chunks are
+scored on a process pool. Progress goes to stderr.
+
+With an output file, a checkpoint is saved after every chunk; rerun with
+--resume to continue after an interruption.
+
+Run from the project root:
+    python score_fleet.py fleet.csv -o scored.csv [--workers 4 --similar 3]
+    python score_fleet.py fleet.jsonl -o scored.jsonl --column hp=horsepower --resume
+    cat fleet.csv | python score_fleet.py - --input-format csv > scored.csv
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import sys
+import time
+from config.settings import FLEET_SCORING_CONFIG
+from utils.fleet_scoring import (
+    RESULT_FIELDS, Checkpoint, Progress, ResultWriter, detect_format, read_rows, score_stream
+)
+from utils.pi_calculator import PI_INPUTS
+
+def _column_mapping(overrides) -> dict:
+    columns = {name: name for name in PI_INPUTS}
+    for override in overrides or []:
+        name, _, source = override.partition("=")
+        if name not in columns or not source:
+            raise SystemExit(f"--column expects one of {', '.join(PI_INPUTS)} as NAME=SOURCE, got {override!r}")
+        columns[name] = source
+    return columns
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="CSV or JSONL file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default stdout)")
+    parser.add_argument("--input-format", choices=["csv", "jsonl"])
+    parser.add_argument("--output-format", choices=["csv", "jsonl"])
+    parser.add_argument("--column", action="append", metavar="NAME=SOURCE",
+                        help="Read an input from a differently named column, e.g. hp=Horsepower")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=FLEET_SCORING_CONFIG["chunk_size"])
+    parser.add_argument("--similar", type=int, default=FLEET_SCORING_CONFIG["similar_count"],
+                        help="Similar Forza cars per row (0 to skip)")
+    parser.add_argument("--similar-by", choices=["pi", "specs"], default="pi",
+                        help="Rank similar cars by PI within the class, or by PI/HP/weight specs")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default <output>.checkpoint.json)")
+    parser.add_argument("--resume", action="store_true", help="Continue from the checkpoint")
+    parser.add_argument("--quiet", action="store_true", help="No progress output")
+    args = parser.parse_args()
+
+    columns = _column_mapping(args.column)
+    input_format = detect_format(args.input, args.input_format)
+    output_format = args.output_format or (detect_format(args.output) if args.output != "-" else input_format)
+
+    checkpoint = None
+    if args.output != "-":
+        checkpoint = Checkpoint(args.checkpoint or f"{args.output}.checkpoint.json")
+    elif args.resume:
+        raise SystemExit("--resume needs an output file (-o)")
+
+    rows_done, output_bytes, fields = 0, 0, None
+    if args.resume:
+        try:
+            rows_done, output_bytes, fields = checkpoint.load()
+        except ValueError as e:
+            raise SystemExit(str(e))
+        if rows_done and not os.path.exists(args.output):
+            raise SystemExit(f"Checkpoint says {rows_done} rows are done but {args.output} is missing")
+        if rows_done and fields is None and output_format == "csv":
+            # Checkpoints from before fields were recorded: reuse the header already written
+            with open(args.output, "r", newline="", encoding="utf-8") as f:
+                header = next(csv.reader(f), [])
+            fields = [name for name in header if name not in RESULT_FIELDS]
+
+    if args.input == "-":
+        source, input_size = sys.stdin, None
+    else:
+        source = open(args.input, "r", newline="", encoding="utf-8-sig")
+        input_size = os.path.getsize(args.input)
+
+    if args.output == "-":
+        output = sys.stdout
+    elif rows_done:
+        # Drop anything written after the last checkpoint, then append
+        os.truncate(args.output, output_bytes)
+        output = open(args.output, "a", newline="", encoding="utf-8")
+    else:
+        output = open(args.output, "w", newline="", encoding="utf-8")
+
+    position = (lambda: source.buffer.tell()) if input_size else None
+    progress = Progress(input_size, position, FLEET_SCORING_CONFIG["progress_interval"])
+    writer = ResultWriter(output, output_format, write_header=rows_done == 0, fields=fields)
+    if rows_done and not args.quiet:
+        print(f"Resuming after {rows_done:,} rows", file=sys.stderr)
+
+    scored = 0
+    try:
+        rows = itertools.islice(read_rows(source, input_format), rows_done, None)
+        for chunk, scores in score_stream(rows, columns, args.chunk_size, args.workers, args.similar, args.similar_by):
+            writer.write(chunk, scores)
+            scored += len(chunk)
+            if checkpoint is not None:
+                output.flush()
+                checkpoint.save(rows_done + scored, output.buffer.tell(), writer.fields)
+            if not args.quiet:
+                progress.update(scored)
+    except KeyboardInterrupt:
+        if checkpoint is not None:
+            print(f"Interrupted after {rows_done + scored:,} rows; rerun with --resume to continue",
+                  file=sys.stderr)
+        sys.exit(130)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        if source is not sys.stdin:
+            source.close()
+
+    if checkpoint is not None:
+        checkpoint.remove()
+    if not args.quiet:
+        elapsed = max(time.perf_counter() - progress.start, 1e-9)
+        print(f"Done: {scored:,} rows in {elapsed:.1f}s ({scored / elapsed:,.0f} rows/s), "
+              f"{rows_done + scored:,} total", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
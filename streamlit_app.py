@@ -3,8 +3,8 @@ import streamlit as st
 # Import our modular components
 from config.settings import PAGE_CONFIG
 from utils.styling import get_forza_css
-from utils.pi_calculator import calculate_pi, get_performance_breakdown, determine_forza_class
-from utils.data_manager import get_similar_cars
+from utils.pi_calculator import evaluate_pi
+from utils.data_manager import get_car_catalog, get_similar_cars
 from components.ui_components import (
     render_header, render_vin_section, render_manual_input_section,
     render_results_section, render_performance_breakdown, 
@@ -22,6 +22,9 @@ st.markdown(get_forza_css(), unsafe_allow_html=True)
 # Main Application
 def main():
     """Main application function"""
+    # Load (or refresh) the car catalog first so PI classes follow its class_definitions
+    get_car_catalog()
+    
     # Render header
     render_header()
     
@@ -36,16 +39,15 @@ def main():
         hp, torque, weight, top_speed, acceleration, handling, braking = render_manual_input_section(vehicle_info, real_world_vehicle)
     
     with col2:
-        # Calculate PI and class
-        pi = calculate_pi(hp, weight, top_speed, acceleration, handling, braking)
-        forza_class = determine_forza_class(pi)
+        # Calculate PI, class and breakdown (memoized across reruns and sessions)
+        evaluation = evaluate_pi(hp, weight, top_speed, acceleration, handling, braking)
+        pi, forza_class = evaluation.pi, evaluation.forza_class
         
         # Render results
         render_results_section(pi, forza_class)
         
         # Performance breakdown
-        breakdown = get_performance_breakdown(hp, weight, top_speed, acceleration, handling, braking)
-        render_performance_breakdown(breakdown)
+        render_performance_breakdown(evaluation.breakdown)
     
     # Similar cars section
     similar_cars = get_similar_cars(pi, forza_class, 6)
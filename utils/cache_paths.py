@@ -0,0 +1,40 @@
+# utils/cache_paths.py
+"""
+Cache directory resolution for Forza PI Calculator
+Finds a writable on-disk location shared by the data caches
+"""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+# Candidate cache directories, in order of preference
+CACHE_DIR_CANDIDATES = [
+    os.path.expanduser("~/.forza_pi_cache"),  # User home directory
+    "/tmp/forza_pi_cache",                     # System temp directory
+    "./cache",                                 # Current directory cache
+]
+
+def ensure_cache_dir(dir_path: str) -> bool:
+    """Create a cache directory and check it is writable"""
+    try:
+        os.makedirs(dir_path, exist_ok=True)
+        # Test write permission
+        test_file = os.path.join(dir_path, f"test_write.{os.getpid()}.tmp")
+        with open(test_file, 'w') as f:
+            f.write("test")
+        os.remove(test_file)
+        return True
+    except (OSError, PermissionError):
+        return False
+
+@lru_cache(maxsize=None)
+def find_writable_cache_dir() -> Optional[str]:
+    """Return the first writable candidate cache directory, or None if none are usable
+    
+    Probing writes a test file, so the result is computed once per process.
+    """
+    for dir_path in CACHE_DIR_CANDIDATES:
+        if ensure_cache_dir(dir_path):
+            return dir_path
+    return None
@@ -0,0 +1,298 @@
+# utils/columnar_cache.py
+"""
+Binary columnar cache format for Forza PI Calculator
+Memory-mapped fixed-width columns with an interned string table, read lazily
+"""
+
+import json
+import math
+import mmap
+import struct
+import threading
+import zlib
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from utils.file_cache import atomic_write
+
+# File layout:
+#   header   MAGIC, format version, flags, metadata length, metadata CRC32
+#   metadata JSON describing row count, column sections and caller metadata
+#   sections 8-byte aligned column arrays and the string table, each CRC32-checked
+MAGIC = b"FZRW"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sHHII")
+
+# Column kinds and their array typecodes; None is stored as a sentinel
+COLUMN_TYPECODES = {"int": "q", "float": "d", "str": "I"}
+INT_NONE = -2 ** 63
+STR_NONE = 0xFFFFFFFF
+
+class ColumnarCacheError(ValueError):
+    """Raised when a columnar cache file is missing, corrupt or of another version"""
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+def write_columnar(path: str, rows: Sequence[Any], columns: Sequence[Tuple[str, str]],
+                   metadata: Optional[Dict[str, Any]] = None):
+    """
+    Write rows to a columnar cache file
+
+    Args:
+        path: Destination file
+        rows: Objects exposing one attribute per column
+        columns: (attribute name, kind) pairs, kind is "int", "float" or "str"
+        metadata: JSON-serializable values stored in the header
+    """
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+    sections: List[Tuple[str, bytes]] = []
+
+    for name, kind in columns:
+        values = [getattr(row, name) for row in rows]
+        if kind == "int":
+            data = array("q", (INT_NONE if value is None else int(value) for value in values))
+        elif kind == "float":
+            data = array("d", (math.nan if value is None else float(value) for value in values))
+        elif kind == "str":
+            data = array("I")
+            for value in values:
+                if value is None:
+                    data.append(STR_NONE)
+                    continue
+                string_id = string_ids.get(value)
+                if string_id is None:
+                    string_id = string_ids[value] = len(strings)
+                    strings.append(value)
+                data.append(string_id)
+        else:
+            raise ValueError(f"Unknown column kind: {kind}")
+        sections.append((name, data.tobytes()))
+
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = array("I", [0])
+    for value in encoded:
+        offsets.append(offsets[-1] + len(value))
+    string_table = offsets.tobytes() + b"".join(encoded)
+
+    # Section offsets are relative to the 8-aligned data start after the metadata
+    layout, position = [], 0
+    for name, data in sections:
+        layout.append({"name": name, "kind": dict(columns)[name], "offset": position,
+                       "size": len(data), "crc": zlib.crc32(data)})
+        position = _align(position + len(data))
+    meta = {
+        "rows": len(rows),
+        "columns": layout,
+        "strings": {"offset": position, "count": len(strings), "size": len(string_table),
+                    "crc": zlib.crc32(string_table)},
+        "metadata": metadata or {},
+    }
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    blobs = [(column["offset"], data) for column, (_, data) in zip(layout, sections)]
+    blobs.append((meta["strings"]["offset"], string_table))
+
+    # Readers may have the old file mapped; truncating it in place would fault them,
+    # so the new file is written alongside and renamed over the old one
+    with atomic_write(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(meta_bytes), zlib.crc32(meta_bytes)))
+        f.write(meta_bytes)
+        data_start = _align(_HEADER.size + len(meta_bytes))
+        for offset, data in blobs:
+            f.write(b"\0" * (data_start + offset - f.tell()))
+            f.write(data)
+
+class ColumnarFile:
+    """Read-only, memory-mapped view of a columnar cache file
+
+    Opening reads and checks only the header and metadata. Each column is
+    checksummed the first time it is accessed, and strings are decoded from
+    the string table on demand. close() (or leaving a with block) unmaps the
+    file; values already decoded stay usable.
+    """
+
+    def __init__(self, path: str):
+        try:
+            with open(path, "rb") as f:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    raise ColumnarCacheError(f"Truncated columnar cache: {path}")
+                magic, version, _, meta_len, meta_crc = _HEADER.unpack(header)
+                if magic != MAGIC:
+                    raise ColumnarCacheError(f"Not a columnar cache: {path}")
+                if version != FORMAT_VERSION:
+                    raise ColumnarCacheError(f"Unsupported columnar cache version {version}: {path}")
+                meta_bytes = f.read(meta_len)
+                if len(meta_bytes) != meta_len or zlib.crc32(meta_bytes) != meta_crc:
+                    raise ColumnarCacheError(f"Corrupt columnar cache header: {path}")
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError as e:
+            raise ColumnarCacheError(f"Could not open columnar cache {path}: {e}") from e
+
+        meta = json.loads(meta_bytes)
+        self.path = path
+        self.row_count: int = meta["rows"]
+        self.metadata: Dict[str, Any] = meta["metadata"]
+        self._data_start = _align(_HEADER.size + meta_len)
+        self._columns: Dict[str, Dict[str, Any]] = {column["name"]: column for column in meta["columns"]}
+        self._string_info = meta["strings"]
+
+        end = self._data_start + self._string_info["offset"] + self._string_info["size"]
+        if len(self._map) < end:
+            raise ColumnarCacheError(f"Truncated columnar cache: {path}")
+
+        self._lock = threading.Lock()
+        self._views: Dict[str, memoryview] = {}
+        self._string_offsets: Optional[memoryview] = None
+        self._string_blob: Optional[memoryview] = None
+        self._strings: Optional[List[Optional[str]]] = None
+        self.closed = False
+
+    def close(self):
+        """Unmap the file so a replaced cache is not kept on disk; safe to call twice"""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            for view in self._views.values():
+                view.release()
+            self._views.clear()
+            for view in (self._string_offsets, self._string_blob):
+                if view is not None:
+                    view.release()
+            self._string_offsets = self._string_blob = None
+            try:
+                self._map.close()
+            except BufferError:
+                # A reader still holds a view of the mapping; it is unmapped once that is dropped
+                pass
+
+    def __enter__(self) -> "ColumnarFile":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _check_open(self):
+        if self.closed:
+            raise ColumnarCacheError(f"Columnar cache is closed: {self.path}")
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._columns)
+
+    def _section(self, offset: int, size: int, crc: int, label: str) -> memoryview:
+        start = self._data_start + offset
+        view = memoryview(self._map)[start:start + size]
+        if zlib.crc32(view) != crc:
+            raise ColumnarCacheError(f"Checksum mismatch in {label} of {self.path}")
+        return view
+
+    def raw_column(self, name: str) -> memoryview:
+        """Typed view of a column's stored values (sentinels included), verified on first access"""
+        view = self._views.get(name)
+        if view is None:
+            with self._lock:
+                view = self._views.get(name)
+                if view is None:
+                    self._check_open()
+                    column = self._columns[name]
+                    view = self._section(column["offset"], column["size"], column["crc"], f"column {name}")
+                    view = view.cast(COLUMN_TYPECODES[column["kind"]])
+                    self._views[name] = view
+        return view
+
+    def string(self, string_id: int) -> Optional[str]:
+        """Decode one interned string"""
+        if string_id == STR_NONE:
+            return None
+        strings = self._strings
+        if strings is None:
+            with self._lock:
+                if self._strings is None:
+                    self._check_open()
+                    info = self._string_info
+                    table = self._section(info["offset"], info["size"], info["crc"], "string table")
+                    offsets_size = (info["count"] + 1) * 4
+                    self._string_offsets = table[:offsets_size].cast("I")
+                    self._string_blob = table[offsets_size:]
+                    self._strings = [None] * info["count"]
+                strings = self._strings
+        value = strings[string_id]
+        if value is None:
+            self._check_open()
+            offsets = self._string_offsets
+            value = str(self._string_blob[offsets[string_id]:offsets[string_id + 1]], "utf-8")
+            strings[string_id] = value
+        return value
+
+    def value(self, name: str, row: int) -> Any:
+        """One decoded cell, with sentinels mapped back to None"""
+        stored = self.raw_column(name)[row]
+        kind = self._columns[name]["kind"]
+        if kind == "str":
+            return self.string(stored)
+        if kind == "float":
+            return None if math.isnan(stored) else stored
+        return None if stored == INT_NONE else stored
+
+    def column(self, name: str) -> List[Any]:
+        """Whole decoded column"""
+        raw = self.raw_column(name)
+        kind = self._columns[name]["kind"]
+        if kind == "str":
+            string = self.string
+            strings = [string(string_id) for string_id in range(self._string_info["count"])]
+            return [None if stored == STR_NONE else strings[stored] for stored in raw]
+        if kind == "float":
+            return [None if math.isnan(stored) else stored for stored in raw]
+        return [None if stored == INT_NONE else stored for stored in raw]
+
+class ColumnarRows(Sequence):
+    """Sequence of rows backed by a ColumnarFile
+
+    Rows are built with factory(**fields) on first access and kept, so
+    repeated lookups return the same object. Appending keeps new rows in
+    memory alongside the file.
+    """
+
+    def __init__(self, source: ColumnarFile, factory: Callable[..., Any]):
+        self.source = source
+        self._factory = factory
+        self._names = source.column_names
+        self._rows: List[Any] = [None] * source.row_count
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[index] for index in range(*position.indices(len(self)))]
+        row = self._rows[position]
+        if row is None:
+            if position < 0:
+                position += len(self._rows)
+            value = self.source.value
+            row = self._factory(**{name: value(name, position) for name in self._names})
+            self._rows[position] = row
+        return row
+
+    def __iter__(self) -> Iterator[Any]:
+        for position in range(len(self._rows)):
+            yield self[position]
+
+    def append(self, row: Any):
+        self._rows.append(row)
+
+    def extended(self, rows: Sequence[Any]) -> "ColumnarRows":
+        """New sequence over the same file with rows appended; this one is left unchanged"""
+        copy = ColumnarRows(self.source, self._factory)
+        copy._rows = self._rows + list(rows)
+        return copy
+
+    def column(self, name: str) -> List[Any]:
+        """Decoded values of one field for every row, without materializing rows"""
+        values = self.source.column(name)
+        for position in range(self.source.row_count, len(self._rows)):
+            values.append(getattr(self._rows[position], name))
+        return values
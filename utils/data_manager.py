@@ -6,65 +6,201 @@ Handles car database loading and similar car search functionality
 
 import json
 import os
-from typing import List, Dict, Any
-from config.settings import SIMILAR_CARS_CONFIG
+import threading
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Union
+import numpy as np
+from config.settings import SIMILAR_CARS_CONFIG, SPEC_SIMILARITY_CONFIG
+from utils.pi_calculator import set_class_definitions
+from utils.pi_search import NearestPIIndex, merge_indexes
+from utils.similarity import SpecKDTree, build_spec_tree, feature_weights, spec_vector
 
-def load_forza_cars_database() -> List[Dict[str, Any]]:
-    """Load the Forza cars database from JSON file"""
+FORZA_CARS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'forza_cars.json')
+
+def _load_database_file(path: str = FORZA_CARS_PATH) -> Dict[str, Any]:
+    """Load the whole Forza cars JSON document"""
     try:
-        with open('forza_cars.json', 'r', encoding='utf-8') as file:
-            data = json.load(file)
-            return data.get('cars', [])
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
     except FileNotFoundError:
         print("Warning: forza_cars.json not found. Using empty database.")
-        return []
+        return {}
     except json.JSONDecodeError:
         print("Warning: Invalid JSON in forza_cars.json. Using empty database.")
-        return []
+        return {}
+
+def load_forza_cars_database(path: str = FORZA_CARS_PATH) -> List[Dict[str, Any]]:
+    """Load the Forza cars database from JSON file"""
+    return _load_database_file(path).get('cars', [])
+
+class CarCatalog:
+    """Process-wide, PI-indexed view of the Forza cars database
+
+    The JSON file is parsed once and re-parsed only when its modification
+    time changes, and its class_definitions become the PI class boundaries.
+    Cars are kept in per-class NearestPIIndex columns so that a similar-car
+    query is a bisect plus a local expansion.
+    """
+
+    _instance: Optional["CarCatalog"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: str = FORZA_CARS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._loaded = False
+        self.cars: List[Dict[str, Any]] = []
+        self._by_class: Dict[str, NearestPIIndex[Dict[str, Any]]] = {}
+        # Indexes over each class's SIMILAR_CARS_CONFIG nearby classes
+        self._by_nearby: Dict[str, NearestPIIndex[Dict[str, Any]]] = {}
+        # (cars, KD-tree, filter masks) for spec similarity, built on first use per load
+        self._spec_tree: Optional[Tuple[List[Dict[str, Any]], SpecKDTree[Dict[str, Any]], Dict[tuple, np.ndarray]]] = None
+        self.refresh()
+
+    @classmethod
+    def instance(cls) -> "CarCatalog":
+        """Return the shared catalog, creating it on first use"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        cls._instance.refresh()
+        return cls._instance
+
+    def _current_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def refresh(self) -> bool:
+        """Reload the database if the file changed on disk, returns True when reloaded"""
+        mtime = self._current_mtime()
+        if self._loaded and mtime == self._mtime:
+            return False
+
+        with self._lock:
+            if self._loaded and mtime == self._mtime:
+                return False
+            data = _load_database_file(self.path)
+            self._apply_class_definitions(data.get('class_definitions'))
+            self._build(data.get('cars', []))
+            self._mtime = mtime
+            self._loaded = True
+        return True
+
+    def _apply_class_definitions(self, definitions: Optional[Dict[str, Dict[str, Any]]]):
+        """Use the database's class_definitions for PI classification, if it has any"""
+        if not definitions:
+            return
+        try:
+            set_class_definitions(definitions)
+        except ValueError as e:
+            print(f"Warning: Invalid class_definitions in {os.path.basename(self.path)}, keeping current classes: {e}")
+
+    def _build(self, cars: List[Dict[str, Any]]):
+        """Build the per-class indexes and publish them in one step"""
+        rows_by_class: Dict[str, List[Tuple[int, int, Dict[str, Any]]]] = {}
+        for position, car in enumerate(cars):
+            rows_by_class.setdefault(car.get("class", "Unknown"), []).append((car["pi"], position, car))
+
+        by_class = {car_class: NearestPIIndex(rows) for car_class, rows in rows_by_class.items()}
+        by_nearby = {
+            car_class: merge_indexes(by_class.get(nearby_class) for nearby_class in nearby)
+            for car_class, nearby in SIMILAR_CARS_CONFIG["nearby_classes"].items()
+        }
+
+        self.cars, self._by_class, self._by_nearby = cars, by_class, by_nearby
+        self._spec_tree = None
+
+    def class_count(self, car_class: str) -> int:
+        """Number of cars in a class"""
+        index = self._by_class.get(car_class)
+        return len(index) if index is not None else 0
+
+    def class_counts(self) -> Dict[str, int]:
+        """Number of cars per class, in first-seen order"""
+        return {car_class: len(index) for car_class, index in self._by_class.items()}
+
+    def nearest(self, calculated_pi: int, user_class: str, num_cars: int) -> List[Dict[str, Any]]:
+        """Return the cars closest in PI, falling back to nearby classes for small classes"""
+        by_class, by_nearby = self._by_class, self._by_nearby
+        index = by_class.get(user_class)
+
+        if (index is None or len(index) < num_cars) and user_class in by_nearby:
+            index = by_nearby[user_class]
+
+        if index is None:
+            return []
+
+        return index.nearest(calculated_pi, num_cars)
+
+    def _spec_index(self) -> Tuple[List[Dict[str, Any]], SpecKDTree[Dict[str, Any]], Dict[tuple, np.ndarray]]:
+        """(cars, tree, filter masks) for the current load, building the KD-tree on first use"""
+        cached = self._spec_tree
+        if cached is None or cached[0] is not self.cars:
+            with self._lock:
+                cached = self._spec_tree
+                if cached is None or cached[0] is not self.cars:
+                    cars = self.cars
+                    cached = (cars, build_spec_tree(cars, SPEC_SIMILARITY_CONFIG["leaf_size"]), {})
+                    self._spec_tree = cached
+        return cached
+
+    def similar_by_specs(self, pi: float, hp: float, weight: float, num_cars: int,
+                         weights: Optional[Dict[str, float]] = None, car_classes: Optional[Iterable[str]] = None,
+                         car_types: Optional[Iterable[str]] = None) -> List[Tuple[Dict[str, Any], float]]:
+        """Return (car, distance) pairs for the cars with the closest weighted specs"""
+        _, tree, masks = self._spec_index()
+        mask = None
+        if car_classes is not None or car_types is not None:
+            classes = frozenset(car_classes) if car_classes is not None else None
+            types = frozenset(car_types) if car_types is not None else None
+            # Filter masks are reused across queries for the same load
+            mask = masks.get((classes, types))
+            if mask is None:
+                mask = np.array([(classes is None or car.get("class") in classes) and
+                                 (types is None or car.get("type") in types) for car in tree.items], dtype=bool)
+                masks[(classes, types)] = mask
+        return tree.query(spec_vector(pi, hp, weight), num_cars,
+                          feature_weights(weights, SPEC_SIMILARITY_CONFIG["weights"]), mask)
+
+def get_car_catalog() -> CarCatalog:
+    """Get the shared car catalog"""
+    return CarCatalog.instance()
 
 def get_similar_cars(calculated_pi: int, user_class: str, num_cars: int = None) -> List[Dict[str, Any]]:
     """Find similar cars from Forza database based on PI and class"""
     if num_cars is None:
         num_cars = SIMILAR_CARS_CONFIG["default_count"]
-    
-    # Load the car database
-    forza_cars_database = load_forza_cars_database()
-    
-    if not forza_cars_database:
-        return []
-    
-    # Filter cars by class first, then by PI proximity
-    class_cars = [car for car in forza_cars_database if car["class"] == user_class]
-    
-    if len(class_cars) < num_cars:
-        # If not enough cars in exact class, expand to nearby classes
-        nearby_classes = SIMILAR_CARS_CONFIG["nearby_classes"]
-        expanded_cars = [car for car in forza_cars_database 
-                        if car["class"] in nearby_classes.get(user_class, [user_class])]
-        class_cars = expanded_cars
-    
-    # Sort by PI proximity to calculated PI
-    class_cars.sort(key=lambda x: abs(x["pi"] - calculated_pi))
-    
-    return class_cars[:num_cars]
+
+    return get_car_catalog().nearest(calculated_pi, user_class, num_cars)
+
+def get_similar_cars_by_specs(pi: int, hp: float, weight: float, num_cars: int = None,
+                              weights: Optional[Dict[str, float]] = None,
+                              car_class: Optional[Union[str, Iterable[str]]] = None,
+                              car_type: Optional[Union[str, Iterable[str]]] = None) -> List[Dict[str, Any]]:
+    """Find the Forza cars most similar in PI, HP, weight and power-to-weight
+
+    weights overrides SPEC_SIMILARITY_CONFIG per feature (e.g. {"pi": 2.0}),
+    and car_class / car_type restrict results to one or more classes or types.
+    """
+    if num_cars is None:
+        num_cars = SPEC_SIMILARITY_CONFIG["default_count"]
+    classes = [car_class] if isinstance(car_class, str) else car_class
+    types = [car_type] if isinstance(car_type, str) else car_type
+
+    matches = get_car_catalog().similar_by_specs(pi, hp, weight, num_cars, weights, classes, types)
+    return [car for car, _ in matches]
 
 def get_car_database_stats() -> Dict[str, Any]:
     """Get statistics about the car database"""
-    forza_cars_database = load_forza_cars_database()
-    
-    if not forza_cars_database:
+    catalog = get_car_catalog()
+
+    if not catalog.cars:
         return {"total_cars": 0, "classes": {}}
-    
-    stats = {
-        "total_cars": len(forza_cars_database),
-        "classes": {}
+
+    return {
+        "total_cars": len(catalog.cars),
+        "classes": catalog.class_counts()
     }
-    
-    # Count cars by class
-    for car in forza_cars_database:
-        car_class = car.get("class", "Unknown")
-        if car_class not in stats["classes"]:
-            stats["classes"][car_class] = 0
-        stats["classes"][car_class] += 1
-    
-    return stats
\ No newline at end of file
@@ -0,0 +1,70 @@
+# utils/file_cache.py
+"""
+Cross-process file helpers for Forza PI Calculator caches
+Atomic replace-on-write, advisory locks and cheap change detection
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: os.replace is still atomic, locking is skipped
+    fcntl = None
+
+@contextmanager
+def atomic_write(path: str, mode: str = "w", **open_kwargs) -> Iterator[IO]:
+    """
+    Open a temporary file next to path and move it over path on success
+
+    Readers see either the old file or the complete new one, never a
+    partial write. On error the temporary file is removed and path is left
+    untouched.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                     prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, **open_kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+@contextmanager
+def file_lock(path: str, shared: bool = False) -> Iterator[None]:
+    """
+    Hold an advisory lock on path + ".lock" for the duration of the block
+
+    Writers take the exclusive lock; readers that need a consistent view of
+    several files take the shared one.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    with open(f"{path}.lock", "a+") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+def file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime_ns, size) of path, or None if it does not exist
+
+    Every atomic_write produces a new inode, so an unchanged signature means
+    the file does not need to be read again.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,259 @@
+# utils/fleet_scoring.py
+"""
+Bulk fleet scoring for Forza PI Calculator
+Streams CSV/JSONL rows through the vectorized calculator on a process pool, in input order
+"""
+
+import csv
+import json
+import os
+import signal
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import numpy as np
+from config.settings import FLEET_SCORING_CONFIG
+from utils.data_manager import get_car_catalog, get_similar_cars, get_similar_cars_by_specs
+from utils.file_cache import atomic_write
+from utils.pi_calculator import PI_INPUTS, breakdown_batch
+
+# Columns added to every output row
+RESULT_FIELDS = ("pi", "class", "similar_cars", "error")
+
+# (pi, class, similar cars, error) per input row
+RowScore = Tuple[Optional[int], Optional[str], List[Dict[str, Any]], Optional[str]]
+
+def detect_format(path: str, explicit: Optional[str] = None) -> str:
+    """csv or jsonl, from an explicit choice or the file extension"""
+    if explicit:
+        return explicit
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+def read_rows(stream: IO[str], fmt: str) -> Iterator[Dict[str, Any]]:
+    """Yield input rows as dicts, one at a time"""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            row = {"_raw": line.rstrip("\n"), "_error": f"line {line_number}: invalid JSON ({e.msg})"}
+        yield row if isinstance(row, dict) else {"_raw": line.rstrip("\n"), "_error": "not a JSON object"}
+
+def _chunks(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _similar_summary(car: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: car.get(key) for key in ("id", "year", "make", "model", "pi", "class")}
+
+def score_chunk(rows: List[Dict[str, Any]], columns: Dict[str, str], similar_count: int,
+                similar_by: str = "pi") -> List[RowScore]:
+    """
+    Score one chunk of rows (runs in a worker process)
+
+    Rows whose six inputs parse as numbers are scored together with
+    breakdown_batch; the rest get an error message. Similar-car lookups are
+    memoized per chunk since many rows share a PI.
+    """
+    values = np.full((len(rows), len(PI_INPUTS)), np.nan)
+    errors: List[Optional[str]] = [None] * len(rows)
+    for i, row in enumerate(rows):
+        if "_error" in row:
+            errors[i] = row["_error"]
+            continue
+        for j, name in enumerate(PI_INPUTS):
+            raw = row.get(columns[name])
+            try:
+                value = float(raw)
+            except (TypeError, ValueError):
+                value = np.nan
+            if not np.isfinite(value):
+                errors[i] = f"missing or invalid {columns[name]!r}: {raw!r}"
+                break
+            values[i, j] = value
+
+    valid = np.flatnonzero([error is None for error in errors])
+    result = breakdown_batch(values[valid]) if len(valid) else {"pi": np.array([]), "class": np.array([])}
+    pis, classes = result["pi"].tolist(), result["class"].tolist()
+
+    scores: List[RowScore] = [(None, None, [], error) for error in errors]
+    similar_memo: Dict[Tuple, List[Dict[str, Any]]] = {}
+    hp_column, weight_column = PI_INPUTS.index("hp"), PI_INPUTS.index("weight")
+    for position, row_index in enumerate(valid.tolist()):
+        pi, forza_class = pis[position], classes[position]
+        similar: List[Dict[str, Any]] = []
+        if similar_count > 0:
+            if similar_by == "specs":
+                key = (pi, values[row_index, hp_column], values[row_index, weight_column])
+            else:
+                key = (pi, forza_class)
+            similar = similar_memo.get(key)
+            if similar is None:
+                if similar_by == "specs":
+                    cars = get_similar_cars_by_specs(*key, num_cars=similar_count)
+                else:
+                    cars = get_similar_cars(pi, forza_class, similar_count)
+                similar = similar_memo[key] = [_similar_summary(car) for car in cars]
+        scores[row_index] = (pi, forza_class, similar, None)
+    return scores
+
+def _init_worker():
+    # The parent handles Ctrl+C and shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Parse the car catalog once per worker rather than per chunk
+    get_car_catalog()
+
+def score_stream(rows: Iterable[Dict[str, Any]], columns: Dict[str, str], chunk_size: int, workers: int,
+                 similar_count: int, similar_by: str = "pi"
+                 ) -> Iterator[Tuple[List[Dict[str, Any]], List[RowScore]]]:
+    """
+    Yield (rows, scores) per chunk, in input order
+
+    With workers > 1 chunks are scored on a process pool. At most
+    max_in_flight chunks per worker are read ahead, so memory stays bounded
+    however large the input is.
+    """
+    if workers <= 1:
+        for chunk in _chunks(rows, chunk_size):
+            yield chunk, score_chunk(chunk, columns, similar_count, similar_by)
+        return
+
+    limit = workers * FLEET_SCORING_CONFIG["max_in_flight"]
+    executor: Executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    pending: Deque[Tuple[List[Dict[str, Any]], Future]] = deque()
+    try:
+        for chunk in _chunks(rows, chunk_size):
+            pending.append((chunk, executor.submit(score_chunk, chunk, columns, similar_count, similar_by)))
+            if len(pending) >= limit:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+        while pending:
+            chunk, future = pending.popleft()
+            yield chunk, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def _similar_text(similar: List[Dict[str, Any]]) -> str:
+    return "; ".join(f"{car['year']} {car['make']} {car['model']} ({car['pi']})" for car in similar)
+
+class ResultWriter:
+    """Writes scored rows as CSV (input columns + RESULT_FIELDS) or JSONL
+
+    CSV columns are fixed by the first chunk, or passed in as fields when
+    appending to an earlier run; keys that only appear later are dropped
+    with a warning. Unparseable JSONL lines keep their text in JSONL output
+    only.
+    """
+
+    def __init__(self, stream: IO[str], fmt: str, write_header: bool = True,
+                 fields: Optional[List[str]] = None):
+        self.stream = stream
+        self.fmt = fmt
+        self.write_header = write_header
+        # Input columns of the CSV output, once known
+        self.fields = fields
+        self._csv: Optional[csv.DictWriter] = None
+        self._fields: Set[str] = set()
+        self._warned = False
+
+    def write(self, rows: List[Dict[str, Any]], scores: List[RowScore]):
+        if self.fmt == "jsonl":
+            lines = []
+            for row, (pi, forza_class, similar, error) in zip(rows, scores):
+                row = {key: value for key, value in row.items() if key != "_error"}
+                lines.append(json.dumps({**row, "pi": pi, "class": forza_class,
+                                         "similar_cars": similar, "error": error}, separators=(",", ":")))
+            self.stream.write("\n".join(lines) + "\n")
+            return
+
+        if self._csv is None:
+            if self.fields is None:
+                # Columns are the keys of the first chunk's parsed rows, in first-seen order
+                self.fields = list(dict.fromkeys(
+                    key for row in rows if "_error" not in row for key in row if key not in RESULT_FIELDS
+                ))
+            self._fields = set(self.fields) | set(RESULT_FIELDS) | {"_raw", "_error"}
+            self._csv = csv.DictWriter(self.stream, self.fields + list(RESULT_FIELDS), extrasaction="ignore")
+            if self.write_header:
+                self._csv.writeheader()
+        if not self._warned:
+            dropped = {key for row in rows for key in row if key not in self._fields}
+            if dropped:
+                self._warned = True
+                print(f"Warning: CSV output has no column for {', '.join(sorted(dropped))}; "
+                      f"use --output-format jsonl to keep every key", file=sys.stderr)
+        self._csv.writerows({**row, "pi": pi, "class": forza_class, "similar_cars": _similar_text(similar),
+                             "error": error}
+                            for row, (pi, forza_class, similar, error) in zip(rows, scores))
+
+class Checkpoint:
+    """Rows done, output size and CSV columns, saved atomically after each chunk
+
+    Resuming skips that many input rows, truncates the output back to the
+    recorded size (dropping anything written after the last save) and keeps
+    writing under the recorded CSV header.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Tuple[int, int, Optional[List[str]]]:
+        """(rows done, output bytes, CSV input columns), or (0, 0, None) without a checkpoint"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            fields = data.get("fields")
+            if fields is not None and not (isinstance(fields, list) and all(isinstance(name, str) for name in fields)):
+                raise ValueError("fields must be a list of column names")
+            return int(data["rows_done"]), int(data["output_bytes"]), fields
+        except FileNotFoundError:
+            return 0, 0, None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Unreadable checkpoint {self.path}: {e}")
+
+    def save(self, rows_done: int, output_bytes: int, fields: Optional[List[str]] = None):
+        with atomic_write(self.path, encoding="utf-8") as f:
+            json.dump({"rows_done": rows_done, "output_bytes": output_bytes, "fields": fields,
+                       "updated": time.time()}, f)
+
+    def remove(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+class Progress:
+    """Rate-limited rows, throughput and percent-of-input lines on stderr"""
+
+    def __init__(self, input_size: Optional[int] = None, position=None, interval: float = 1.0,
+                 stream: IO[str] = sys.stderr):
+        self.input_size = input_size
+        self.position = position
+        self.interval = interval
+        self.stream = stream
+        self.start = self._last = time.perf_counter()
+
+    def update(self, rows: int, force: bool = False):
+        now = time.perf_counter()
+        if not force and now - self._last < self.interval:
+            return
+        self._last = now
+        elapsed = max(now - self.start, 1e-9)
+        line = f"{rows:,} rows scored, {rows / elapsed:,.0f} rows/s"
+        if self.input_size and self.position is not None:
+            line += f", {min(100.0, 100.0 * self.position() / self.input_size):.1f}% of input read"
+        print(line, file=self.stream, flush=True)
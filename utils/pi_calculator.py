@@ -4,8 +4,42 @@ PI calculation module for Forza PI Calculator
 Handles all Performance Index calculations and performance breakdowns
 """
 
-from typing import Dict, Tuple
-from config.settings import PI_CALCULATION, CLASS_COLORS
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Union
+import numpy as np
+from config.settings import PI_CALCULATION, PI_CACHE_CONFIG, CLASS_COLORS
+
+# Input columns accepted by the batch functions, in calculate_pi argument order
+PI_INPUTS = ("hp", "weight", "top_speed", "acceleration", "handling", "braking")
+
+# Breakdown components, in the order they are summed into PI
+PI_COMPONENTS = ("power", "weight", "speed", "acceleration", "handling", "braking")
+
+# (component, input column, config key prefix, higher input is better)
+_COMPONENT_SPECS = (
+    ("power", "hp", "power", True),
+    ("weight", "weight", "weight", False),
+    ("speed", "top_speed", "speed", True),
+    ("acceleration", "acceleration", "acceleration", False),
+    ("handling", "handling", "handling", True),
+    ("braking", "braking", "braking", False),
+)
+
+def _pi_terms(hp: float, weight: float, top_speed: float, acceleration: float,
+              handling: float, braking: float) -> Dict[str, float]:
+    """Compute the unrounded contribution of each metric to PI"""
+    calc_config = PI_CALCULATION
+
+    return {
+        "power": (hp / calc_config["power_max"]) * calc_config["power_weight"],
+        "weight": ((calc_config["weight_max"] - weight) / calc_config["weight_max"]) * calc_config["weight_weight"],
+        "speed": (top_speed / calc_config["speed_max"]) * calc_config["speed_weight"],
+        "acceleration": ((calc_config["acceleration_max"] - acceleration) / calc_config["acceleration_max"]) * calc_config["acceleration_weight"],
+        "handling": (handling / calc_config["handling_max"]) * calc_config["handling_weight"],
+        "braking": ((calc_config["braking_max"] - braking) / calc_config["braking_max"]) * calc_config["braking_weight"]
+    }
 
 def calculate_pi(hp: float, weight: float, top_speed: float, acceleration: float, 
                 handling: float, braking: float) -> int:
@@ -14,14 +48,7 @@ def calculate_pi(hp: float, weight: float, top_speed: float, acceleration: float
     # Use constants from settings
     calc_config = PI_CALCULATION
     
-    pi = (
-        (hp / calc_config["power_max"]) * calc_config["power_weight"] +
-        ((calc_config["weight_max"] - weight) / calc_config["weight_max"]) * calc_config["weight_weight"] +
-        (top_speed / calc_config["speed_max"]) * calc_config["speed_weight"] +
-        ((calc_config["acceleration_max"] - acceleration) / calc_config["acceleration_max"]) * calc_config["acceleration_weight"] +
-        (handling / calc_config["handling_max"]) * calc_config["handling_weight"] +
-        ((calc_config["braking_max"] - braking) / calc_config["braking_max"]) * calc_config["braking_weight"]
-    )
+    pi = sum(_pi_terms(hp, weight, top_speed, acceleration, handling, braking).values())
     
     # Clamp PI to valid range
     pi = round(min(max(pi, calc_config["pi_min"]), calc_config["pi_max"]))
@@ -32,39 +59,139 @@ def get_performance_breakdown(hp: float, weight: float, top_speed: float,
                             acceleration: float, handling: float, braking: float) -> Dict[str, int]:
     """Calculate individual performance metric contributions to PI"""
     
-    calc_config = PI_CALCULATION
+    terms = _pi_terms(hp, weight, top_speed, acceleration, handling, braking)
     
-    return {
-        "power": round((hp / calc_config["power_max"]) * calc_config["power_weight"]),
-        "weight": round(((calc_config["weight_max"] - weight) / calc_config["weight_max"]) * calc_config["weight_weight"]),
-        "speed": round((top_speed / calc_config["speed_max"]) * calc_config["speed_weight"]),
-        "acceleration": round(((calc_config["acceleration_max"] - acceleration) / calc_config["acceleration_max"]) * calc_config["acceleration_weight"]),
-        "handling": round((handling / calc_config["handling_max"]) * calc_config["handling_weight"]),
-        "braking": round(((calc_config["braking_max"] - braking) / calc_config["braking_max"]) * calc_config["braking_weight"])
-    }
+    return {component: round(value) for component, value in terms.items()}
+
+# Class boundaries used until set_class_definitions() loads them from forza_cars.json
+DEFAULT_CLASS_DEFINITIONS = {
+    "D": {"min_pi": 100, "max_pi": 299},
+    "C": {"min_pi": 300, "max_pi": 399},
+    "B": {"min_pi": 400, "max_pi": 499},
+    "A": {"min_pi": 500, "max_pi": 599},
+    "S1": {"min_pi": 600, "max_pi": 699},
+    "S2": {"min_pi": 700, "max_pi": 799},
+    "X": {"min_pi": 800, "max_pi": 999},
+}
+
+class ClassTable:
+    """Precomputed PI -> class lookup built from class definitions
+
+    Each class covers [min_pi, next class's min_pi); PI below the first
+    class or above the last one takes that class, as does anything past
+    the end of the table.
+    """
+
+    __slots__ = ("labels", "label_array", "thresholds", "ranges", "by_pi")
+
+    def __init__(self, definitions: Mapping[str, Mapping[str, int]]):
+        try:
+            bounds = sorted((int(spec["min_pi"]), int(spec["max_pi"]), label) for label, spec in definitions.items())
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Class definitions need integer min_pi and max_pi: {e}")
+        if not bounds:
+            raise ValueError("Class definitions are empty")
+        for (low, _, label), (next_low, _, next_label) in zip(bounds, bounds[1:]):
+            if next_low <= low:
+                raise ValueError(f"Classes {label} and {next_label} start at the same PI")
+
+        self.labels = tuple(label for _, _, label in bounds)
+        self.label_array = np.array(self.labels)
+        # Lower PI bound of each class after the first
+        self.thresholds = np.array([low for low, _, _ in bounds[1:]], dtype=np.int64)
+        self.ranges = {
+            label: (low, high if i == len(bounds) - 1 else bounds[i + 1][0] - 1)
+            for i, (low, high, label) in enumerate(bounds)
+        }
+        table_size = max(PI_CALCULATION["pi_max"], bounds[-1][0]) + 1
+        indices = np.searchsorted(self.thresholds, np.arange(table_size), side="right")
+        self.by_pi = [self.labels[i] for i in indices.tolist()]
+
+_class_table = ClassTable(DEFAULT_CLASS_DEFINITIONS)
+
+def set_class_definitions(definitions: Mapping[str, Mapping[str, int]]):
+    """Replace the class boundaries, e.g. with forza_cars.json class_definitions
+
+    Raises ValueError if the definitions are malformed; the current
+    boundaries are kept in that case.
+    """
+    global _class_table
+    table = ClassTable(definitions)
+    if table.labels == _class_table.labels and table.ranges == _class_table.ranges:
+        return
+    _class_table = table
+    clear_pi_cache()
 
 def determine_forza_class(pi: int) -> str:
     """Determine Forza class based on PI value"""
-    if pi < 300:
-        return "D"
-    elif pi < 400:
-        return "C"
-    elif pi < 500:
-        return "B"
-    elif pi < 600:
-        return "A"
-    elif pi < 700:
-        return "S1"
-    elif pi < 800:
-        return "S2"
-    else:
-        return "X"
+    by_pi = _class_table.by_pi
+    if 0 <= pi < len(by_pi):
+        return by_pi[int(pi)]
+    return by_pi[0] if pi < 0 else by_pi[-1]
 
 def get_class_info(forza_class: str) -> Tuple[str, str]:
     """Get CSS class and color for a Forza class"""
     class_info = CLASS_COLORS.get(forza_class, {"css": "", "color": "#ffffff"})
     return class_info["css"], class_info["color"]
 
+def get_class_pi_range(forza_class: str) -> Tuple[int, int]:
+    """Get the inclusive (min, max) PI range of a Forza class"""
+    ranges = _class_table.ranges
+    if forza_class not in ranges:
+        raise ValueError(f"Unknown Forza class: {forza_class}")
+    return ranges[forza_class]
+
+@dataclass(frozen=True, slots=True)
+class PIEvaluation:
+    """PI, class and per-component breakdown for one set of inputs"""
+    pi: int
+    forza_class: str
+    breakdown: Mapping[str, int]
+
+def _config_fingerprint() -> Tuple:
+    return tuple(PI_CALCULATION.items())
+
+def _evaluate(hp: float, weight: float, top_speed: float, acceleration: float,
+              handling: float, braking: float) -> PIEvaluation:
+    terms = _pi_terms(hp, weight, top_speed, acceleration, handling, braking)
+    pi = round(min(max(sum(terms.values()), PI_CALCULATION["pi_min"]), PI_CALCULATION["pi_max"]))
+    breakdown = MappingProxyType({component: round(value) for component, value in terms.items()})
+    return PIEvaluation(pi, determine_forza_class(pi), breakdown)
+
+_evaluate_cached = lru_cache(maxsize=PI_CACHE_CONFIG["maxsize"])(_evaluate)
+
+_cache_fingerprint = _config_fingerprint()
+
+def clear_pi_cache():
+    """Drop all memoized evaluations, e.g. after changing PI_CALCULATION"""
+    global _cache_fingerprint
+    _evaluate_cached.cache_clear()
+    _cache_fingerprint = _config_fingerprint()
+
+def pi_cache_info():
+    """Hits, misses, maxsize and current size of the evaluation cache"""
+    return _evaluate_cached.cache_info()
+
+def evaluate_pi(hp: float, weight: float, top_speed: float, acceleration: float,
+                handling: float, braking: float) -> PIEvaluation:
+    """
+    Calculate PI, class and performance breakdown in one pass
+
+    Inputs already at the resolution of PI_CACHE_CONFIG["input_decimals"]
+    (everything the input widgets produce) are memoized; finer inputs are
+    calculated exactly without touching the cache. The cache is
+    process-wide (shared by every Streamlit session) and is cleared
+    automatically when PI_CALCULATION changes.
+    """
+    if _config_fingerprint() != _cache_fingerprint:
+        clear_pi_cache()
+
+    inputs = (hp, weight, top_speed, acceleration, handling, braking)
+    decimals = PI_CACHE_CONFIG["input_decimals"]
+    if all(value == round(value, decimals[name]) for name, value in zip(PI_INPUTS, inputs)):
+        return _evaluate_cached(*inputs)
+    return _evaluate(*inputs)
+
 def validate_input_ranges(hp: float, weight: float, top_speed: float, 
                          acceleration: float, handling: float, braking: float) -> Dict[str, str]:
     """Validate input values and return any warnings"""
@@ -88,4 +215,135 @@ def validate_input_ranges(hp: float, weight: float, top_speed: float,
     if braking < 80 or braking > 200:
         warnings["braking"] = "Braking distance seems unusual (typical range: 80-200 feet)"
     
-    return warnings
\ No newline at end of file
+    return warnings
+
+class PIBatchBuffers:
+    """Preallocated output and scratch arrays for repeated batch calculations
+
+    Pass the same instance as ``out`` to the batch functions to score
+    successive chunks without allocating new arrays. Chunks may be smaller
+    than the buffer; results are returned as views of the leading rows.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.pi = np.empty(size, dtype=np.int64)
+        self.forza_class = np.empty(size, dtype=_class_table.label_array.dtype)
+        self.components = {component: np.empty(size, dtype=np.int64) for component in PI_COMPONENTS}
+        self.total = np.empty(size, dtype=np.float64)
+        self.term = np.empty(size, dtype=np.float64)
+
+    def view(self, rows: int) -> "PIBatchBuffers":
+        """Return buffers restricted to the first rows entries"""
+        if rows > self.size:
+            raise ValueError(f"Batch of {rows} rows does not fit buffers of size {self.size}")
+        if rows == self.size:
+            return self
+        view = PIBatchBuffers.__new__(PIBatchBuffers)
+        view.size = rows
+        view.pi = self.pi[:rows]
+        view.forza_class = self.forza_class[:rows]
+        view.components = {component: array[:rows] for component, array in self.components.items()}
+        view.total = self.total[:rows]
+        view.term = self.term[:rows]
+        return view
+
+    def fit_class_labels(self):
+        """Reallocate the class buffer if set_class_definitions installed longer labels"""
+        dtype = _class_table.label_array.dtype
+        if not np.can_cast(dtype, self.forza_class.dtype, casting="safe"):
+            self.forza_class = np.empty(self.size, dtype=dtype)
+
+SpecColumns = Union[Mapping[str, np.ndarray], np.ndarray]
+
+def _batch_columns(specs: SpecColumns) -> Dict[str, np.ndarray]:
+    """Normalize a columnar dict, structured array or (n, 6) array into float64 columns"""
+    if isinstance(specs, np.ndarray) and specs.dtype.names is None:
+        if specs.ndim != 2 or specs.shape[1] != len(PI_INPUTS):
+            raise ValueError(f"Expected an (n, {len(PI_INPUTS)}) array with columns {PI_INPUTS}")
+        return {name: np.asarray(specs[:, i], dtype=np.float64) for i, name in enumerate(PI_INPUTS)}
+
+    try:
+        columns = {name: np.asarray(specs[name], dtype=np.float64) for name in PI_INPUTS}
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Batch specs must provide columns {PI_INPUTS}: {e}")
+
+    sizes = {column.shape for column in columns.values()}
+    if len(sizes) != 1 or len(next(iter(sizes))) != 1:
+        raise ValueError("Batch spec columns must be one-dimensional and of equal length")
+    return columns
+
+def _accumulate_batch(columns: Dict[str, np.ndarray], buffers: PIBatchBuffers, with_components: bool):
+    """Single vectorized pass over the six terms, mirroring _pi_terms operation order"""
+    calc_config = PI_CALCULATION
+    total, term = buffers.total, buffers.term
+
+    for i, (component, column, prefix, direct) in enumerate(_COMPONENT_SPECS):
+        metric_max = calc_config[f"{prefix}_max"]
+        target = total if i == 0 else term
+
+        if direct:
+            np.divide(columns[column], metric_max, out=target)
+        else:
+            np.subtract(metric_max, columns[column], out=target)
+            np.divide(target, metric_max, out=target)
+        np.multiply(target, calc_config[f"{prefix}_weight"], out=target)
+
+        if with_components:
+            component_out = buffers.components[component]
+            if i == 0:
+                # total is still the bare power term here; round via term to keep it intact
+                np.rint(target, out=term)
+                component_out[...] = term
+            else:
+                np.add(total, target, out=total)
+                np.rint(target, out=target)
+                component_out[...] = target
+        elif i > 0:
+            np.add(total, target, out=total)
+
+    np.clip(total, calc_config["pi_min"], calc_config["pi_max"], out=total)
+    np.rint(total, out=total)
+    buffers.pi[...] = total
+
+def calculate_pi_batch(specs: SpecColumns, out: Optional[PIBatchBuffers] = None) -> np.ndarray:
+    """Vectorized calculate_pi over columns of vehicle specifications"""
+    columns = _batch_columns(specs)
+    rows = len(columns["hp"])
+    buffers = PIBatchBuffers(rows) if out is None else out.view(rows)
+
+    _accumulate_batch(columns, buffers, with_components=False)
+    return buffers.pi
+
+def classify_pi_batch(pis: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Vectorized determine_forza_class over an array of PI values
+
+    out must be able to hold the longest class label; a ValueError is
+    raised rather than truncating labels.
+    """
+    table = _class_table
+    indices = np.searchsorted(table.thresholds, pis, side="right")
+    if out is None:
+        return table.label_array[indices]
+    if not np.can_cast(table.label_array.dtype, out.dtype, casting="safe"):
+        raise ValueError(f"Output dtype {out.dtype} cannot hold class labels of dtype {table.label_array.dtype}")
+    np.take(table.label_array, indices, out=out)
+    return out
+
+def breakdown_batch(specs: SpecColumns, out: Optional[PIBatchBuffers] = None) -> Dict[str, np.ndarray]:
+    """Vectorized PI, class and get_performance_breakdown in one pass
+
+    Returns a dict with "pi", "class" and one array per PI component.
+    """
+    columns = _batch_columns(specs)
+    rows = len(columns["hp"])
+    if out is not None:
+        out.fit_class_labels()
+    buffers = PIBatchBuffers(rows) if out is None else out.view(rows)
+
+    _accumulate_batch(columns, buffers, with_components=True)
+    classify_pi_batch(buffers.pi, out=buffers.forza_class)
+
+    result = {"pi": buffers.pi, "class": buffers.forza_class}
+    result.update(buffers.components)
+    return result
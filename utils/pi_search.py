@@ -0,0 +1,91 @@
+# utils/pi_search.py
+"""
+Nearest-PI search engine for Forza PI Calculator
+Sorted PI columns answering k-nearest queries by two-pointer expansion
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import islice
+from typing import Any, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class NearestPIIndex(Generic[T]):
+    """Immutable PI-sorted column with the matching items alongside
+
+    Items are ordered by (PI, original position). A query bisects to the
+    target PI and walks two pointers outward, so the k nearest items cost
+    O(log n + k), ties included. Items at the same PI distance come back in
+    original position order, which matches a stable sort by ``abs(pi - target)``.
+    """
+
+    __slots__ = ("pis", "positions", "items")
+
+    def __init__(self, rows: Iterable[Tuple[int, int, T]] = ()):
+        rows = sorted(rows, key=lambda row: (row[0], row[1]))
+        self.pis = array('q', (row[0] for row in rows))
+        self.positions = array('q', (row[1] for row in rows))
+        self.items: List[T] = [row[2] for row in rows]
+
+    @classmethod
+    def from_items(cls, pairs: Iterable[Tuple[int, T]]) -> "NearestPIIndex[T]":
+        """Build from (pi, item) pairs, using their order as the tie-break position"""
+        return cls((pi, position, item) for position, (pi, item) in enumerate(pairs))
+
+    def __len__(self) -> int:
+        return len(self.pis)
+
+    def rows(self) -> Iterator[Tuple[int, int, T]]:
+        """Iterate (pi, position, item) rows in PI order"""
+        return zip(self.pis, self.positions, self.items)
+
+    def iter_nearest(self, target: float, min_pi: Optional[float] = None,
+                     max_pi: Optional[float] = None) -> Iterator[Tuple[int, T]]:
+        """Yield (pi, item) pairs by increasing distance to target, within [min_pi, max_pi]"""
+        pis, positions, items = self.pis, self.positions, self.items
+        lo = 0 if min_pi is None else bisect_left(pis, min_pi)
+        hi = len(pis) if max_pi is None else bisect_right(pis, max_pi)
+        if lo >= hi:
+            return
+
+        right = min(max(bisect_left(pis, target, lo, hi), lo), hi)
+        left = right - 1
+
+        while left >= lo or right < hi:
+            left_gap = target - pis[left] if left >= lo else None
+            right_gap = pis[right] - target if right < hi else None
+            if right_gap is None or (left_gap is not None and left_gap < right_gap):
+                gap = left_gap
+            else:
+                gap = right_gap
+
+            # Rows at this distance form at most two runs (one per side), each
+            # already in position order; merge them lazily so ties stay cheap
+            runs = []
+            if left >= lo and target - pis[left] == gap:
+                start = bisect_left(pis, pis[left], lo, left + 1)
+                runs.append(range(start, left + 1))
+                left = start - 1
+            if right < hi and pis[right] - target == gap:
+                end = bisect_right(pis, pis[right], right, hi)
+                runs.append(range(right, end))
+                right = end
+            rows = runs[0] if len(runs) == 1 else merge(*runs, key=positions.__getitem__)
+            for row in rows:
+                yield pis[row], items[row]
+
+    def nearest(self, target: float, count: int) -> List[T]:
+        """Return the count items closest in PI to target"""
+        if count <= 0:
+            return []
+        return [item for _, item in islice(self.iter_nearest(target), count)]
+
+    def range(self, min_pi: float, max_pi: float) -> List[T]:
+        """Return the items with min_pi <= PI <= max_pi, in PI order"""
+        return self.items[bisect_left(self.pis, min_pi):bisect_right(self.pis, max_pi)]
+
+def merge_indexes(indexes: Iterable[Optional[NearestPIIndex[Any]]]) -> NearestPIIndex[Any]:
+    """Combine several indexes built over the same position space"""
+    return NearestPIIndex(row for index in indexes if index is not None for row in index.rows())
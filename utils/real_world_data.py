@@ -6,13 +6,27 @@ Integrates with external data sources for authentic vehicle specifications
 
 import csv
 import json
+import math
 import requests
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Any
+from dataclasses import dataclass, fields, replace
 from datetime import datetime, timedelta
 import os
+import re
+import threading
+import time
+from collections import Counter
+import numpy as np
+from config.settings import FUZZY_MATCH_CONFIG, REAL_WORLD_DATA_CONFIG
+from utils.cache_paths import find_writable_cache_dir
+from utils.columnar_cache import ColumnarCacheError, ColumnarFile, ColumnarRows, write_columnar
+from utils.file_cache import atomic_write, file_lock, file_signature
+from utils.records import frozen_variant, record_from_dict, record_to_dict
+from utils.pi_calculator import get_class_pi_range
+from utils.pi_search import NearestPIIndex
 
-@dataclass
+@dataclass(slots=True)
 class RealWorldVehicle:
     """Data class for real-world vehicle specifications"""
     year: int
@@ -41,37 +55,465 @@ class RealWorldVehicle:
     calculated_pi: Optional[int] = None
     pi_source: Optional[str] = None
     confidence_score: Optional[float] = None
+    pi_version: Optional[int] = None  # ENHANCED_PI_VERSION that calculated_pi was computed with
     
     # Metadata
     data_source: Optional[str] = None
     last_updated: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Field values in the cache's JSON shape"""
+        return record_to_dict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RealWorldVehicle":
+        return record_from_dict(cls, data)
+    
+    def freeze(self) -> "FrozenRealWorldVehicle":
+        return FrozenRealWorldVehicle(**record_to_dict(self))
+
+# Immutable RealWorldVehicle, e.g. for rows shared between sessions
+FrozenRealWorldVehicle = frozen_variant(RealWorldVehicle)
+
+def _column_kind(annotation: Any) -> str:
+    base = next(arg for arg in getattr(annotation, "__args__", (annotation,)) if arg is not type(None))
+    return {int: "int", float: "float", str: "str"}[base]
+
+# Columnar cache schema, one fixed-width column per RealWorldVehicle field
+VEHICLE_COLUMNS = tuple((field.name, _column_kind(field.type)) for field in fields(RealWorldVehicle))
+
+def _vehicle_columns(vehicles: Sequence[RealWorldVehicle], names: Sequence[str]) -> List[List[Any]]:
+    """Field values per name; columnar snapshots are read without building rows"""
+    if isinstance(vehicles, ColumnarRows):
+        return [vehicles.column(name) for name in names]
+    return [[getattr(vehicle, name) for vehicle in vehicles] for name in names]
+
+def _vehicle_keys(vehicles: Sequence[RealWorldVehicle]) -> Iterable[Tuple[int, str, str]]:
+    """(year, make, model) per vehicle"""
+    return zip(*_vehicle_columns(vehicles, ("year", "make", "model")))
+
+class VehicleIndex:
+    """Normalized (make, model) -> year-sorted lookup over a vehicle list
+    
+    Each key holds (year, position) pairs sorted by year and then by
+    position in the source list, so exact-year and year-window matches are
+    a dictionary lookup plus a bisect and still return the vehicle that a
+    front-to-back scan would have found first. A lazy index is built on
+    first use, which keeps loading a columnar cache O(1).
+    """
+    
+    def __init__(self, vehicles: Sequence[RealWorldVehicle] = (), lazy: bool = False):
+        self._source = vehicles
+        self._lock = threading.Lock()
+        self._by_key: Optional[Dict[Tuple[str, str], List[Tuple[int, int]]]] = None
+        if not lazy:
+            self._entries()
+    
+    def _entries(self) -> Dict[Tuple[str, str], List[Tuple[int, int]]]:
+        by_key = self._by_key
+        if by_key is None:
+            with self._lock:
+                if self._by_key is None:
+                    by_key = {}
+                    for position, (year, make, model) in enumerate(_vehicle_keys(self._source)):
+                        by_key.setdefault(self.key(make, model), []).append((year, position))
+                    for entries in by_key.values():
+                        entries.sort()
+                    self._by_key, self._source = by_key, ()
+                by_key = self._by_key
+        return by_key
+    
+    @staticmethod
+    def key(make: str, model: str) -> Tuple[str, str]:
+        """Normalize a stored make/model pair the way find_vehicle_match compares it"""
+        return (make.lower(), model.lower())
+    
+    def add(self, vehicle: RealWorldVehicle, position: int):
+        """Index a vehicle appended at position"""
+        insort(self._entries().setdefault(self.key(vehicle.make, vehicle.model), []), (vehicle.year, position))
+    
+    def extended(self, vehicles: Sequence[RealWorldVehicle], start: int) -> "VehicleIndex":
+        """
+        New index that also covers vehicles appended at positions start onwards
+        
+        This index is left untouched; only the entry lists the new vehicles
+        land in are copied.
+        """
+        entries = self._entries()
+        by_key = dict(entries)
+        copied = set()
+        for position, vehicle in enumerate(vehicles, start):
+            key = self.key(vehicle.make, vehicle.model)
+            if key not in copied:
+                by_key[key] = list(entries.get(key, ()))
+                copied.add(key)
+            insort(by_key[key], (vehicle.year, position))
+        index = VehicleIndex()
+        index._by_key = by_key
+        return index
+    
+    def positions(self, key: Tuple[str, str], min_year: int, max_year: int) -> List[int]:
+        """Positions of vehicles with this key and min_year <= year <= max_year, in year order"""
+        entries = self._entries().get(key)
+        if not entries:
+            return []
+        start = bisect_left(entries, (min_year, -1))
+        end = bisect_right(entries, (max_year, float("inf")))
+        return [position for _, position in entries[start:end]]
+
+# Rows converted per batch while streaming a CSV update
+CSV_INGEST_CHUNK_ROWS = 5000
+
+# Alternative spellings of makes, mapped to one canonical name
+MAKE_ALIASES = {
+    "mercedes-benz": "mercedes", "mercedes benz": "mercedes", "mercedes-amg": "mercedes",
+    "mercedes amg": "mercedes", "amg": "mercedes", "mb": "mercedes",
+    "chevy": "chevrolet", "vw": "volkswagen", "volkswagen ag": "volkswagen",
+    "bmw m": "bmw", "bmw alpina": "bmw", "alfa": "alfa romeo",
+    "landrover": "land rover", "range rover": "land rover",
+    "mini cooper": "mini", "gmc truck": "gmc", "ram trucks": "ram",
+    "aston": "aston martin", "rolls royce": "rolls-royce",
+}
+
+# Words that name a model line rather than distinguish it
+MODEL_STOPWORDS = frozenset({"class", "series", "serie", "model"})
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_FAMILY_PREFIX = re.compile(r"^[a-z]+")
+
+def _normalize_text(text: str) -> str:
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+def _canonical_make(make: str) -> str:
+    make = make.lower().strip()
+    if make in MAKE_ALIASES:
+        return MAKE_ALIASES[make]
+    normalized = _normalize_text(make)
+    return MAKE_ALIASES.get(normalized, normalized)
+
+def _model_tokens(model: str) -> str:
+    tokens = [token for token in _normalize_text(model).split() if token not in MODEL_STOPWORDS]
+    return " ".join(tokens)
+
+def _model_family(model_tokens: str) -> Tuple[str, bool]:
+    """
+    Leading letters of the first token, e.g. "e" for both E-Class and E63 S,
+    and whether that token is the bare model-line name (E-Class) rather than
+    a variant of it (E63)
+    """
+    first = model_tokens.split(" ", 1)[0]
+    match = _FAMILY_PREFIX.match(first)
+    if not match:
+        return first, False
+    return match.group(0), match.group(0) == first
+
+def _same_family(query: Tuple[str, bool], other: Tuple[str, bool]) -> bool:
+    """E-Class / E63 agree; X5 / X3 or M340i / M5 only share a letter and do not"""
+    return bool(query[0]) and query[0] == other[0] and (query[1] or other[1])
+
+def _trigrams(text: str) -> List[str]:
+    padded = f"  {text} "
+    return list({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+class FuzzyVehicleMatcher:
+    """Trigram index over distinct make/model pairs for approximate lookups
+    
+    Models are grouped by canonical make (see MAKE_ALIASES) and each group
+    has its own trigram inverted index, so a query only scores the models of
+    the makes it resembles. Candidates are ranked by a weighted blend of
+    make, model (trigram Dice coefficient, or model-family agreement) and
+    year closeness. Candidates whose model similarity falls below
+    min_model_score are dropped however well make and year agree.
+    """
+    
+    def __init__(self, vehicles: List[RealWorldVehicle]):
+        # Per distinct (canonical make, model tokens): trigram count, family, (year, position) list
+        self._keys: List[Tuple[str, str, int, Tuple[str, bool], List[Tuple[int, int]]]] = []
+        key_ids: Dict[Tuple[str, str], int] = {}
+        # canonical make -> trigram -> key ids
+        self._postings: Dict[str, Dict[str, List[int]]] = {}
+        self._make_trigrams: Dict[str, List[str]] = {}
+        
+        for position, (year, vehicle_make, vehicle_model) in enumerate(_vehicle_keys(vehicles)):
+            make = _canonical_make(vehicle_make)
+            model = _model_tokens(vehicle_model)
+            key_id = key_ids.get((make, model))
+            if key_id is None:
+                key_id = len(self._keys)
+                key_ids[(make, model)] = key_id
+                grams = _trigrams(model)
+                self._keys.append((make, model, len(grams), _model_family(model), []))
+                postings = self._postings.setdefault(make, {})
+                for gram in grams:
+                    postings.setdefault(gram, []).append(key_id)
+                if make not in self._make_trigrams:
+                    self._make_trigrams[make] = _trigrams(make)
+            self._keys[key_id][4].append((year, position))
+        
+        for key in self._keys:
+            key[4].sort()
+    
+    @staticmethod
+    def _dice(query: List[str], other: List[str]) -> float:
+        if not query or not other:
+            return 0.0
+        return 2 * len(set(query) & set(other)) / (len(query) + len(other))
+    
+    def _candidate_makes(self, make: str) -> List[Tuple[str, float]]:
+        """Makes in the index with their similarity to the query make"""
+        canonical = _canonical_make(make)
+        if canonical in self._postings:
+            return [(canonical, 1.0)]
+        query = _trigrams(canonical)
+        scored = [(known, self._dice(query, grams)) for known, grams in self._make_trigrams.items()]
+        return [(known, score) for known, score in scored if score >= 0.5]
+    
+    def match(self, make: str, model: str, year: Optional[int] = None,
+              top_k: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Rank indexed vehicles against a make/model/year query
+        
+        Returns:
+            Up to top_k (position, score) pairs, best first; one vehicle per
+            distinct make/model, the one closest in year
+        """
+        config = FUZZY_MATCH_CONFIG
+        top_k = top_k or config["top_k"]
+        max_gap = config["max_year_gap"]
+        model_query = _model_tokens(model)
+        query_grams = _trigrams(model_query)
+        query_family = _model_family(model_query)
+        
+        results = []
+        for candidate_make, make_score in self._candidate_makes(make):
+            postings = self._postings[candidate_make]
+            overlaps = Counter()
+            for gram in query_grams:
+                overlaps.update(postings.get(gram, ()))
+            
+            # Same-family models share the leading "  x" trigram, so they are already candidates
+            for key_id in overlaps:
+                _, _, gram_count, family, years = self._keys[key_id]
+                model_score = 2 * overlaps[key_id] / (len(query_grams) + gram_count)
+                if _same_family(query_family, family):
+                    model_score = max(model_score, config["family_score"])
+                if model_score < config["min_model_score"]:
+                    continue
+                
+                position, year_score = self._closest_year(years, year, max_gap)
+                if position is None:
+                    continue
+                
+                score = (config["make_weight"] * make_score +
+                         config["model_weight"] * model_score +
+                         config["year_weight"] * year_score)
+                results.append((score, position))
+        
+        results.sort(key=lambda result: (-result[0], result[1]))
+        return [(position, round(score, 4)) for score, position in results[:top_k]]
+    
+    @staticmethod
+    def _closest_year(years: List[Tuple[int, int]], year: Optional[int],
+                      max_gap: int) -> Tuple[Optional[int], float]:
+        """Pick the row closest to year (earliest position on ties) and score the gap"""
+        if year is None:
+            return min(position for _, position in years), 1.0
+        
+        start = bisect_left(years, (year - max_gap, -1))
+        end = bisect_right(years, (year + max_gap, float("inf")))
+        if start == end:
+            return None, 0.0
+        gap, position = min((abs(row_year - year), position) for row_year, position in years[start:end])
+        return position, 1 - gap / (max_gap + 1)
+
+class VehiclePIIndex:
+    """PI-sorted view over the precomputed enhanced PIs of a vehicle list
+    
+    Backed by NearestPIIndex, so a PI window is two bisects and candidates
+    come out nearest-first. Drivetrain, body style and year are kept as
+    normalized columns so filtering never builds vehicle objects.
+    """
+    
+    def __init__(self, vehicles: Sequence[RealWorldVehicle]):
+        pis, years, drivetrains, body_styles = _vehicle_columns(
+            vehicles, ("calculated_pi", "year", "drivetrain", "body_style"))
+        self._index: NearestPIIndex[int] = NearestPIIndex(
+            (pi, position, position) for position, pi in enumerate(pis) if pi is not None
+        )
+        self._years = years
+        self._drivetrains = [value.lower() if value else "" for value in drivetrains]
+        self._body_styles = [value.lower() if value else "" for value in body_styles]
+    
+    def search(self, target_pi: float, min_pi: Optional[float] = None, max_pi: Optional[float] = None,
+               drivetrain: Optional[str] = None, body_style: Optional[str] = None,
+               min_year: Optional[int] = None, max_year: Optional[int] = None,
+               limit: int = 10) -> List[int]:
+        """
+        Positions of matching vehicles, nearest to target_pi first
+        
+        drivetrain must match exactly and body_style as a substring, both
+        ignoring case; the year range is inclusive.
+        """
+        drivetrain = drivetrain.lower() if drivetrain else None
+        body_style = body_style.lower() if body_style else None
+        years, drivetrains, body_styles = self._years, self._drivetrains, self._body_styles
+        
+        positions = []
+        if limit <= 0:
+            return positions
+        for _, position in self._index.iter_nearest(target_pi, min_pi, max_pi):
+            if drivetrain is not None and drivetrains[position] != drivetrain:
+                continue
+            if body_style is not None and body_style not in body_styles[position]:
+                continue
+            year = years[position]
+            if (min_year is not None and year < min_year) or (max_year is not None and year > max_year):
+                continue
+            positions.append(position)
+            if len(positions) >= limit:
+                break
+        return positions
+
+# Numeric specs read by the enhanced PI formula; NaN in any of them counts as missing
+ENHANCED_PI_SPECS = ('horsepower', 'torque_lbft', 'weight_lbs', 'top_speed_mph', 'acceleration_0_60',
+                     'handling_g_force', 'braking_60_0_ft', 'engine_displacement_cc')
+
+def _without_nan_specs(vehicle: RealWorldVehicle) -> RealWorldVehicle:
+    """The vehicle itself, or a copy with NaN specs set to None as compute_enhanced_pi_batch reads them"""
+    missing = {name: None for name in ENHANCED_PI_SPECS
+               if isinstance(getattr(vehicle, name), float) and math.isnan(getattr(vehicle, name))}
+    return replace(vehicle, **missing) if missing else vehicle
+
+# Version of the enhanced PI formula in RealWorldDataManager.get_enhanced_pi_calculation
+# and compute_enhanced_pi_batch; bump it when either changes so cached results are recomputed
+ENHANCED_PI_VERSION = 1
+
+def _flag_column(values: List[Optional[str]], flag) -> np.ndarray:
+    """Apply flag(value) once per distinct string and spread the results over the rows"""
+    cache: Dict[Optional[str], Any] = {}
+    for value in values:
+        if value not in cache:
+            cache[value] = flag(value)
+    return np.array([cache[value] for value in values])
+
+def _handling_base(body_style: Optional[str]) -> float:
+    if not body_style:
+        return 0.85
+    body = body_style.lower()
+    if 'coupe' in body or 'roadster' in body:
+        return 1.0
+    if 'sedan' in body:
+        return 0.9
+    if 'suv' in body or 'truck' in body:
+        return 0.8
+    if 'hatch' in body:
+        return 0.95
+    return 0.85
+
+def _contains(needle: str):
+    return lambda value: bool(value) and needle in value.lower()
+
+def compute_enhanced_pi_batch(vehicles: Sequence[RealWorldVehicle]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized get_enhanced_pi_calculation over a whole dataset
+    
+    Performs the same floating-point operations in the same order as the
+    scalar path, so the results are identical. String checks run once per
+    distinct value.
+    
+    Returns:
+        (pi, confidence, enhanced) arrays aligned with vehicles; enhanced is
+        False where required data was missing and the basic formula was used
+    """
+    (horsepower, torque, weight, top_speed, accel, handling_g, braking_ft, displacement,
+     body_style, drivetrain, transmission, fuel_type) = _vehicle_columns(vehicles, (
+        'horsepower', 'torque_lbft', 'weight_lbs', 'top_speed_mph', 'acceleration_0_60',
+        'handling_g_force', 'braking_60_0_ft', 'engine_displacement_cc',
+        'body_style', 'drivetrain', 'transmission', 'fuel_type'))
+    
+    hp, tq, w, speed, a, g, b, cc = (np.array(column, dtype=float) for column in (
+        horsepower, torque, weight, top_speed, accel, handling_g, braking_ft, displacement))
+    present = {name: ~np.isnan(column) for name, column in
+               (('hp', hp), ('tq', tq), ('w', w), ('speed', speed), ('a', a), ('g', g), ('b', b), ('cc', cc))}
+    truthy = {name: mask & (column != 0) for (name, mask), column in
+              zip(present.items(), (hp, tq, w, speed, a, g, b, cc))}
+    awd = _flag_column(drivetrain, _contains('awd')).astype(bool)
+    
+    with np.errstate(invalid='ignore'):
+        enhanced = truthy['hp'] & truthy['w'] & truthy['speed'] & truthy['a']
+        
+        base_power = (hp / 1500) * 350
+        power = np.where(truthy['tq'], np.minimum(base_power + (tq / 800) * 50, 400), np.minimum(base_power, 350))
+        weight_score = ((5500 - w) / 5500) * 150
+        speed_score = (speed / 300) * 200
+        accel_score = np.maximum(0, np.minimum(((12 - a) / 12) * 200, 200))
+        
+        estimated_g = _flag_column(body_style, _handling_base).astype(float)
+        estimated_g = np.where(w > 4000, estimated_g - 0.1, np.where(w < 3000, estimated_g + 0.1, estimated_g))
+        estimated_g = np.where(awd, estimated_g + 0.05, estimated_g)
+        estimated_g = np.maximum(0.7, np.minimum(1.3, estimated_g))
+        handling = np.where(truthy['g'], (g / 1.5) * 70, (estimated_g / 1.5) * 70)
+        
+        estimated_braking = 115 + (w - 3000) / 1000 * 10
+        estimated_braking = np.where(truthy['hp'] & (hp > 400), estimated_braking - 10, estimated_braking)
+        estimated_braking = np.maximum(90, np.minimum(150, estimated_braking))
+        braking = np.where(truthy['b'], np.maximum(0, np.minimum(((160 - b) / 160) * 30, 30)),
+                           ((160 - estimated_braking) / 160) * 30)
+        
+        total = power + weight_score + speed_score + accel_score + handling + braking
+        total = np.where(awd, total * 1.02, total)
+        total = np.where(_flag_column(transmission, _contains('manual')).astype(bool), total * 1.01, total)
+        total = np.where(_flag_column(fuel_type, _contains('premium')).astype(bool), total * 1.005, total)
+        
+        # Basic formula for rows missing required data, with the same defaults
+        basic_hp = np.where(truthy['hp'], hp, 300)
+        basic_w = np.where(truthy['w'], w, 3500)
+        basic_speed = np.where(truthy['speed'], speed, 150)
+        basic_a = np.where(truthy['a'], a, 5.0)
+        basic = ((basic_hp / 1500) * 200 + ((5000 - basic_w) / 5000) * 100 + (basic_speed / 300) * 200 +
+                 ((10 - basic_a) / 10) * 200 + (1.0 / 1.5) * 200 + ((150 - 120) / 150) * 100)
+        
+        pi = np.clip(np.trunc(np.where(enhanced, total, basic)), 100, 999).astype(np.int64)
+    
+    required = (present['hp'].astype(int) + present['w'] + present['speed'] + present['a']) / 4
+    has_drivetrain = np.array([value is not None for value in drivetrain], dtype=bool)
+    optional = (present['tq'].astype(int) + present['g'] + present['b'] + present['cc'] + has_drivetrain) / 5
+    confidence = np.where(enhanced, np.minimum(1.0, (required * 0.8) + (optional * 0.2)), 0.5)
+    
+    return pi, confidence, enhanced
+
+def precompute_enhanced_pi(vehicles: Sequence[RealWorldVehicle]) -> int:
+    """
+    Store enhanced PI and confidence on vehicles computed with an older formula version
+    
+    Returns:
+        Number of vehicles updated
+    """
+    outdated = [vehicle for vehicle in vehicles if vehicle.pi_version != ENHANCED_PI_VERSION]
+    if not outdated:
+        return 0
+    
+    pis, confidences, enhanced = compute_enhanced_pi_batch(outdated)
+    for vehicle, pi, confidence, is_enhanced in zip(outdated, pis.tolist(), confidences.tolist(), enhanced.tolist()):
+        vehicle.calculated_pi = pi
+        vehicle.confidence_score = confidence
+        vehicle.pi_source = "real_world_enhanced" if is_enhanced else "real_world_basic"
+        vehicle.pi_version = ENHANCED_PI_VERSION
+    return len(outdated)
 
 class RealWorldDataManager:
     """Manages real-world vehicle data from various sources"""
     
     def __init__(self, cache_dir: str = None):
+        started = time.perf_counter()
+        self._write_lock = threading.RLock()
+        self._metrics_lock = threading.Lock()
+        self._metrics = {"startup_ms": 0.0, "lookups": 0, "lookup_ms_total": 0.0, "lookup_ms_max": 0.0}
+        
         # Use a proper cache directory with fallback options
         if cache_dir is None:
             # Try multiple cache directory options
-            possible_dirs = [
-                os.path.expanduser("~/.forza_pi_cache"),  # User home directory
-                "/tmp/forza_pi_cache",                     # System temp directory
-                "./cache",                                 # Current directory cache
-            ]
-            
-            cache_dir = None
-            for dir_path in possible_dirs:
-                try:
-                    os.makedirs(dir_path, exist_ok=True)
-                    # Test write permission
-                    test_file = os.path.join(dir_path, "test_write.tmp")
-                    with open(test_file, 'w') as f:
-                        f.write("test")
-                    os.remove(test_file)
-                    cache_dir = dir_path
-                    break
-                except (OSError, PermissionError):
-                    continue
+            cache_dir = find_writable_cache_dir()
             
             # If all attempts fail, disable caching
             if cache_dir is None:
@@ -95,51 +537,303 @@ class RealWorldDataManager:
                 self.cache_dir = None
                 self.cache_file = None
         
+        # Binary columnar cache (primary) and HTTP validators live next to the JSON file
+        self.columnar_file = os.path.join(self.cache_dir, "real_world_data.bin") if self.cache_enabled else None
+        self.meta_file = os.path.join(self.cache_dir, "real_world_data.meta.json") if self.cache_enabled else None
+        
         self.google_sheets_id = "1IStNOtVWi8DLEUXqPLAWMPDiIvQzX_msrmFfd4dOfI4"
-        self.cache_duration = timedelta(hours=24)  # Cache for 24 hours
+        self.sheet_csv_url = f"https://docs.google.com/spreadsheets/d/{self.google_sheets_id}/export?format=csv"
+        self.cache_duration = timedelta(hours=REAL_WORLD_DATA_CONFIG["cache_hours"])
+        
+        # Freshness state: when the data was last confirmed current and whether it came from the sheet
+        self._last_validated: Optional[datetime] = None
+        self._has_sheet_data = False
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._next_refresh_attempt = 0.0
+        
+        # Identity of the cache file being served, for cross-process change detection
+        self._cache_signature: Optional[Tuple[int, int, int]] = None
+        self._generation = 0
         
         # Initialize with sample data
         self.vehicles_database = self._load_cached_data()
+        self._metrics["startup_ms"] = (time.perf_counter() - started) * 1000
+    
+    @property
+    def vehicles_database(self) -> List[RealWorldVehicle]:
+        """Current vehicle list; assigning a new list rebuilds the lookup index"""
+        return self._snapshot[0]
+    
+    @vehicles_database.setter
+    def vehicles_database(self, vehicles: List[RealWorldVehicle]):
+        # List and index are published together so concurrent lookups never mix them;
+        # a columnar snapshot indexes itself on first lookup
+        self._publish(vehicles, VehicleIndex(vehicles, lazy=isinstance(vehicles, ColumnarRows)))
+    
+    def add_vehicles(self, vehicles: List[RealWorldVehicle]):
+        """Publish a new snapshot with vehicles appended, indexed incrementally
+        
+        The current list and index are copied rather than changed, so
+        concurrent readers keep a consistent snapshot.
+        """
+        precompute_enhanced_pi(vehicles)
+        with self._write_lock:
+            database, index = self._snapshot
+            if isinstance(database, ColumnarRows):
+                extended = database.extended(vehicles)
+            else:
+                extended = list(database) + list(vehicles)
+            self._publish(extended, index.extended(vehicles, len(database)))
+    
+    def refresh(self, from_source: bool = False) -> bool:
+        """
+        Reload vehicle data explicitly
+        
+        Args:
+            from_source: Download from Google Sheets instead of re-reading the cache file
+            
+        Returns:
+            True if new data was published
+        """
+        if from_source:
+            return self.update_from_google_sheets()
+        
+        with self._write_lock:
+            self.vehicles_database = self._load_cached_data()
+        return True
+    
+    def get_metrics(self) -> Dict[str, float]:
+        """Startup and lookup latency metrics for this manager"""
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        lookups = metrics["lookups"]
+        metrics["lookup_ms_avg"] = metrics["lookup_ms_total"] / lookups if lookups else 0.0
+        return metrics
+    
+    def _record_lookup(self, started: float):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._metrics_lock:
+            self._metrics["lookups"] += 1
+            self._metrics["lookup_ms_total"] += elapsed_ms
+            self._metrics["lookup_ms_max"] = max(self._metrics["lookup_ms_max"], elapsed_ms)
     
     def _load_cached_data(self) -> List[RealWorldVehicle]:
-        """Load cached real-world vehicle data"""
-        if not self.cache_enabled or not os.path.exists(self.cache_file):
+        """Load cached real-world vehicle data
+        
+        The columnar cache is memory-mapped and rows are built on access. A
+        JSON cache from an older version is read once and converted. Stale
+        data is still returned (stale-while-revalidate); is_stale() reports
+        whether a refresh is due.
+        """
+        self._last_validated = None
+        self._has_sheet_data = False
+        if not self.cache_enabled:
             return self._get_sample_data()
-            
+        
+        loaded = None
+        needs_save = False
+        # Taken before opening: if another process replaces the file in between,
+        # the next reload_if_changed() just reads it again
+        signature = file_signature(self.columnar_file)
+        if signature is not None:
+            columns = None
+            try:
+                columns = ColumnarFile(self.columnar_file)
+                loaded = ColumnarRows(columns, RealWorldVehicle), columns.metadata.get('timestamp')
+                self._cache_signature = signature
+                self._generation = columns.metadata.get('generation', 0)
+                if columns.metadata.get('pi_version') != ENHANCED_PI_VERSION:
+                    # Written before the current PI formula: recompute once and rewrite
+                    loaded, needs_save = (list(loaded[0]), loaded[1]), True
+                    columns.close()
+            except ColumnarCacheError as e:
+                print(f"Warning: Ignoring columnar cache: {e}")
+                loaded = None
+                if columns is not None:
+                    columns.close()
+        
+        if loaded is None and os.path.exists(self.cache_file):
+            try:
+                with file_lock(self.cache_file, shared=True):
+                    loaded = self._read_json(self.cache_file)
+                needs_save = True
+            except (json.JSONDecodeError, TypeError, ValueError, OSError):
+                pass
+        
+        if loaded is None:
+            # Return sample data if cache is invalid or doesn't exist
+            return self._get_sample_data()
+        
+        vehicles, timestamp = loaded
+        if needs_save:
+            precompute_enhanced_pi(vehicles)
+            self._save_cached_data(vehicles, timestamp)
+        validated = self._load_meta().get('validated_at') or timestamp or '2000-01-01'
         try:
-            with open(self.cache_file, 'r') as f:
-                data = json.load(f)
-                
-            # Check if cache is still valid
-            cache_time = datetime.fromisoformat(data.get('timestamp', '2000-01-01'))
-            if datetime.now() - cache_time < self.cache_duration:
-                vehicles = []
-                for vehicle_data in data.get('vehicles', []):
-                    vehicles.append(RealWorldVehicle(**vehicle_data))
-                return vehicles
-        except (json.JSONDecodeError, TypeError, ValueError, OSError):
+            self._last_validated = datetime.fromisoformat(validated)
+        except ValueError:
             pass
+        self._has_sheet_data = True
+        return vehicles
+    
+    @staticmethod
+    def _read_json(path: str) -> Tuple[List[RealWorldVehicle], Optional[str]]:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return [RealWorldVehicle.from_dict(vehicle_data) for vehicle_data in data.get('vehicles', [])], data.get('timestamp')
+    
+    def export_json(self, path: Optional[str] = None) -> str:
+        """
+        Write the current vehicles as JSON
+        
+        Args:
+            path: Destination file, defaults to real_world_data.json in the cache directory
+            
+        Returns:
+            The path written
+        """
+        path = path or self.cache_file
+        if path is None:
+            raise ValueError("No export path given and caching is disabled")
+        data = {
+            'timestamp': datetime.now().isoformat(),
+            'vehicles': [vehicle.to_dict() for vehicle in self.vehicles_database],
+            'source': 'mixed'
+        }
+        with file_lock(path), atomic_write(path) as f:
+            json.dump(data, f, indent=2)
+        return path
+    
+    def import_json(self, path: Optional[str] = None) -> int:
+        """
+        Replace the current vehicles with a JSON export and cache them
         
-        # Return sample data if cache is invalid or doesn't exist
-        return self._get_sample_data()
+        Returns:
+            Number of vehicles imported
+        """
+        path = path or self.cache_file
+        if path is None:
+            raise ValueError("No import path given and caching is disabled")
+        with file_lock(path, shared=True):
+            vehicles, _ = self._read_json(path)
+        precompute_enhanced_pi(vehicles)
+        with self._write_lock:
+            self.vehicles_database = vehicles
+            self._save_cached_data(vehicles)
+        return len(vehicles)
     
-    def _save_cached_data(self, vehicles: List[RealWorldVehicle]):
-        """Save vehicle data to cache"""
+    def _load_meta(self) -> Dict[str, Any]:
+        """Read the HTTP validators sidecar file"""
+        if not self.meta_file:
+            return {}
+        try:
+            with open(self.meta_file, 'r') as f:
+                meta = json.load(f)
+            return meta if isinstance(meta, dict) else {}
+        except (json.JSONDecodeError, OSError):
+            return {}
+    
+    def _save_meta(self, meta: Dict[str, Any]):
+        """Write the HTTP validators sidecar file"""
+        if not self.meta_file:
+            return
+        try:
+            with atomic_write(self.meta_file) as f:
+                json.dump(meta, f)
+        except OSError as e:
+            print(f"Warning: Could not save cache metadata: {e}")
+    
+    def is_stale(self) -> bool:
+        """Whether the data is due for revalidation against Google Sheets"""
+        last_validated = self._last_validated
+        return last_validated is None or datetime.now() - last_validated >= self.cache_duration
+    
+    def refresh_in_background(self) -> bool:
+        """
+        Start a background revalidation if the data is stale
+        
+        Lookups keep serving the current snapshot while the refresh runs.
+        At most one refresh runs at a time, and failures back off for
+        retry_after_failure_minutes.
+        
+        Returns:
+            True if a refresh was started
+        """
+        if not REAL_WORLD_DATA_CONFIG["background_refresh"] or not self.is_stale():
+            return False
+        
+        with self._write_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return False
+            if time.monotonic() < self._next_refresh_attempt:
+                return False
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh, name="real-world-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+        return True
+    
+    def _background_refresh(self):
+        # Another process may already have refreshed the shared cache
+        if self.reload_if_changed() and not self.is_stale():
+            return
+        if not self.update_from_google_sheets():
+            self._next_refresh_attempt = (time.monotonic() +
+                                          REAL_WORLD_DATA_CONFIG["retry_after_failure_minutes"] * 60)
+    
+    def _save_cached_data(self, vehicles: List[RealWorldVehicle], timestamp: Optional[str] = None):
+        """Save vehicle data to the columnar cache"""
         if not self.cache_enabled:
             return
             
         try:
-            data = {
-                'timestamp': datetime.now().isoformat(),
-                'vehicles': [vehicle.__dict__ for vehicle in vehicles],
-                'source': 'mixed'
-            }
-            
-            with open(self.cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # The lock orders concurrent writers so generations never repeat
+            with file_lock(self.columnar_file):
+                generation = self._read_generation() + 1
+                write_columnar(self.columnar_file, vehicles, VEHICLE_COLUMNS, {
+                    'timestamp': timestamp or datetime.now().isoformat(),
+                    'source': 'mixed',
+                    'generation': generation,
+                    # Lets loads skip the PI check when every row is current
+                    'pi_version': (ENHANCED_PI_VERSION if all(
+                        vehicle.pi_version == ENHANCED_PI_VERSION for vehicle in vehicles) else None)
+                })
+                # This process already holds the data it wrote
+                self._cache_signature = file_signature(self.columnar_file)
+                self._generation = generation
         except Exception as e:
             print(f"Warning: Could not save cache: {e}")
     
+    def _read_generation(self) -> int:
+        """Generation of the columnar cache currently on disk, 0 if there is none"""
+        try:
+            with ColumnarFile(self.columnar_file) as columns:
+                return columns.metadata.get('generation', 0)
+        except ColumnarCacheError:
+            return 0
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Adopt a cache written by another process
+        
+        Costs one stat() when nothing changed; a replaced file is only
+        loaded if its generation differs from the one being served.
+        
+        Returns:
+            True if a new snapshot was published
+        """
+        if not self.cache_enabled:
+            return False
+        signature = file_signature(self.columnar_file)
+        if signature is None or signature == self._cache_signature:
+            return False
+        
+        with self._write_lock:
+            if self._read_generation() == self._generation:
+                self._cache_signature = signature
+                return False
+            return self.refresh()
+    
     def _get_sample_data(self) -> List[RealWorldVehicle]:
         """Get sample real-world vehicle data for demonstration"""
         sample_vehicles = [
@@ -218,39 +912,128 @@ class RealWorldDataManager:
             ),
         ]
         
+        precompute_enhanced_pi(sample_vehicles)
         return sample_vehicles
     
     def find_vehicle_match(self, year: int, make: str, model: str, 
                           trim: Optional[str] = None) -> Optional[RealWorldVehicle]:
         """Find exact or close match for a vehicle in real-world database"""
+        started = time.perf_counter()
+        try:
+            return self._match_vehicle(year, make, model, trim)
+        finally:
+            self._record_lookup(started)
+    
+    def _match_vehicle(self, year: int, make: str, model: str,
+                       trim: Optional[str] = None) -> Optional[RealWorldVehicle]:
+        database, index = self._snapshot
         make_clean = make.lower().strip()
         model_clean = model.lower().strip()
+        key = (make_clean, model_clean)
         
         # Try exact match first
-        for vehicle in self.vehicles_database:
-            if (vehicle.year == year and 
-                vehicle.make.lower() == make_clean and 
-                vehicle.model.lower() == model_clean):
-                
-                # If trim specified, try to match it too
-                if trim:
-                    trim_clean = trim.lower().strip()
-                    if vehicle.trim and trim_clean in vehicle.trim.lower():
-                        return vehicle
-                else:
+        for position in sorted(index.positions(key, year, year)):
+            vehicle = database[position]
+            
+            # If trim specified, try to match it too
+            if trim:
+                trim_clean = trim.lower().strip()
+                if vehicle.trim and trim_clean in vehicle.trim.lower():
                     return vehicle
+            else:
+                return vehicle
         
         # Try fuzzy match (same make/model, different year within 2 years)
-        for vehicle in self.vehicles_database:
-            if (abs(vehicle.year - year) <= 2 and 
-                vehicle.make.lower() == make_clean and 
-                vehicle.model.lower() == model_clean):
-                return vehicle
+        nearby = index.positions(key, year - 2, year + 2)
+        if nearby:
+            return database[min(nearby)]
+        
+        return None
+    
+    def find_fuzzy_matches(self, make: str, model: str, year: Optional[int] = None,
+                           top_k: Optional[int] = None) -> List[Tuple[RealWorldVehicle, float]]:
+        """Rank approximate make/model matches, e.g. NHTSA MERCEDES-BENZ / E-Class"""
+        started = time.perf_counter()
+        try:
+            snapshot = self._snapshot
+            cached = self._fuzzy_matcher
+            if cached is None or cached[0] is not snapshot:
+                # Built on first fuzzy query after data changes
+                cached = (snapshot, FuzzyVehicleMatcher(snapshot[0]))
+                self._fuzzy_matcher = cached
+            database = snapshot[0]
+            return [(database[position], score)
+                    for position, score in cached[1].match(make, model, year, top_k)]
+        finally:
+            self._record_lookup(started)
+    
+    def find_vehicles_by_pi(self, target_pi: Optional[int] = None, forza_class: Optional[str] = None,
+                            min_pi: Optional[int] = None, max_pi: Optional[int] = None,
+                            drivetrain: Optional[str] = None, body_style: Optional[str] = None,
+                            min_year: Optional[int] = None, max_year: Optional[int] = None,
+                            limit: int = 10) -> List[RealWorldVehicle]:
+        """
+        Find real-world vehicles whose enhanced PI is near a target
         
+        Args:
+            target_pi: PI to rank by; defaults to the middle of the PI window
+            forza_class: Restrict to this class's PI range (e.g. "A")
+            min_pi, max_pi: Restrict to a PI range, combined with forza_class
+            drivetrain: e.g. "AWD", case-insensitive exact match
+            body_style: e.g. "coupe", case-insensitive substring match
+            min_year, max_year: Inclusive model year range
+            limit: Maximum number of vehicles returned
+            
+        Returns:
+            Matching vehicles, closest PI first
+        """
+        if forza_class is not None:
+            class_min, class_max = get_class_pi_range(forza_class)
+            min_pi = class_min if min_pi is None else max(min_pi, class_min)
+            max_pi = class_max if max_pi is None else min(max_pi, class_max)
+        if target_pi is None:
+            if min_pi is None or max_pi is None:
+                raise ValueError("Give a target PI, a Forza class or both ends of a PI range")
+            target_pi = (min_pi + max_pi) / 2
+        
+        started = time.perf_counter()
+        try:
+            snapshot = self._snapshot
+            cached = self._pi_index
+            if cached is None or cached[0] is not snapshot:
+                # Built on first reverse query after data changes
+                cached = (snapshot, VehiclePIIndex(snapshot[0]))
+                self._pi_index = cached
+            database = snapshot[0]
+            positions = cached[1].search(target_pi, min_pi, max_pi, drivetrain, body_style,
+                                         min_year, max_year, limit)
+            return [database[position] for position in positions]
+        finally:
+            self._record_lookup(started)
+    
+    def find_best_match(self, year: int, make: str, model: str,
+                        trim: Optional[str] = None) -> Optional[RealWorldVehicle]:
+        """Exact/year-window match first, then the best fuzzy match above the configured score"""
+        vehicle = self.find_vehicle_match(year, make, model, trim)
+        if vehicle is not None:
+            return vehicle
+        
+        candidates = self.find_fuzzy_matches(make, model, year, top_k=1)
+        if candidates and candidates[0][1] >= FUZZY_MATCH_CONFIG["min_score"]:
+            return candidates[0][0]
         return None
     
     def get_enhanced_pi_calculation(self, vehicle: RealWorldVehicle) -> Tuple[int, float]:
-        """Calculate enhanced PI using real-world data and improved formulas"""
+        """Calculate enhanced PI using real-world data and improved formulas
+        
+        Vehicles from the database carry values precomputed at ingest and are
+        only recalculated when ENHANCED_PI_VERSION has changed since.
+        """
+        if (vehicle.pi_version == ENHANCED_PI_VERSION and vehicle.calculated_pi is not None
+                and vehicle.confidence_score is not None):
+            return vehicle.calculated_pi, vehicle.confidence_score
+        
+        vehicle = _without_nan_specs(vehicle)
         if not all([vehicle.horsepower, vehicle.weight_lbs, vehicle.top_speed_mph, 
                    vehicle.acceleration_0_60]):
             # Fallback to basic calculation if missing data
@@ -405,62 +1188,161 @@ class RealWorldDataManager:
         return min(1.0, confidence)
     
     def update_from_google_sheets(self) -> bool:
-        """Update real-world data from Google Sheets (when available)"""
+        """
+        Update real-world data from Google Sheets (when available)
+        
+        The CSV is streamed and parsed incrementally into a new list and index
+        built off to the side, which are published in one step only once the
+        whole sheet has been read. A download or parse error part-way through
+        leaves the current data untouched.
+        """
+        meta = self._load_meta() if self._has_sheet_data else {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        
         try:
-            csv_url = f"https://docs.google.com/spreadsheets/d/{self.google_sheets_id}/export?format=csv"
-            response = requests.get(csv_url, timeout=10)
+            with requests.get(self.sheet_csv_url, headers=headers, stream=True,
+                              timeout=REAL_WORLD_DATA_CONFIG["request_timeout"]) as response:
+                if response.status_code == 304:
+                    # Unchanged upstream: extend the TTL without downloading or re-parsing
+                    self._mark_validated(meta)
+                    return True
+                if response.status_code != 200:
+                    return False
+                if response.encoding is None:
+                    response.encoding = 'utf-8'
+                
+                vehicles = []
+                for chunk in self._iter_csv_chunks(response.iter_lines(decode_unicode=True)):
+                    vehicles.extend(chunk)
+                validators = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified')
+                }
             
-            if response.status_code == 200:
-                # Parse CSV data
-                vehicles = self._parse_csv_data(response.text)
-                if vehicles:
-                    self.vehicles_database = vehicles
+            if vehicles:
+                precompute_enhanced_pi(vehicles)
+                index = VehicleIndex(vehicles)
+                with self._write_lock:
+                    self._publish(vehicles, index)
+                    self._has_sheet_data = True
                     if self.cache_enabled:
                         self._save_cached_data(vehicles)
-                    return True
-                    
+                    self._mark_validated(validators)
+                return True
+                
         except Exception as e:
             print(f"Could not update from Google Sheets: {e}")
         
         return False
     
+    def _mark_validated(self, validators: Dict[str, Any]):
+        """Record a successful validation and persist the validators"""
+        self._last_validated = datetime.now()
+        self._save_meta({
+            'etag': validators.get('etag'),
+            'last_modified': validators.get('last_modified'),
+            'validated_at': self._last_validated.isoformat()
+        })
+    
+    def _publish(self, vehicles: List[RealWorldVehicle], index: VehicleIndex):
+        """
+        Swap in a prebuilt list and index as the current snapshot
+        
+        A superseded columnar snapshot is not closed here, since readers may
+        still hold it; its mapping is released with the last reference.
+        """
+        self._snapshot = (vehicles, index)
+        self._fuzzy_matcher = None
+        self._pi_index = None
+    
+    def _iter_csv_chunks(self, lines: Iterable[str],
+                         chunk_size: int = CSV_INGEST_CHUNK_ROWS) -> Iterator[List[RealWorldVehicle]]:
+        """Parse CSV lines lazily, yielding validated vehicles in chunks
+        
+        Rows that fail conversion are skipped; csv.Error and stream errors
+        propagate so the caller can abandon the whole update.
+        """
+        last_updated = datetime.now().isoformat()
+        chunk = []
+        for row in csv.DictReader(lines):
+            vehicle = self._row_to_vehicle(row, last_updated)
+            if vehicle is not None:
+                chunk.append(vehicle)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+    
+    @staticmethod
+    def _row_to_vehicle(row: Dict[str, Optional[str]], last_updated: str) -> Optional[RealWorldVehicle]:
+        """Convert one CSV row, returning None for rows that are invalid"""
+        try:
+            # Map CSV columns to vehicle attributes
+            # This would need to be adjusted based on actual sheet structure
+            vehicle = RealWorldVehicle(
+                year=int(row.get('Year', 0)),
+                make=row.get('Make', ''),
+                model=row.get('Model', ''),
+                trim=row.get('Trim'),
+                horsepower=float(row.get('HP', 0)) if row.get('HP') else None,
+                weight_lbs=float(row.get('Weight', 0)) if row.get('Weight') else None,
+                # Add more mappings as needed
+                data_source="google_sheets",
+                last_updated=last_updated
+            )
+        except (ValueError, TypeError):
+            return None  # Skip invalid rows
+        
+        if vehicle.year > 0 and vehicle.make and vehicle.model:
+            return vehicle
+        return None
+    
     def _parse_csv_data(self, csv_data: str) -> List[RealWorldVehicle]:
         """Parse CSV data into RealWorldVehicle objects"""
         vehicles = []
-        reader = csv.DictReader(csv_data.splitlines())
-        
-        for row in reader:
-            try:
-                # Map CSV columns to vehicle attributes
-                # This would need to be adjusted based on actual sheet structure
-                vehicle = RealWorldVehicle(
-                    year=int(row.get('Year', 0)),
-                    make=row.get('Make', ''),
-                    model=row.get('Model', ''),
-                    trim=row.get('Trim'),
-                    horsepower=float(row.get('HP', 0)) if row.get('HP') else None,
-                    weight_lbs=float(row.get('Weight', 0)) if row.get('Weight') else None,
-                    # Add more mappings as needed
-                    data_source="google_sheets",
-                    last_updated=datetime.now().isoformat()
-                )
-                
-                if vehicle.year > 0 and vehicle.make and vehicle.model:
-                    vehicles.append(vehicle)
-                    
-            except (ValueError, TypeError):
-                continue  # Skip invalid rows
-        
+        for chunk in self._iter_csv_chunks(csv_data.splitlines()):
+            vehicles.extend(chunk)
         return vehicles
 
+# Shared manager
+_shared_manager: Optional[RealWorldDataManager] = None
+_shared_manager_lock = threading.Lock()
+
+def get_real_world_manager() -> RealWorldDataManager:
+    """Get the process-wide manager, creating it on first use
+    
+    Picks up cache files written by other processes, and returns stale
+    data immediately while a background refresh runs.
+    """
+    global _shared_manager
+    if _shared_manager is None:
+        with _shared_manager_lock:
+            if _shared_manager is None:
+                _shared_manager = RealWorldDataManager()
+    _shared_manager.reload_if_changed()
+    _shared_manager.refresh_in_background()
+    return _shared_manager
+
+def refresh_real_world_data(from_source: bool = False) -> bool:
+    """Refresh the shared manager's data, see RealWorldDataManager.refresh"""
+    return get_real_world_manager().refresh(from_source)
+
 # Convenience functions
 def find_real_world_vehicle(year: int, make: str, model: str, 
                            trim: Optional[str] = None) -> Optional[RealWorldVehicle]:
-    """Find a real-world vehicle match"""
-    manager = RealWorldDataManager()
-    return manager.find_vehicle_match(year, make, model, trim)
+    """Find a real-world vehicle match, falling back to fuzzy make/model matching"""
+    return get_real_world_manager().find_best_match(year, make, model, trim)
+
+def find_real_world_vehicles_by_pi(target_pi: Optional[int] = None, forza_class: Optional[str] = None,
+                                   **filters) -> List[RealWorldVehicle]:
+    """Find real-world vehicles near a Forza PI, see RealWorldDataManager.find_vehicles_by_pi"""
+    return get_real_world_manager().find_vehicles_by_pi(target_pi, forza_class, **filters)
 
 def calculate_enhanced_pi(vehicle: RealWorldVehicle) -> Tuple[int, float]:
     """Calculate enhanced PI for a real-world vehicle"""
-    manager = RealWorldDataManager()
-    return manager.get_enhanced_pi_calculation(vehicle)
\ No newline at end of file
+    return get_real_world_manager().get_enhanced_pi_calculation(vehicle)
@@ -0,0 +1,81 @@
+# utils/records.py
+"""
+Compact record helpers for Forza PI Calculator
+Dict conversion, frozen variants and compressed JSON payloads for slotted dataclasses
+"""
+
+import json
+import zlib
+from dataclasses import MISSING, field, fields, make_dataclass
+from typing import Any, Dict, Optional, Type, TypeVar
+
+R = TypeVar("R")
+
+def record_to_dict(record: Any) -> Dict[str, Any]:
+    """Field name -> value, shallow (unlike dataclasses.asdict, nested values are not copied)"""
+    return {f.name: getattr(record, f.name) for f in fields(record)}
+
+def record_from_dict(cls: Type[R], data: Dict[str, Any]) -> R:
+    """Build cls from a dict, ignoring keys that are not fields (e.g. written by a newer version)"""
+    names = {f.name for f in fields(cls)}
+    return cls(**{key: value for key, value in data.items() if key in names})
+
+def frozen_variant(cls: type) -> type:
+    """
+    Create an immutable, slotted copy of a dataclass
+
+    The variant has the same fields and defaults and hashes by value.
+    to_dict()/from_dict() go through cls's own versions, and thaw()
+    converts back to cls.
+    """
+    spec = [(f.name, f.type, field(default=f.default) if f.default is not MISSING else field())
+            for f in fields(cls)]
+
+    def thaw(self):
+        return cls(**record_to_dict(self))
+
+    def to_dict(self, *args, **kwargs) -> Dict[str, Any]:
+        return thaw(self).to_dict(*args, **kwargs)
+
+    def from_dict(variant, data: Dict[str, Any]):
+        return variant(**record_to_dict(cls.from_dict(data)))
+
+    namespace = {
+        "thaw": thaw,
+        "to_dict": to_dict,
+        "from_dict": classmethod(from_dict),
+        "__doc__": f"Immutable {cls.__name__}",
+        "__module__": cls.__module__,
+    }
+    return make_dataclass(f"Frozen{cls.__name__}", spec, namespace=namespace, frozen=True, slots=True)
+
+class CompressedJSON:
+    """A JSON-serializable value kept zlib-compressed until it is read"""
+
+    __slots__ = ("blob",)
+
+    def __init__(self, blob: bytes):
+        self.blob = blob
+
+    @classmethod
+    def pack(cls, value: Any, level: int = 6) -> "CompressedJSON":
+        return cls(zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"), level))
+
+    def load(self) -> Any:
+        return json.loads(zlib.decompress(self.blob))
+
+    def __len__(self) -> int:
+        return len(self.blob)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CompressedJSON) and other.blob == self.blob
+
+    def __hash__(self) -> int:
+        return hash(self.blob)
+
+    def __repr__(self) -> str:
+        return f"CompressedJSON({len(self.blob)} bytes)"
+
+def unpack_json(value: Optional[Any]) -> Optional[Any]:
+    """Return value, decompressing it first if it is a CompressedJSON"""
+    return value.load() if isinstance(value, CompressedJSON) else value
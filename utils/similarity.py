@@ -0,0 +1,145 @@
+# utils/similarity.py
+"""
+Spec-based similarity engine for Forza PI Calculator
+KD-tree over normalized (PI, HP, weight, power-to-weight) vectors with weighted k-nearest queries
+"""
+
+import heapq
+from typing import Any, Dict, Generic, List, Mapping, Optional, Sequence, Tuple, TypeVar
+import numpy as np
+
+T = TypeVar("T")
+
+# Feature dimensions, in column order
+FEATURES = ("pi", "hp", "weight", "power_to_weight")
+
+def spec_vector(pi: float, hp: float, weight: float) -> np.ndarray:
+    """Raw (unnormalized) feature vector for one car; power-to-weight is HP per 1000 lbs"""
+    return np.array([pi, hp, weight, hp / weight * 1000 if weight else 0.0], dtype=float)
+
+class SpecKDTree(Generic[T]):
+    """Immutable KD-tree over z-score normalized spec vectors
+
+    Nodes split on their widest dimension at the median and keep a bounding
+    box, so a query can skip any node whose box is further away than the
+    current k-th best. Per-dimension weights are applied at query time: a
+    weighted distance to a box is still a lower bound, so one tree serves
+    every weighting. Leaves are scored with numpy.
+    """
+
+    def __init__(self, items: Sequence[T], vectors: np.ndarray, leaf_size: int = 16):
+        self.items: List[T] = list(items)
+        vectors = np.asarray(vectors, dtype=float).reshape(len(self.items), len(FEATURES))
+        self.mean = vectors.mean(axis=0) if len(vectors) else np.zeros(len(FEATURES))
+        std = vectors.std(axis=0) if len(vectors) else np.ones(len(FEATURES))
+        self.scale = np.where(std > 0, std, 1.0)
+        points = (vectors - self.mean) / self.scale
+
+        # Node arrays; leaves have left == -1 and own order[start:end]
+        self._order = np.arange(len(self.items))
+        self._lo: List[np.ndarray] = []
+        self._hi: List[np.ndarray] = []
+        self._left: List[int] = []
+        self._right: List[int] = []
+        self._start: List[int] = []
+        self._end: List[int] = []
+        if len(self.items):
+            self._build(points, 0, len(self.items), max(1, leaf_size))
+        self._points = points[self._order]
+        self._lo_array = np.array(self._lo)
+        self._hi_array = np.array(self._hi)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _build(self, points: np.ndarray, start: int, end: int, leaf_size: int) -> int:
+        node = len(self._left)
+        block = points[self._order[start:end]]
+        self._lo.append(block.min(axis=0))
+        self._hi.append(block.max(axis=0))
+        self._left.append(-1)
+        self._right.append(-1)
+        self._start.append(start)
+        self._end.append(end)
+
+        spread = self._hi[node] - self._lo[node]
+        if end - start <= leaf_size or not spread.any():
+            return node
+
+        dim = int(np.argmax(spread))
+        middle = (end - start) // 2
+        # Stable partition keeps equal coordinates in input order on both sides
+        local = np.argsort(block[:, dim], kind="stable")
+        self._order[start:end] = self._order[start:end][local]
+        self._left[node] = self._build(points, start, start + middle, leaf_size)
+        self._right[node] = self._build(points, start + middle, end, leaf_size)
+        return node
+
+    def normalize(self, vector: np.ndarray) -> np.ndarray:
+        return (np.asarray(vector, dtype=float) - self.mean) / self.scale
+
+    def query(self, vector: np.ndarray, count: int, weights: Optional[np.ndarray] = None,
+              mask: Optional[np.ndarray] = None) -> List[Tuple[T, float]]:
+        """
+        Find the count nearest items to a raw spec vector
+
+        Args:
+            vector: Raw feature vector, see spec_vector()
+            count: Number of items to return
+            weights: Non-negative weight per feature, defaults to all 1
+            mask: Boolean array over items; False items are skipped
+
+        Returns:
+            (item, weighted distance) pairs, nearest first; ties keep input order
+        """
+        if count <= 0 or not self.items:
+            return []
+        target = self.normalize(vector)
+        weights = np.ones(len(FEATURES)) if weights is None else np.asarray(weights, dtype=float)
+        masked_order = mask[self._order] if mask is not None else None
+
+        # Max-heap of the best count as (-distance, -item index)
+        best: List[Tuple[float, int]] = []
+        frontier = [(0.0, 0)]
+        while frontier:
+            bound, node = heapq.heappop(frontier)
+            if len(best) >= count and bound > -best[0][0]:
+                break
+            left = self._left[node]
+            if left < 0:
+                start, end = self._start[node], self._end[node]
+                distances = ((self._points[start:end] - target) ** 2 * weights).sum(axis=1)
+                for offset, distance in enumerate(distances.tolist()):
+                    if masked_order is not None and not masked_order[start + offset]:
+                        continue
+                    entry = (-distance, -int(self._order[start + offset]))
+                    if len(best) < count:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+                continue
+            for child in (left, self._right[node]):
+                gap = np.maximum(0.0, np.maximum(self._lo_array[child] - target, target - self._hi_array[child]))
+                child_bound = float((gap ** 2 * weights).sum())
+                if len(best) < count or child_bound <= -best[0][0]:
+                    heapq.heappush(frontier, (child_bound, child))
+
+        ranked = sorted((-distance, -index) for distance, index in best)
+        return [(self.items[index], float(np.sqrt(distance))) for distance, index in ranked]
+
+def build_spec_tree(cars: Sequence[Dict[str, Any]], leaf_size: int = 16) -> SpecKDTree[Dict[str, Any]]:
+    """Index Forza car dicts (pi, hp and weight keys) by their spec vectors"""
+    cars = [car for car in cars if car.get("pi") and car.get("hp") and car.get("weight")]
+    vectors = np.array([spec_vector(car["pi"], car["hp"], car["weight"]) for car in cars]).reshape(-1, len(FEATURES))
+    return SpecKDTree(cars, vectors, leaf_size)
+
+def feature_weights(weights: Optional[Mapping[str, float]], defaults: Mapping[str, float]) -> np.ndarray:
+    """Weight array in FEATURES order, overriding defaults with any given weights"""
+    merged = {**defaults, **(weights or {})}
+    unknown = set(merged) - set(FEATURES)
+    if unknown:
+        raise ValueError(f"Unknown similarity features: {', '.join(sorted(unknown))}")
+    array = np.array([merged.get(name, 0.0) for name in FEATURES], dtype=float)
+    if (array < 0).any():
+        raise ValueError("Similarity weights must be non-negative")
+    return array
@@ -3,9 +3,8 @@
 CSS styling and UI theming for Forza PI Calculator
 """
 
-def get_forza_css():
-    """Return the main CSS styling for the Forza-themed UI"""
-    return """
+# Built once at import; the stylesheet has no per-run content
+FORZA_CSS = """
     <style>
         @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Rajdhani:wght@300;400;600;700&display=swap');
         
@@ -118,6 +117,18 @@ def get_forza_css():
             margin-top: 2rem;
         }
         
+        .car-grid {
+            display: grid;
+            grid-template-columns: repeat(2, minmax(0, 1fr));
+            column-gap: 1rem;
+        }
+        
+        @media (max-width: 640px) {
+            .car-grid {
+                grid-template-columns: minmax(0, 1fr);
+            }
+        }
+        
         .car-card {
             background: rgba(26, 35, 50, 0.9);
             border: 2px solid rgba(255, 107, 53, 0.5);
@@ -257,4 +268,8 @@ def get_forza_css():
             100% { box-shadow: 0 0 5px rgba(255, 107, 53, 0.5); }
         }
     </style>
-    """
\ No newline at end of file
+    """
+
+def get_forza_css():
+    """Return the main CSS styling for the Forza-themed UI"""
+    return FORZA_CSS
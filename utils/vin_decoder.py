@@ -4,14 +4,37 @@ VIN decoder module for Forza PI Calculator
 Interfaces with NHTSA API to decode Vehicle Identification Numbers
 """
 
+import asyncio
+import random
 import requests
 import re
-from typing import Dict, Optional, Tuple, Any
-from dataclasses import dataclass
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from datetime import datetime
+from urllib.parse import urlparse
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
+from requests.adapters import HTTPAdapter
+from dataclasses import dataclass, replace
+from config.settings import VIN_CACHE_CONFIG, VIN_DECODE_CONFIG, VIN_BATCH_CONFIG, VIN_ASYNC_CONFIG
+from utils.cache_paths import find_writable_cache_dir
+from utils.records import CompressedJSON, frozen_variant, record_from_dict, record_to_dict, unpack_json
+from utils.vin_tables import (
+    CHECK_DIGIT_WEIGHTS, TRANSLITERATION, MODEL_YEAR_CODES, NORTH_AMERICA_PREFIXES, WMI_MAKES
+)
 
-@dataclass
+@dataclass(slots=True)
 class VehicleInfo:
-    """Data class to hold decoded vehicle information"""
+    """Data class to hold decoded vehicle information
+    
+    raw_data is only populated when VIN_DECODE_CONFIG keep_raw_data is set,
+    and is then usually a CompressedJSON; read it with get_raw_data().
+    """
     year: Optional[str] = None
     make: Optional[str] = None
     model: Optional[str] = None
@@ -29,7 +52,205 @@ class VehicleInfo:
     vehicle_type: Optional[str] = None
     is_valid: bool = False
     error_message: Optional[str] = None
-    raw_data: Optional[Dict] = None
+    raw_data: Optional[Any] = None
+    vin: Optional[str] = None
+    source: Optional[str] = None  # "local" for offline pre-decode, "nhtsa" once enriched
+    
+    def get_raw_data(self) -> Optional[Dict]:
+        """The NHTSA response this result was parsed from, if it was kept"""
+        return unpack_json(self.raw_data)
+    
+    def to_dict(self, include_raw: bool = True) -> Dict[str, Any]:
+        """JSON-ready dict with raw_data decompressed (or None when include_raw is False)"""
+        data = record_to_dict(self)
+        data["raw_data"] = self.get_raw_data() if include_raw else None
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VehicleInfo":
+        """Inverse of to_dict; a raw_data dict is kept according to VIN_DECODE_CONFIG"""
+        vehicle_info = record_from_dict(cls, data)
+        vehicle_info.raw_data = pack_raw_data(vehicle_info.raw_data)
+        return vehicle_info
+    
+    def freeze(self) -> "FrozenVehicleInfo":
+        return FrozenVehicleInfo(**record_to_dict(self))
+
+# Immutable VehicleInfo, e.g. for results shared between threads
+FrozenVehicleInfo = frozen_variant(VehicleInfo)
+
+def pack_raw_data(raw_data: Optional[Any]) -> Optional[Any]:
+    """Apply VIN_DECODE_CONFIG to an NHTSA response before it is stored on a VehicleInfo"""
+    if raw_data is None or not VIN_DECODE_CONFIG["keep_raw_data"]:
+        return None
+    if VIN_DECODE_CONFIG["compress_raw_data"] and not isinstance(raw_data, CompressedJSON):
+        return CompressedJSON.pack(raw_data)
+    return raw_data
+
+class VINCache(ABC):
+    """Interface for VIN decode result caches, keyed by normalized VIN"""
+    
+    @abstractmethod
+    def get_entry(self, vin: str) -> Optional[Tuple[VehicleInfo, float]]:
+        """Return (cached result, expires_at timestamp) for a VIN, or None if missing or expired"""
+    
+    def get(self, vin: str) -> Optional[VehicleInfo]:
+        """Return the cached result for a VIN, or None if missing or expired"""
+        entry = self.get_entry(vin)
+        return entry[0] if entry is not None else None
+    
+    @abstractmethod
+    def set(self, vin: str, vehicle_info: VehicleInfo, ttl: float):
+        """Store a decode result for ttl seconds"""
+    
+    @abstractmethod
+    def clear(self):
+        """Drop every cached entry"""
+
+class MemoryVINCache(VINCache):
+    """Thread-safe in-process LRU cache with per-entry expiry"""
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, VehicleInfo]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get_entry(self, vin: str) -> Optional[Tuple[VehicleInfo, float]]:
+        with self._lock:
+            entry = self._entries.get(vin)
+            if entry is None:
+                return None
+            expires_at, vehicle_info = entry
+            if expires_at <= time.time():
+                del self._entries[vin]
+                return None
+            self._entries.move_to_end(vin)
+            return replace(vehicle_info), expires_at
+    
+    def set(self, vin: str, vehicle_info: VehicleInfo, ttl: float):
+        with self._lock:
+            self._entries[vin] = (time.time() + ttl, replace(vehicle_info))
+            self._entries.move_to_end(vin)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class SQLiteVINCache(VINCache):
+    """On-disk cache shared by every process using the same database file
+    
+    Only the parsed VehicleInfo fields are stored; the raw NHTSA response
+    is dropped to keep rows small.
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=5, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS vin_cache ("
+                "vin TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+    
+    def get_entry(self, vin: str) -> Optional[Tuple[VehicleInfo, float]]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, expires_at FROM vin_cache WHERE vin = ?", (vin,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Warning: VIN cache read failed: {e}")
+            return None
+        
+        if row is None or row[1] <= time.time():
+            return None
+        
+        try:
+            return VehicleInfo.from_dict(json.loads(row[0])), row[1]
+        except (TypeError, ValueError):
+            return None
+    
+    def set(self, vin: str, vehicle_info: VehicleInfo, ttl: float):
+        payload = vehicle_info.to_dict(include_raw=False)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO vin_cache (vin, payload, expires_at) VALUES (?, ?, ?)",
+                    (vin, json.dumps(payload), time.time() + ttl)
+                )
+        except sqlite3.Error as e:
+            print(f"Warning: VIN cache write failed: {e}")
+    
+    def clear(self):
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM vin_cache")
+        except sqlite3.Error as e:
+            print(f"Warning: VIN cache clear failed: {e}")
+    
+    def purge_expired(self) -> int:
+        """Delete expired rows and return how many were removed (0 if the database is unavailable)"""
+        try:
+            with self._lock, self._conn:
+                return self._conn.execute("DELETE FROM vin_cache WHERE expires_at <= ?", (time.time(),)).rowcount
+        except sqlite3.Error as e:
+            print(f"Warning: VIN cache purge failed: {e}")
+            return 0
+
+class TieredVINCache(VINCache):
+    """Memory LRU in front of a persistent cache
+    
+    Disk hits are promoted to memory for no longer than the disk entry has
+    left, so an entry never outlives its original expiry.
+    """
+    
+    def __init__(self, memory: VINCache, disk: Optional[VINCache] = None):
+        self.memory = memory
+        self.disk = disk
+    
+    def get_entry(self, vin: str) -> Optional[Tuple[VehicleInfo, float]]:
+        entry = self.memory.get_entry(vin)
+        if entry is not None or self.disk is None:
+            return entry
+        
+        entry = self.disk.get_entry(vin)
+        if entry is not None:
+            vehicle_info, expires_at = entry
+            remaining = expires_at - time.time()
+            if remaining > 0:
+                self.memory.set(vin, vehicle_info, min(remaining, VINDecoder.cache_ttl(vehicle_info)))
+        return entry
+    
+    def set(self, vin: str, vehicle_info: VehicleInfo, ttl: float):
+        self.memory.set(vin, vehicle_info, ttl)
+        if self.disk is not None:
+            self.disk.set(vin, vehicle_info, ttl)
+    
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+def create_default_vin_cache() -> Optional[VINCache]:
+    """Build the configured memory + SQLite cache, degrading to memory only"""
+    if not VIN_CACHE_CONFIG["enabled"]:
+        return None
+    
+    memory = MemoryVINCache(VIN_CACHE_CONFIG["memory_entries"])
+    cache_dir = find_writable_cache_dir()
+    if cache_dir is None:
+        return TieredVINCache(memory)
+    
+    try:
+        disk = SQLiteVINCache(os.path.join(cache_dir, VIN_CACHE_CONFIG["db_filename"]))
+    except sqlite3.Error as e:
+        print(f"Warning: Could not open VIN cache database: {e}. Using memory cache only.")
+        disk = None
+    return TieredVINCache(memory, disk)
 
 class VINDecoder:
     """VIN decoder using NHTSA API"""
@@ -55,6 +276,83 @@ class VINDecoder:
         'Vehicle Type': 'vehicle_type'
     }
     
+    # Same fields as keyed in the flat DecodeVINValuesBatch response
+    FLAT_FIELD_MAPPING = {
+        'ModelYear': 'year',
+        'Make': 'make',
+        'Model': 'model',
+        'Trim': 'trim',
+        'EngineModel': 'engine_type',
+        'EngineCylinders': 'engine_cylinders',
+        'DisplacementCC': 'engine_displacement_cc',
+        'DisplacementCI': 'engine_displacement_ci',
+        'EngineKW': 'engine_power_kw',
+        'FuelTypePrimary': 'fuel_type',
+        'BodyClass': 'body_class',
+        'DriveType': 'drive_type',
+        'TransmissionSpeeds': 'transmission_speeds',
+        'TransmissionStyle': 'transmission_style',
+        'VehicleType': 'vehicle_type'
+    }
+    
+    # Pooled keep-alive HTTP session shared by all lookups
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+    
+    # Shared decode cache; created lazily, replace with set_cache()
+    _cache: Optional[VINCache] = None
+    _cache_initialized = False
+    _cache_lock = threading.Lock()
+    
+    @classmethod
+    def get_cache(cls) -> Optional[VINCache]:
+        """Return the shared decode cache, creating the default one on first use"""
+        if not cls._cache_initialized:
+            with cls._cache_lock:
+                if not cls._cache_initialized:
+                    cls._cache = create_default_vin_cache()
+                    cls._cache_initialized = True
+        return cls._cache
+    
+    @classmethod
+    def set_cache(cls, cache: Optional[VINCache]):
+        """Install a decode cache, or None to disable caching"""
+        with cls._cache_lock:
+            cls._cache = cache
+            cls._cache_initialized = True
+    
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """
+        Return the shared HTTP session
+        
+        The connection pool is sized for the busiest user of the session,
+        batch decoding or AsyncVINDecoder, so concurrent requests reuse
+        keep-alive connections instead of overflowing the pool.
+        """
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    pool_size = max(VIN_BATCH_CONFIG["max_workers"], VIN_ASYNC_CONFIG["max_concurrency"])
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    cls._session = session
+        return cls._session
+    
+    @staticmethod
+    def cache_ttl(vehicle_info: VehicleInfo) -> float:
+        """TTL for a decode result; failures are kept for a shorter time"""
+        if vehicle_info.is_valid:
+            return VIN_CACHE_CONFIG["ttl_seconds"]
+        return VIN_CACHE_CONFIG["negative_ttl_seconds"]
+    
+    @staticmethod
+    def normalize_vin(vin: str) -> str:
+        """Normalize a VIN for lookups and cache keys"""
+        return vin.replace(" ", "").upper()
+    
     @staticmethod
     def validate_vin(vin: str) -> Tuple[bool, str]:
         """
@@ -70,7 +368,7 @@ class VINDecoder:
             return False, "VIN cannot be empty"
         
         # Remove spaces and convert to uppercase
-        vin = vin.replace(" ", "").upper()
+        vin = VINDecoder.normalize_vin(vin)
         
         # Check length
         if len(vin) != 17:
@@ -80,75 +378,293 @@ class VINDecoder:
         if not re.match(r'^[ABCDEFGHJKLMNPRSTUVWXYZ0-9]{17}$', vin):
             return False, "VIN contains invalid characters (I, O, Q not allowed)"
         
+        # The check digit is only mandatory for North American VINs
+        if vin[0] in NORTH_AMERICA_PREFIXES and VINDecoder.compute_check_digit(vin) != vin[8]:
+            return False, "VIN check digit (9th character) does not match - please re-check the VIN"
+        
         return True, ""
     
     @staticmethod
-    def decode_vin(vin: str, timeout: int = 10) -> VehicleInfo:
+    def compute_check_digit(vin: str) -> str:
+        """Compute the expected 9th-position check digit of a normalized VIN"""
+        total = sum(TRANSLITERATION[char] * weight for char, weight in zip(vin, CHECK_DIGIT_WEIGHTS))
+        remainder = total % 11
+        return 'X' if remainder == 10 else str(remainder)
+    
+    @staticmethod
+    def decode_model_year(vin: str) -> Optional[int]:
         """
-        Decode VIN using NHTSA API
+        Read the model year from position 10 of a normalized VIN
+        
+        The code repeats every 30 years. For North American passenger
+        vehicles a letter in position 7 marks the 2010+ cycle; otherwise the
+        most recent cycle that is not in the future is used.
+        """
+        base_year = MODEL_YEAR_CODES.get(vin[9])
+        if base_year is None:
+            return None
+        
+        latest_year = datetime.now().year + 1
+        if vin[0] in NORTH_AMERICA_PREFIXES:
+            year = base_year + 30 if vin[6].isalpha() else base_year
+            if year <= latest_year:
+                return year
+        
+        year = base_year
+        while year + 30 <= latest_year:
+            year += 30
+        return year
+    
+    @staticmethod
+    def predecode_vin(vin: str) -> VehicleInfo:
+        """
+        Decode what can be read from the VIN itself, without any network call
         
         Args:
             vin: Vehicle Identification Number
-            timeout: Request timeout in seconds
             
         Returns:
-            VehicleInfo object with decoded information
+            Partial VehicleInfo (make from the WMI, model year from position 10);
+            is_valid stays False until NHTSA fills in the model
         """
-        # Validate VIN first
         is_valid, error_msg = VINDecoder.validate_vin(vin)
         if not is_valid:
-            return VehicleInfo(error_message=error_msg)
+            return VehicleInfo(error_message=error_msg, vin=VINDecoder.normalize_vin(vin) if vin else None)
+        
+        clean_vin = VINDecoder.normalize_vin(vin)
+        model_year = VINDecoder.decode_model_year(clean_vin)
+        
+        return VehicleInfo(
+            year=str(model_year) if model_year else None,
+            make=WMI_MAKES.get(clean_vin[:3]),
+            vin=clean_vin,
+            source="local"
+        )
+    
+    @staticmethod
+    def parse_decode_response(data: Dict[str, Any]) -> VehicleInfo:
+        """
+        Parse an NHTSA decodevin JSON response
+        
+        Args:
+            data: Decoded JSON body from the decodevin endpoint
+            
+        Returns:
+            VehicleInfo object; is_valid is False for empty or incomplete results
+        """
+        # Check if API returned valid results
+        if 'Results' not in data or not data['Results']:
+            return VehicleInfo(error_message="No vehicle data found for this VIN")
         
-        # Clean VIN
-        clean_vin = vin.replace(" ", "").upper()
+        # Parse results
+        vehicle_info = VehicleInfo(is_valid=True, raw_data=pack_raw_data(data))
+        
+        # Extract relevant fields
+        VINDecoder._apply_fields(
+            vehicle_info,
+            ((result.get('Variable', ''), result.get('Value', '')) for result in data['Results']),
+            VINDecoder.FIELD_MAPPING
+        )
+        
+        return vehicle_info
+    
+    @staticmethod
+    def parse_flat_result(result: Dict[str, Any]) -> VehicleInfo:
+        """
+        Parse one entry of an NHTSA DecodeVINValuesBatch response
+        
+        Args:
+            result: Flat dictionary of values for a single VIN
+            
+        Returns:
+            VehicleInfo object; is_valid is False for incomplete results
+        """
+        vehicle_info = VehicleInfo(is_valid=True, raw_data=pack_raw_data(result))
+        VINDecoder._apply_fields(vehicle_info, result.items(), VINDecoder.FLAT_FIELD_MAPPING)
+        return vehicle_info
+    
+    @staticmethod
+    def _apply_fields(vehicle_info: VehicleInfo, values: Iterable[Tuple[str, Any]], mapping: Dict[str, str]):
+        """Copy mapped NHTSA values onto vehicle_info and flag incomplete decodes"""
+        for variable_name, value in values:
+            # Skip null or empty values
+            if not value or not isinstance(value, str) or value.lower() in ['null', 'not applicable', '']:
+                continue
+            
+            # Map to our VehicleInfo fields
+            if variable_name in mapping:
+                setattr(vehicle_info, mapping[variable_name], value)
+        
+        # Validate that we got essential information
+        if not vehicle_info.year or not vehicle_info.make or not vehicle_info.model:
+            vehicle_info.error_message = "Incomplete vehicle information from VIN"
+            vehicle_info.is_valid = False
+    
+    @staticmethod
+    def decode_vin(vin: str, timeout: int = 10, use_cache: bool = True, enrich: bool = True) -> VehicleInfo:
+        """
+        Decode VIN locally, then enrich it using NHTSA API
+        
+        Args:
+            vin: Vehicle Identification Number
+            timeout: Request timeout in seconds
+            use_cache: Serve and store results through the shared decode cache
+            enrich: Call NHTSA; when False only the offline pre-decode is returned
+            
+        Returns:
+            VehicleInfo object with decoded information. If NHTSA cannot be
+            reached the locally decoded fields are kept alongside the error.
+        """
+        # Validate and pre-decode offline first; malformed VINs never reach the network
+        local_info = VINDecoder.predecode_vin(vin)
+        if local_info.error_message or not enrich:
+            return local_info
+        
+        clean_vin = local_info.vin
+        
+        cache = VINDecoder.get_cache() if use_cache else None
+        if cache is not None:
+            cached = cache.get(clean_vin)
+            if cached is not None:
+                return cached
         
         try:
             # Make API request
             url = f"{VINDecoder.NHTSA_API_BASE}/decodevin/{clean_vin}?format=json"
-            response = requests.get(url, timeout=timeout)
+            response = VINDecoder.get_session().get(url, timeout=timeout)
             response.raise_for_status()
             
-            data = response.json()
+            vehicle_info = VINDecoder.parse_decode_response(response.json())
+            
+        except Exception as e:
+            return replace(local_info, error_message=VINDecoder.describe_request_error(e))
+        
+        VINDecoder.merge_local_fields(vehicle_info, local_info)
+        
+        # Only definitive answers are cached; transport errors above are retried next time
+        if cache is not None:
+            cache.set(clean_vin, vehicle_info, VINDecoder.cache_ttl(vehicle_info))
+        
+        return vehicle_info
+    
+    @staticmethod
+    def decode_vins(vins: Iterable[str], chunk_size: Optional[int] = None, max_workers: Optional[int] = None,
+                    timeout: Optional[int] = None, use_cache: bool = True) -> Iterator[VehicleInfo]:
+        """
+        Decode many VINs through NHTSA's DecodeVINValuesBatch endpoint
+        
+        VINs are validated offline, served from the cache where possible and
+        otherwise grouped into chunks posted on a bounded thread pool over the
+        pooled session. Input is consumed lazily and at most two chunks per
+        worker are in flight, so memory stays bounded for large imports.
+        
+        Args:
+            vins: Iterable of Vehicle Identification Numbers
+            chunk_size: VINs per POST (NHTSA accepts up to 50)
+            max_workers: Concurrent batch requests
+            timeout: Per-request timeout in seconds
+            use_cache: Serve and store results through the shared decode cache
             
-            # Check if API returned valid results
-            if 'Results' not in data or not data['Results']:
-                return VehicleInfo(error_message="No vehicle data found for this VIN")
+        Yields:
+            VehicleInfo per input VIN, with vin set, in completion order
+        """
+        chunk_size = min(chunk_size or VIN_BATCH_CONFIG["chunk_size"], VIN_BATCH_CONFIG["chunk_size"])
+        max_workers = max_workers or VIN_BATCH_CONFIG["max_workers"]
+        timeout = timeout or VIN_BATCH_CONFIG["timeout"]
+        cache = VINDecoder.get_cache() if use_cache else None
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vin-batch") as executor:
+            in_flight: Set[Future] = set()
+            chunk: List[VehicleInfo] = []
             
-            # Parse results
-            vehicle_info = VehicleInfo(is_valid=True, raw_data=data)
+            def drain(block_until: int) -> Iterator[VehicleInfo]:
+                """Yield finished chunks until no more than block_until remain in flight"""
+                while len(in_flight) > block_until:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        in_flight.discard(future)
+                        yield from future.result()
             
-            # Extract relevant fields
-            for result in data['Results']:
-                variable_name = result.get('Variable', '')
-                value = result.get('Value', '')
+            for vin in vins:
+                local_info = VINDecoder.predecode_vin(vin)
+                if local_info.error_message:
+                    yield local_info
+                    continue
                 
-                # Skip null or empty values
-                if not value or value.lower() in ['null', 'not applicable', '']:
+                cached = cache.get(local_info.vin) if cache is not None else None
+                if cached is not None:
+                    cached.vin = local_info.vin
+                    yield cached
                     continue
                 
-                # Map to our VehicleInfo fields
-                if variable_name in VINDecoder.FIELD_MAPPING:
-                    field_name = VINDecoder.FIELD_MAPPING[variable_name]
-                    setattr(vehicle_info, field_name, value)
+                chunk.append(local_info)
+                if len(chunk) >= chunk_size:
+                    in_flight.add(executor.submit(VINDecoder._decode_chunk, chunk, timeout, cache))
+                    chunk = []
+                    yield from drain(max_workers * 2 - 1)
             
-            # Validate that we got essential information
-            if not vehicle_info.year or not vehicle_info.make or not vehicle_info.model:
-                vehicle_info.error_message = "Incomplete vehicle information from VIN"
-                vehicle_info.is_valid = False
+            if chunk:
+                in_flight.add(executor.submit(VINDecoder._decode_chunk, chunk, timeout, cache))
+            yield from drain(0)
+    
+    @staticmethod
+    def _decode_chunk(local_infos: List[VehicleInfo], timeout: int,
+                      cache: Optional[VINCache]) -> List[VehicleInfo]:
+        """POST one chunk to DecodeVINValuesBatch and pair results with their VINs"""
+        try:
+            response = VINDecoder.get_session().post(
+                f"{VINDecoder.NHTSA_API_BASE}/DecodeVINValuesBatch/",
+                data={'format': 'json', 'data': ';'.join(info.vin for info in local_infos)},
+                timeout=timeout
+            )
+            response.raise_for_status()
+            results = response.json().get('Results') or []
+        except Exception as e:
+            error_message = VINDecoder.describe_request_error(e)
+            return [replace(info, error_message=error_message) for info in local_infos]
+        
+        by_vin = {str(result.get('VIN', '')).upper(): result for result in results}
+        decoded = []
+        for position, local_info in enumerate(local_infos):
+            result = by_vin.get(local_info.vin)
+            if result is None and len(results) == len(local_infos):
+                result = results[position]
             
-            return vehicle_info
+            if result is None:
+                vehicle_info = VehicleInfo(error_message="No vehicle data found for this VIN")
+            else:
+                vehicle_info = VINDecoder.parse_flat_result(result)
+            VINDecoder.merge_local_fields(vehicle_info, local_info)
             
-        except requests.exceptions.Timeout:
-            return VehicleInfo(error_message="Request timeout - NHTSA API is slow to respond")
-        except requests.exceptions.ConnectionError:
-            return VehicleInfo(error_message="Connection error - Check internet connection")
-        except requests.exceptions.HTTPError as e:
-            return VehicleInfo(error_message=f"API error: {e}")
-        except requests.exceptions.RequestException as e:
-            return VehicleInfo(error_message=f"Request failed: {e}")
-        except Exception as e:
-            return VehicleInfo(error_message=f"Unexpected error: {e}")
-
+            if cache is not None:
+                cache.set(local_info.vin, vehicle_info, VINDecoder.cache_ttl(vehicle_info))
+            decoded.append(vehicle_info)
+        
+        return decoded
+    
+    @staticmethod
+    def describe_request_error(error: Exception) -> str:
+        """User-facing message for a failed NHTSA request"""
+        if isinstance(error, requests.exceptions.Timeout):
+            return "Request timeout - NHTSA API is slow to respond"
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return "Connection error - Check internet connection"
+        if isinstance(error, requests.exceptions.HTTPError):
+            return f"API error: {error}"
+        if isinstance(error, requests.exceptions.RequestException):
+            return f"Request failed: {error}"
+        return f"Unexpected error: {error}"
+    
+    @staticmethod
+    def merge_local_fields(vehicle_info: VehicleInfo, local_info: VehicleInfo):
+        """Tag an NHTSA result with its VIN and fill gaps from the offline pre-decode"""
+        vehicle_info.vin = local_info.vin
+        vehicle_info.source = "nhtsa"
+        if not vehicle_info.year:
+            vehicle_info.year = local_info.year
+        if not vehicle_info.make:
+            vehicle_info.make = local_info.make
+    
     @staticmethod
     def extract_performance_hints(vehicle_info: VehicleInfo) -> Dict[str, Any]:
         """
@@ -261,7 +777,155 @@ class VINDecoder:
         
         return summary
 
-# Convenience function for easy imports
+class _HostRateLimiter:
+    """Async token bucket limiting request starts per second to one host"""
+    
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+class AsyncVINDecoder:
+    """Non-blocking NHTSA client for async services
+    
+    Requests run on a private thread pool over the shared pooled session, so
+    the event loop never blocks. Concurrent lookups of the same VIN share one
+    upstream request, in-flight requests are capped by a semaphore, request
+    starts are rate limited per host, and 429/5xx responses are retried with
+    jittered exponential backoff. Parsing and caching are the same as
+    VINDecoder.decode_vin.
+    """
+    
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    
+    def __init__(self, max_concurrency: Optional[int] = None, rate_per_second: Optional[float] = None,
+                 max_retries: Optional[int] = None, timeout: Optional[int] = None, use_cache: bool = True):
+        self.max_concurrency = max_concurrency or VIN_ASYNC_CONFIG["max_concurrency"]
+        self.rate_per_second = rate_per_second or VIN_ASYNC_CONFIG["rate_per_second"]
+        self.max_retries = VIN_ASYNC_CONFIG["max_retries"] if max_retries is None else max_retries
+        self.timeout = timeout or VIN_ASYNC_CONFIG["timeout"]
+        self.use_cache = use_cache
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="vin-async")
+        self._inflight: Dict[str, "asyncio.Future[VehicleInfo]"] = {}
+        self._limiters: Dict[str, _HostRateLimiter] = {}
+    
+    def close(self):
+        """Release the worker threads"""
+        self._executor.shutdown(wait=False)
+    
+    async def __aenter__(self) -> "AsyncVINDecoder":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.close()
+    
+    async def decode_vin(self, vin: str) -> VehicleInfo:
+        """Decode a VIN; concurrent calls for the same VIN share one request"""
+        local_info = VINDecoder.predecode_vin(vin)
+        if local_info.error_message:
+            return local_info
+        
+        clean_vin = local_info.vin
+        cache = VINDecoder.get_cache() if self.use_cache else None
+        if cache is not None:
+            cached = await self._run(cache.get, clean_vin)
+            if cached is not None:
+                return cached
+        
+        pending = self._inflight.get(clean_vin)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(local_info, cache))
+            self._inflight[clean_vin] = pending
+            pending.add_done_callback(lambda _, key=clean_vin: self._inflight.pop(key, None))
+        
+        # Shield so one caller being cancelled does not cancel the shared request
+        vehicle_info = await asyncio.shield(pending)
+        return replace(vehicle_info)
+    
+    async def decode_vins(self, vins: Iterable[str]) -> List[VehicleInfo]:
+        """Decode several VINs concurrently, returning results in input order"""
+        return list(await asyncio.gather(*(self.decode_vin(vin) for vin in vins)))
+    
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+    
+    def _limiter_for(self, url: str) -> _HostRateLimiter:
+        host = urlparse(url).netloc
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = _HostRateLimiter(self.rate_per_second, VIN_ASYNC_CONFIG["burst"])
+            self._limiters[host] = limiter
+        return limiter
+    
+    def _backoff_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Exponential backoff with full jitter, honouring a numeric Retry-After header"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), VIN_ASYNC_CONFIG["backoff_max"])
+        ceiling = min(VIN_ASYNC_CONFIG["backoff_max"], VIN_ASYNC_CONFIG["backoff_base"] * (2 ** attempt))
+        return random.uniform(0, ceiling)
+    
+    async def _fetch(self, local_info: VehicleInfo, cache: Optional[VINCache]) -> VehicleInfo:
+        url = f"{VINDecoder.NHTSA_API_BASE}/decodevin/{local_info.vin}?format=json"
+        session = VINDecoder.get_session()
+        limiter = self._limiter_for(url)
+        
+        attempt = 0
+        while True:
+            response = None
+            error: Optional[Exception] = None
+            async with self._semaphore:
+                await limiter.acquire()
+                try:
+                    response = await self._run(lambda: session.get(url, timeout=self.timeout))
+                except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                    error = e
+                except Exception as e:
+                    return replace(local_info, error_message=VINDecoder.describe_request_error(e))
+            
+            retryable = error is not None or response.status_code in self.RETRY_STATUSES
+            if retryable and attempt < self.max_retries:
+                await asyncio.sleep(self._backoff_delay(attempt, response))
+                attempt += 1
+                continue
+            
+            try:
+                if error is not None:
+                    raise error
+                response.raise_for_status()
+                vehicle_info = VINDecoder.parse_decode_response(response.json())
+            except Exception as e:
+                return replace(local_info, error_message=VINDecoder.describe_request_error(e))
+            
+            VINDecoder.merge_local_fields(vehicle_info, local_info)
+            if cache is not None:
+                await self._run(cache.set, local_info.vin, vehicle_info, VINDecoder.cache_ttl(vehicle_info))
+            return vehicle_info
+
+# Convenience functions for easy imports
 def decode_vin(vin: str) -> VehicleInfo:
     """Convenience function to decode a VIN"""
-    return VINDecoder.decode_vin(vin)
\ No newline at end of file
+    return VINDecoder.decode_vin(vin)
+
+def predecode_vin(vin: str) -> VehicleInfo:
+    """Convenience function to decode a VIN offline"""
+    return VINDecoder.predecode_vin(vin)
+
+def decode_vins(vins: Iterable[str]) -> Iterator[VehicleInfo]:
+    """Convenience function to batch-decode VINs, yielding results as they complete"""
+    return VINDecoder.decode_vins(vins)
\ No newline at end of file
@@ -0,0 +1,81 @@
+# utils/vin_tables.py
+"""
+Static VIN reference tables for Forza PI Calculator
+Check digit weights, model year codes and a compact WMI-to-make table
+"""
+
+# Position weights for the check digit calculation (position 9 has weight 0)
+CHECK_DIGIT_WEIGHTS = (8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Letter transliteration values for the check digit calculation
+TRANSLITERATION = {
+    'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8,
+    'J': 1, 'K': 2, 'L': 3, 'M': 4, 'N': 5, 'P': 7, 'R': 9,
+    'S': 2, 'T': 3, 'U': 4, 'V': 5, 'W': 6, 'X': 7, 'Y': 8, 'Z': 9,
+}
+TRANSLITERATION.update({str(digit): digit for digit in range(10)})
+
+# Position 10 model year codes, first year of the 30-year cycle
+MODEL_YEAR_CODES = {
+    'A': 1980, 'B': 1981, 'C': 1982, 'D': 1983, 'E': 1984, 'F': 1985, 'G': 1986,
+    'H': 1987, 'J': 1988, 'K': 1989, 'L': 1990, 'M': 1991, 'N': 1992, 'P': 1993,
+    'R': 1994, 'S': 1995, 'T': 1996, 'V': 1997, 'W': 1998, 'X': 1999, 'Y': 2000,
+    '1': 2001, '2': 2002, '3': 2003, '4': 2004, '5': 2005, '6': 2006, '7': 2007,
+    '8': 2008, '9': 2009,
+}
+
+# First VIN characters assigned to North America, where the check digit is mandatory
+NORTH_AMERICA_PREFIXES = frozenset("12345")
+
+# World Manufacturer Identifier (positions 1-3) to make
+WMI_MAKES = {
+    # United States / Canada / Mexico
+    '1C3': 'Chrysler', '1C6': 'Ram', '1B3': 'Dodge', '1D7': 'Dodge',
+    '2C3': 'Chrysler', '2B3': 'Dodge', '2D3': 'Dodge', '3C6': 'Ram', '3D7': 'Ram',
+    '1FA': 'Ford', '1FB': 'Ford', '1FM': 'Ford', '1FT': 'Ford', '1ZV': 'Ford',
+    '2FA': 'Ford', '2FM': 'Ford', '3FA': 'Ford', '1LN': 'Lincoln', '5LM': 'Lincoln',
+    '1G1': 'Chevrolet', '1GC': 'Chevrolet', '1GN': 'Chevrolet', '2G1': 'Chevrolet',
+    '3G1': 'Chevrolet', '1G2': 'Pontiac', '1G4': 'Buick', '1G6': 'Cadillac',
+    '1GY': 'Cadillac', '1GT': 'GMC', '1G8': 'Saturn',
+    '1HG': 'Honda', '2HG': 'Honda', '2HK': 'Honda', '5FN': 'Honda', '5J6': 'Honda',
+    '19U': 'Acura', '19X': 'Honda',
+    '1J4': 'Jeep', '1C4': 'Jeep',
+    '1N4': 'Nissan', '1N6': 'Nissan', '5N1': 'Nissan', '3N1': 'Nissan',
+    '4T1': 'Toyota', '4T3': 'Toyota', '5TD': 'Toyota', '5TF': 'Toyota', '2T1': 'Toyota',
+    '2T2': 'Lexus', '58A': 'Lexus',
+    '4S3': 'Subaru', '4S4': 'Subaru',
+    '5NP': 'Hyundai', '5XY': 'Kia',
+    '5UX': 'BMW', '5YM': 'BMW', '4US': 'BMW',
+    '4JG': 'Mercedes-Benz', '55S': 'Mercedes-Benz',
+    '1VW': 'Volkswagen', '3VW': 'Volkswagen',
+    '5YJ': 'Tesla', '7SA': 'Tesla', '7G2': 'Tesla',
+    '1YV': 'Mazda', '3MZ': 'Mazda',
+    # Japan / Korea
+    'JHM': 'Honda', 'JHL': 'Honda', 'JH4': 'Acura',
+    'JN1': 'Nissan', 'JN8': 'Nissan', 'JNK': 'Infiniti',
+    'JT2': 'Toyota', 'JTD': 'Toyota', 'JTE': 'Toyota', 'JTM': 'Toyota', 'JTN': 'Toyota',
+    'JTH': 'Lexus', 'JTJ': 'Lexus', 'JTK': 'Scion',
+    'JF1': 'Subaru', 'JF2': 'Subaru',
+    'JM1': 'Mazda', 'JM3': 'Mazda',
+    'JA3': 'Mitsubishi', 'JA4': 'Mitsubishi',
+    'JS1': 'Suzuki', 'JS2': 'Suzuki',
+    'KMH': 'Hyundai', 'KM8': 'Hyundai', 'KMT': 'Genesis',
+    'KNA': 'Kia', 'KND': 'Kia',
+    # Europe
+    'WBA': 'BMW', 'WBS': 'BMW', 'WBY': 'BMW', 'WMW': 'MINI',
+    'WDB': 'Mercedes-Benz', 'WDC': 'Mercedes-Benz', 'WDD': 'Mercedes-Benz',
+    'W1K': 'Mercedes-Benz', 'W1N': 'Mercedes-Benz', 'WME': 'Smart',
+    'WAU': 'Audi', 'WA1': 'Audi', 'WUA': 'Audi', 'TRU': 'Audi',
+    'WVW': 'Volkswagen', 'WVG': 'Volkswagen', 'WV1': 'Volkswagen', 'WV2': 'Volkswagen',
+    'WP0': 'Porsche', 'WP1': 'Porsche',
+    'W0L': 'Opel', 'VSS': 'SEAT', 'TMB': 'Skoda',
+    'VF1': 'Renault', 'VF3': 'Peugeot', 'VF7': 'Citroen', 'VF9': 'Bugatti',
+    'ZFF': 'Ferrari', 'ZHW': 'Lamborghini', 'ZAM': 'Maserati', 'ZAR': 'Alfa Romeo',
+    'ZFA': 'Fiat', 'ZA9': 'Pagani',
+    'SAJ': 'Jaguar', 'SAL': 'Land Rover', 'SCA': 'Rolls-Royce', 'SCB': 'Bentley',
+    'SCC': 'Lotus', 'SCF': 'Aston Martin', 'SBM': 'McLaren', 'SHH': 'Honda', 'SJN': 'Nissan',
+    'YV1': 'Volvo', 'YV4': 'Volvo', 'YS3': 'Saab', 'YT9': 'Koenigsegg',
+    'NM0': 'Ford', 'WF0': 'Ford',
+    # China
+    'LRW': 'Tesla', 'LPS': 'Polestar',
+}